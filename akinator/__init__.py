@@ -16,6 +16,101 @@ __copyright__ = "Copyright 2025 Omkaar"
 __version__ = "2.0.1"
 
 
-from .client import *
+from importlib import import_module as _import_module
+
 from .exceptions import *
-from .async_client import *
+from .constants import *
+from .state import *
+from .events import *
+from .metrics import *
+
+# The clients, transports and everything depending on them import cloudscraper, requests, aiohttp or numpy, so they
+# are only loaded when first accessed (PEP 562), keeping `import akinator` cheap for code which only needs the
+# constants, exceptions, game states or events.
+_LAZY = {
+    "Client": "client",
+    "Akinator": "client",
+    "AsyncClient": "async_client",
+    "AsyncAkinator": "async_client",
+    "AsyncCloudScraper": "transport",
+    "AsyncHTTPSession": "transport",
+    "AsyncTransport": "transport",
+    "HTTPResponse": "transport",
+    "Response": "transport",
+    "StreamingResponse": "transport",
+    "BoundedExecutor": "executor",
+    "get_default_executor": "executor",
+    "Transport": "transport",
+    "AsyncPooledSession": "pool",
+    "PooledSession": "pool",
+    "SessionPool": "pool",
+    "get_default_pool": "pool",
+    "ClearanceCache": "clearance",
+    "is_challenge": "clearance",
+    "AsyncGamePool": "game_pool",
+    "GamePool": "game_pool",
+    "HostRateLimiter": "ratelimit",
+    "TokenBucket": "ratelimit",
+    "GameResult": "runner",
+    "GameRunner": "runner",
+    "GameSettings": "runner",
+    "CircuitBreaker": "retry",
+    "RETRY_EXCEPTIONS": "retry",
+    "RETRY_STATUSES": "retry",
+    "RetryPolicy": "retry",
+    "send": "retry",
+    "send_async": "retry",
+    "AsyncRecordingTransport": "recording",
+    "AsyncReplayTransport": "recording",
+    "CASSETTE_VERSION": "recording",
+    "Cassette": "recording",
+    "Interaction": "recording",
+    "RECORDED_HEADERS": "recording",
+    "RecordingTransport": "recording",
+    "ReplayTransport": "recording",
+    "CachedStep": "cache",
+    "QuestionCache": "cache",
+    "Speculation": "speculation",
+    "UndoHistory": "undo",
+    "AssetCache": "assets",
+    "AsyncAssetCache": "assets",
+    "SHARD_METHODS": "sharding",
+    "ShardedClient": "sharding",
+    "ShardedRunner": "sharding",
+    "AsyncEngineTransport": "engine",
+    "EngineSettings": "engine",
+    "ClientSettings": "settings",
+    "EngineTransport": "engine",
+    "KNOWLEDGE_MAGIC": "engine",
+    "KNOWLEDGE_VERSION": "engine",
+    "KnowledgeBase": "engine",
+    "LocalEngine": "engine",
+}
+
+__all__ = sorted([
+    # exceptions
+    "AkinatorException", "CantGoBackAnyFurther", "CircuitOpenError", "ExecutorSaturatedError", "InvalidChoiceError",
+    "InvalidLanguageError", "InvalidThemeError", "PoolTimeoutError", "ReplayError", "SessionTimeoutError", "TransientError",
+    # constants
+    "AKITUDES", "AKITUDE_URL", "ANSWER_IDS", "ANSWER_MAP", "LANG_MAP", "THEME_IDS", "THEME_MAP",
+    # state
+    "GameState", "GameStateView", "STATE_VERSION", "Step",
+    # events
+    "Correction", "Defeat", "Event", "Proposition", "Question", "Timeout", "Win", "event_from_state",
+    # metrics
+    "Histogram", "HistogramMetrics", "MetricsSink", "NULL_METRICS", "get_metrics",
+    *_LAZY,
+])
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,372 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, Iterable, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import sha1
+from threading import Lock
+from urllib.parse import urlsplit
+import asyncio
+import os
+
+from cloudscraper import create_scraper
+
+from .constants import AKITUDE_URL, AKITUDES, LANG_MAP
+from .transport import AsyncCloudScraper, AsyncTransport, Transport
+
+
+class _ImageStore:
+    """
+    The memory and directory tiers shared by `AssetCache` and `AsyncAssetCache`.
+    """
+
+    def __init__(self, max_bytes: int, path: Optional[str], timeout: Optional[float], max_workers: int):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = Lock()
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def _check(session):
+        if not callable(getattr(session, "get", None)):
+            raise TypeError(f"{type(session).__name__} does not provide `get`, which is required to download images.")
+        return session
+
+    def _lookup(self, url):
+        content = self._entries.get(url)
+        if content is not None:
+            self._entries.move_to_end(url)
+            self.hits += 1
+        return content
+
+    def _store(self, url, content):
+        with self._lock:
+            if len(content) > self.max_bytes or url in self._entries:
+                return
+            self._entries[url] = content
+            self.size += len(content)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def _file(self, url):
+        extension = os.path.splitext(urlsplit(url).path)[1][:8]
+        return os.path.join(self.path, sha1(url.encode()).hexdigest() + extension)
+
+    def _read(self, url):
+        if not self.path:
+            return None
+        try:
+            with open(self._file(url), "rb") as file:
+                content = file.read()
+        except OSError:
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        return content
+
+    def _write(self, url, content):
+        if not self.path:
+            return
+        path = self._file(url)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(content)
+        os.replace(temporary, path)
+
+    def _options(self):
+        return {"timeout": self.timeout} if self.timeout is not None else {}
+
+    @staticmethod
+    def _akitude_url(akitude, language):
+        return AKITUDE_URL.format(language=LANG_MAP.get(language.lower(), language.lower()), akitude=akitude)
+
+    @staticmethod
+    def _akitude_urls(languages, akitudes):
+        languages = [LANG_MAP.get(language.lower(), language.lower()) for language in languages]
+        return [AKITUDE_URL.format(language=language, akitude=akitude) for language in languages for akitude in akitudes]
+
+    def stats(self) -> dict:
+        """
+        Returns the number of images and bytes kept in memory, the counters, and the share of requests served from memory.
+        """
+        with self._lock:
+            requests = self.hits + self.misses + self.deduplicated
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "deduplicated": self.deduplicated,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / requests if requests else 0.0,
+            }
+
+    def clear(self):
+        """
+        Empties the memory tier, keeping the directory.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __contains__(self, url):
+        return url in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class AssetCache(_ImageStore):
+    """
+    A cache of the images shown during games: akitudes, character photos and flags, fetched through a client's transport.
+
+    Images are kept in memory in an LRU bounded by their total size, and optionally in a directory, which is not
+    bounded, so that they survive restarts. Concurrent requests for the same URL are merged into a single download,
+    and failed downloads are not cached. The cache is thread-safe and can be shared by any number of clients.
+
+    :param session: The transport to download with, e.g. `client.session`. It must provide `get`, as `CloudScraper`, `PooledSession` and the fake transports do. Defaults to a new `CloudScraper` session.
+    :type session: Optional[Transport]
+    :param max_bytes: The maximum total size of the images kept in memory. Defaults to 16 MiB.
+    :type max_bytes: int
+    :param path: An optional directory where images are also stored.
+    :type path: Optional[str]
+    :param timeout: An optional timeout, in seconds, applied to every download.
+    :type timeout: Optional[float]
+    :param max_workers: The maximum number of images downloaded at once by `prefetch`. Defaults to 8.
+    :type max_workers: int
+
+    :ivar hits: The number of images served from memory.
+    :ivar disk_hits: The number of images read from the directory.
+    :ivar misses: The number of images downloaded or read from the directory.
+    :ivar deduplicated: The number of requests which waited for a download already in progress.
+    :ivar evictions: The number of images evicted from memory.
+    """
+
+    def __init__(self, session: Optional[Transport] = None, *, max_bytes: int = 16 * 1024 * 1024, path: Optional[str] = None, timeout: Optional[float] = None, max_workers: int = 8):
+        self.session = self._check(session if session is not None else create_scraper())
+        self._owns_session = session is None
+        super().__init__(max_bytes, path, timeout, max_workers)
+
+    def _fetch(self, url):
+        content = self._read(url)
+        if content is None:
+            response = self.session.get(url, **self._options())
+            response.raise_for_status()
+            content = response.content
+            self._write(url, content)
+        self._store(url, content)
+        return content
+
+    def get(self, url: str) -> bytes:
+        """
+        Returns the image at a URL, downloading it unless it is cached.
+
+        :param url: The URL of the image, e.g. `client.akitude_url` or `client.photo`.
+        :type url: str
+        """
+        with self._lock:
+            content = self._lookup(url)
+            if content is not None:
+                return content
+            future = self._pending.get(url)
+            if future is not None:
+                self.deduplicated += 1
+                owner = False
+            else:
+                self.misses += 1
+                future = self._pending[url] = Future()
+                owner = True
+        if not owner:
+            return future.result()
+        try:
+            future.set_result(self._fetch(url))
+        except Exception as e:
+            error = RuntimeError(f"Failed to fetch {url}.")
+            error.__cause__ = e
+            future.set_exception(error)
+        finally:
+            with self._lock:
+                del self._pending[url]
+        return future.result()
+
+    def akitude(self, akitude: str, language: str = "en") -> bytes:
+        """
+        Returns an akitude image, e.g. "defi.png", for a language.
+
+        :param akitude: The file name of the akitude, e.g. `client.akitude`.
+        :type akitude: str
+        :param language: The language of the game. Defaults to "en".
+        :type language: str
+        """
+        return self.get(self._akitude_url(akitude, language))
+
+    def prefetch(self, languages: Iterable[str] = ("en",), akitudes: Iterable[str] = AKITUDES) -> int:
+        """
+        Downloads every akitude for each language in parallel, e.g. at startup. Failed downloads are skipped, and retried on their next `get`.
+
+        :param languages: The languages to prefetch. Defaults to English only.
+        :type languages: Iterable[str]
+        :param akitudes: The akitudes to prefetch. Defaults to all of them.
+        :type akitudes: Iterable[str]
+        :return: The number of akitudes cached.
+        :rtype: int
+        """
+        urls = self._akitude_urls(languages, list(akitudes))
+
+        def fetch(url):
+            try:
+                self.get(url)
+                return True
+            except RuntimeError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="akinator-assets") as executor:
+            return sum(executor.map(fetch, urls))
+
+    def close(self):
+        """
+        Empties the memory tier, and closes the transport if it was created by the cache.
+        """
+        self.clear()
+        if self._owns_session:
+            self.session.close()
+
+
+class AsyncAssetCache(_ImageStore):
+    """
+    An `AssetCache` downloading through an asynchronous transport, e.g. `client.session` of an `AsyncClient`.
+
+    Concurrent requests for the same URL await a single shared task, which is not cancelled with the requests awaiting
+    it. The directory is read and written in a thread.
+
+    :param session: The transport to download with. It must provide `get`, as `AsyncCloudScraper`, `AsyncHTTPSession`, `AsyncPooledSession` and the fake transports do. Defaults to a new `AsyncCloudScraper`.
+    :type session: Optional[AsyncTransport]
+    :param max_bytes: The maximum total size of the images kept in memory. Defaults to 16 MiB.
+    :type max_bytes: int
+    :param path: An optional directory where images are also stored.
+    :type path: Optional[str]
+    :param timeout: An optional timeout, in seconds, applied to every download.
+    :type timeout: Optional[float]
+    :param max_workers: The maximum number of images downloaded at once by `prefetch`. Defaults to 8.
+    :type max_workers: int
+    """
+
+    def __init__(self, session: Optional[AsyncTransport] = None, *, max_bytes: int = 16 * 1024 * 1024, path: Optional[str] = None, timeout: Optional[float] = None, max_workers: int = 8):
+        self.session = self._check(session if session is not None else AsyncCloudScraper())
+        self._owns_session = session is None
+        super().__init__(max_bytes, path, timeout, max_workers)
+
+    async def _fetch_async(self, url):
+        try:
+            content = await asyncio.to_thread(self._read, url) if self.path else None
+            if content is None:
+                response = await self.session.get(url, **self._options())
+                response.raise_for_status()
+                content = response.content
+                if self.path:
+                    await asyncio.to_thread(self._write, url, content)
+            self._store(url, content)
+            return content
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch {url}.") from e
+        finally:
+            with self._lock:
+                del self._pending[url]
+
+    async def get(self, url: str) -> bytes:
+        """
+        Returns the image at a URL, downloading it unless it is cached.
+
+        :param url: The URL of the image, e.g. `client.akitude_url` or `client.photo`.
+        :type url: str
+        """
+        with self._lock:
+            content = self._lookup(url)
+            if content is not None:
+                return content
+            task = self._pending.get(url)
+            if task is not None:
+                self.deduplicated += 1
+            else:
+                self.misses += 1
+                task = self._pending[url] = asyncio.ensure_future(self._fetch_async(url))
+                task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return await asyncio.shield(task)
+
+    async def akitude(self, akitude: str, language: str = "en") -> bytes:
+        """
+        Returns an akitude image, e.g. "defi.png", for a language.
+
+        :param akitude: The file name of the akitude, e.g. `client.akitude`.
+        :type akitude: str
+        :param language: The language of the game. Defaults to "en".
+        :type language: str
+        """
+        return await self.get(self._akitude_url(akitude, language))
+
+    async def prefetch(self, languages: Iterable[str] = ("en",), akitudes: Iterable[str] = AKITUDES) -> int:
+        """
+        Downloads every akitude for each language concurrently, e.g. at startup. Failed downloads are skipped, and retried on their next `get`.
+
+        :param languages: The languages to prefetch. Defaults to English only.
+        :type languages: Iterable[str]
+        :param akitudes: The akitudes to prefetch. Defaults to all of them.
+        :type akitudes: Iterable[str]
+        :return: The number of akitudes cached.
+        :rtype: int
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(url):
+            async with semaphore:
+                try:
+                    await self.get(url)
+                    return True
+                except RuntimeError:
+                    return False
+
+        return sum(await asyncio.gather(*(fetch(url) for url in self._akitude_urls(languages, list(akitudes)))))
+
+    async def close(self):
+        """
+        Empties the memory tier, and closes the transport if it was created by the cache.
+        """
+        self.clear()
+        if self._owns_session:
+            await self.session.close()
@@ -22,90 +22,51 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Literal, Optional
-from re import search
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, List, Literal, Optional, Union
+from collections import deque
 from html import unescape
-from asyncio import to_thread
-from cloudscraper import CloudScraper, create_scraper
-
-from .exceptions import CantGoBackAnyFurther, InvalidLanguageError, InvalidThemeError, InvalidChoiceError
-
-
-LANG_MAP = {
-    "english": "en",
-    "arabic": "ar",
-    "chinese": "cn",
-    "german": "de",
-    "spanish": "es",
-    "french": "fr",
-    "hebrew": "il",
-    "italian": "it",
-    "japanese": "jp",
-    "korean": "kr",
-    "dutch": "nl",
-    "polish": "pl",
-    "portuguese": "pt",
-    "russian": "ru",
-    "turkish": "tr",
-    "indonesian": "id",
-}
-
-THEME_IDS = {"c": 1, "a": 14, "o": 2}
-
-# c - characters
-# a - animals
-# o - objects
-
-THEME_MAP = {
-    "en": ["c", "a", "o"],
-    "ar": ["c"],
-    "cn": ["c"],
-    "de": ["c", "a"],
-    "es": ["c", "a"],
-    "fr": ["c", "a", "o"],
-    "il": ["c"],
-    "it": ["c", "a"],
-    "jp": ["c", "a"],
-    "kr": ["c"],
-    "nl": ["c"],
-    "pl": ["c"],
-    "pt": ["c"],
-    "ru": ["c"],
-    "tr": ["c"],
-    "id": ["c"],
-}
-
-ANSWER_IDS = {
-    0: ["yes", "y", "0"],
-    1: ["no", "n", "1"],
-    2: ["i", "idk", "i dont know", "i don't know", "2"],
-    3: ["p", "probably", "3"],
-    4: ["pn", "probably not", "4"],
-}
-
-ANSWER_MAP = {item: key for key, values in ANSWER_IDS.items() for item in values}
-
-class AsyncCloudScraper:
-    """
-    An asynchronous wrapper around `CloudScraper` to handle HTTP requests.
-    """
-    def __init__(self, **kwargs):
-        self.scraper = create_scraper(**kwargs)
-
-    async def post(self, url, data=None, json=None, **kwargs):
-        """
-        An asynchronous method to perform a POST request using the `cloudscraper` library.
-        """
-        return await to_thread(self.scraper.post, url, data=data, json=json, **kwargs)
-
-class AsyncClient:
+from time import perf_counter
+from asyncio import ensure_future, to_thread
+from inspect import isawaitable
+
+from .exceptions import CantGoBackAnyFurther, InvalidLanguageError, InvalidThemeError, InvalidChoiceError, CircuitOpenError, SessionTimeoutError, TransientError
+from .transport import AsyncCloudScraper, AsyncTransport
+from .clearance import ClearanceCache
+from .parsing import START_PAGE, WIN_PAGE
+from .state import GameState, GameStateView, Step
+from .retry import send_async
+from .metrics import get_metrics
+from .events import Correction, Defeat, Event, Timeout, Win, event_from_state
+from .cache import CachedStep
+from .settings import ClientSettings
+from .constants import LANG_MAP, THEME_IDS, THEME_MAP, ANSWER_IDS, ANSWER_MAP, AKITUDE_URL # pylint: disable=unused-import
+
+
+async def _iterate(items):
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+class AsyncClient(GameStateView):
 
     """
     A class representing an asynchronous client for the Akinator game.
 
-    :param session: An optional `CloudScraper` object to use for making HTTP requests. If not provided, a new session will be created.
-    :type session: Optional[CloudScraper]
+    :param session: An optional `AsyncTransport` to use for making HTTP requests, such as `AsyncCloudScraper` or the non-blocking `AsyncHTTPSession`. If not provided, a new `AsyncCloudScraper` will be created.
+    :type session: Optional[AsyncTransport]
+    :param timeout: An optional timeout, in seconds, applied to every request.
+    :type timeout: Optional[float]
+    :param clearance_cache: An optional `ClearanceCache` used to seed the default session with cached Cloudflare clearance. Ignored if `session` is provided.
+    :type clearance_cache: Optional[ClearanceCache]
+    :param state: An optional `GameState` to resume, e.g. a parked game. If not provided, a new, empty state is used.
+    :type state: Optional[GameState]
+    :param settings: The optional features of the client, such as retries, metrics, a question cache or local undo. Defaults to none.
+    :type settings: Optional[ClientSettings]
     
+    :ivar state: The `GameState` holding every per-game attribute below, which are exposed as attributes of the client.
     :ivar flag_photo: The URL of the flag photo associated with the current game session.
     :ivar photo: The URL of the character photo associated with the current game session.
     :ivar pseudo: The pseudo name of the player in the current game session.
@@ -133,47 +94,129 @@ class AsyncClient:
     :ivar akitude_url: The URL of the current akitude image associated with the game session.
     """
 
-    def __init__(self, session: Optional[CloudScraper] = None):
-        self.session = session if session else AsyncCloudScraper()
-
-        self.flag_photo = None
-        self.photo = None
-        self.pseudo = None
-        self.theme = None
-        self.session_id = None
-        self.signature = None
-        self.identifiant = None
-        self.child_mode = False
-        self.language = None
-        self.theme = None
-
-        self.question = None
-        self.progression = None
-        self.step = None
-        self.akitude = None
-        self.step_last_proposition = ""
-        self.finished = False
-
+    def __init__(self, session: Optional[AsyncTransport] = None, *, timeout: Optional[float] = None, clearance_cache: Optional[ClearanceCache] = None, state: Optional[GameState] = None, settings: Optional[ClientSettings] = None):
+        if session is None:
+            session = AsyncCloudScraper(clearance_cache.create_scraper()) if clearance_cache else AsyncCloudScraper()
+        self.session = session
+        self.timeout = timeout
+        self.state = state if state is not None else GameState()
+        settings = settings if settings is not None else ClientSettings()
+        self.retry = settings.retry
+        self.rate_limiter = settings.rate_limiter
+        self.circuit_breaker = settings.circuit_breaker
+        self.metrics = get_metrics(settings.metrics)
+        self.question_cache = settings.question_cache
+        self.speculation = settings.speculation
+        self.undo = settings.undo
+        self.__warmup = None
+        self.__reconciling = None
+        self.__unconfirmed = deque()
+
+    async def __post(self, url, data, **kwargs):
+        warmup, self.__warmup = self.__warmup, None
+        if warmup is not None:
+            warmup.use()
+        return await self.__request(url, data, **kwargs)
+
+    async def __request(self, url, data, **kwargs):
+        if not self.metrics.enabled:
+            return await self.__send(url, data, **kwargs)
+        started = perf_counter()
+        try:
+            return await self.__send(url, data, **kwargs)
+        finally:
+            self.metrics.timing("request", perf_counter() - started, endpoint=url.rsplit("/", 1)[-1], language=self.language)
+
+    async def __send(self, url, data, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        if self.retry is None and self.rate_limiter is None and self.circuit_breaker is None:
+            return await self.session.post(url, data=data, **kwargs)
+        return await send_async(lambda: self.session.post(url, data=data, **kwargs), url, retry=self.retry, rate_limiter=self.rate_limiter, circuit_breaker=self.circuit_breaker)
+
+    def __track(self, answers: str):
+        self.answers = answers
+        if self.question_cache is not None:
+            self.question_cache.record(self.state)
+
+    def __prewarm(self):
+        self.__discard()
+        if self.speculation is not None and not self.finished and hasattr(self.session, "get"):
+            self.__warmup = self.speculation.warm_async(self.session.get, self.akitude_url)
+
+    def __discard(self):
+        if self.__warmup is not None:
+            self.__warmup.discard()
+            self.__warmup = None
+
+    async def __settle(self, strict: bool = True):
+        if self.__reconciling is None:
+            return
+        reconciling, self.__reconciling = self.__reconciling, None
+        try:
+            await reconciling
+        except (TransientError, CircuitOpenError):
+            self.__roll_forward()
+            if strict:
+                raise
+        except Exception as e:
+            self.__roll_forward()
+            if strict:
+                raise RuntimeError("Failed to go back to the previous question.") from e
+
+    def __roll_forward(self):
+        # The server did not go back from the first unconfirmed step, so neither did the game.
+        state = self.__unconfirmed[0]
+        self.__unconfirmed.clear()
+        self.state = state
+        self.__track(state.answers)
+        self.__prewarm()
+
+    def __restore(self, snapshot, data):
+        self.__discard()
+        self.__unconfirmed.append(self.state.copy())
         self.win = False
-        self.id_proposition = None
-        self.name_proposition = None
-        self.description_proposition = None
-        self.proposition = ""
-        self.completion = None
+        self.question = snapshot.question
+        self.step = snapshot.step
+        self.progression = snapshot.progression
+        self.akitude = snapshot.akitude
+        self.__track(snapshot.answers)
+        self.__reconciling = ensure_future(self.__reconcile(self.__reconciling, data, snapshot))
+        self.__reconciling.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self.__prewarm()
+
+    async def __reconcile(self, previous, data, expected):
+        if previous is not None:
+            await previous
+        response = await self.__request(f"https://{self.language}.akinator.com/cancel_answer", data)
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("completion") == "KO - TIMEOUT":
+            raise SessionTimeoutError()
+        self.__unconfirmed.popleft()
+        if "step" not in payload or (int(payload["step"]), payload["question"]) == (expected.step, expected.question):
+            return
+        event = Correction(int(payload["step"]), payload["question"], float(payload["progression"]), payload["akitude"], expected.step, expected.question)
+        if (self.step, self.question) == (expected.step, expected.question):
+            self.step, self.question, self.progression, self.akitude = event[:4]
+        self.undo.correct(event)
 
     async def __handler(self, response):
         response.raise_for_status()
+        started = perf_counter() if self.metrics.enabled else 0.0
         try:
             data = response.json()
         except Exception as e:
             if "A technical problem has ocurred." in response.text:
                 raise RuntimeError("A technical problem has occurred. Please try again later.") from e
             raise RuntimeError("Failed to parse the response as JSON.") from e
+        if self.metrics.enabled:
+            self.metrics.timing("parse", perf_counter() - started, stage="json", language=self.language)
 
         if "completion" not in data:
             data["completion"] = self.completion
         if data["completion"] == "KO - TIMEOUT":
-            raise RuntimeError("The session has timed out. Please start a new game.")
+            raise SessionTimeoutError()
         if data["completion"] == "SOUNDLIKE":
             self.finished = True
             self.win = True
@@ -195,7 +238,19 @@ class AsyncClient:
             self.question = data["question"]
         self.completion = data["completion"]
 
-    async def start_game(self, *, language: str = "en", child_mode: bool = False, theme: Literal["c", "a", "o"] = "c"):
+    async def __extract_start_page(self, response, stream):
+        started = perf_counter() if self.metrics.enabled else 0.0
+        if not stream:
+            fields = START_PAGE.extract(response.text)
+        elif hasattr(response, "aiter_content"):
+            fields = await START_PAGE.extract_async_response(response)
+        else:
+            fields = await to_thread(START_PAGE.extract_response, response)
+        if self.metrics.enabled:
+            self.metrics.timing("parse", perf_counter() - started, stage="start_page", language=self.language)
+        return fields
+
+    async def start_game(self, *, language: str = "en", child_mode: bool = False, theme: Literal["c", "a", "o"] = "c", stream: bool = False):
         """
         Starts a new game session with the specified language, child mode, and theme.
 
@@ -205,6 +260,8 @@ class AsyncClient:
         :type child_mode: bool
         :param theme: The theme to use for the game. Can be "c" (characters), "a" (animals), or "o" (objects). Defaults to "c".
         :type theme: Literal["c", "a", "o"]
+        :param stream: Whether to read the page incrementally and stop downloading it as soon as the session information and the first question are found. Defaults to False.
+        :type stream: bool
         """
         if language not in LANG_MAP and language not in LANG_MAP.values():
             raise InvalidLanguageError(f"Unsupported language: {language}. Supported languages: {', '.join(LANG_MAP.keys())}")
@@ -215,38 +272,42 @@ class AsyncClient:
         if theme not in THEME_MAP[LANG_MAP.get(language.lower(), language.lower())]:
             raise InvalidThemeError(f"Theme '{theme}' is not available for language '{language}'.")
 
+        await self.__settle(strict=False)
+
         try:
             self.theme = theme
             self.language = LANG_MAP.get(language.lower(), language.lower())
             self.child_mode = child_mode
 
-            response = await self.session.post(f"https://{self.language}.akinator.com/game", data={"sid": THEME_IDS[theme], "cm": str(child_mode).lower()})
+            response = await self.__post(f"https://{self.language}.akinator.com/game", {"sid": THEME_IDS[theme], "cm": str(child_mode).lower()}, stream=stream)
             response.raise_for_status()
-            text = response.text
+            fields = await self.__extract_start_page(response, stream)
 
-            self.session_id = search(r"#session'\).val\('(.+?)'\)", text).group(1)
-            self.signature = search(r"#signature'\).val\('(.+?)'\)", text).group(1)
-            self.identifiant = search(r"#identifiant'\).val\('(.+?)'\)", text).group(1)
+            self.session_id = fields["session_id"]
+            self.signature = fields["signature"]
+            self.identifiant = fields["identifiant"]
 
             if not all([self.session_id, self.signature, self.identifiant]):
                 raise ValueError("Failed to extract session information from the response.")
 
-            question = search(r'<div class="bubble-body"><p class="question-text" id="question-label">(.+)</p></div>', text)
-
-            if not question:
+            if not fields["question"]:
                 raise ValueError("Failed to extract the initial question from the response.")
 
-            self.question = unescape(question.group(1))
-
-            proposition = search(r'<div class="sub-bubble-propose"><p id="p-sub-bubble">([\w\s]+)</p></div>', text)
+            self.question = unescape(fields["question"])
 
-            if not proposition:
+            if not fields["proposition"]:
                 raise ValueError("Failed to extract the proposition from the response.")
 
-            self.proposition = unescape(proposition.group(1))
+            self.proposition = unescape(fields["proposition"])
             self.progression = 0
             self.step = 0
             self.akitude = "defi.png"
+            if self.undo is not None:
+                self.undo.clear()
+            self.__track("")
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to start the game.") from e
 
@@ -270,6 +331,9 @@ class AsyncClient:
                 return await self.exclude()
             raise InvalidChoiceError("Invalid answer after Akinator has proposed a win. Only 'yes' or 'no' are valid answers at this point.")
 
+        await self.__settle()
+        previous = self.state.copy() if self.undo is not None else None
+
         url = f"https://{self.language}.akinator.com/answer"
         data = {
             "step": self.step,
@@ -283,11 +347,127 @@ class AsyncClient:
         }
 
         try:
-            response = await self.session.post(url, data=data)
+            response = await self.__post(url, data)
             await self.__handler(response)
+            if previous is not None:
+                self.undo.push(previous)
+            self.__track(self.answers + str(answer_id))
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to submit the answer.") from e
 
+    async def answer_stream(self, answers: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[Step]:
+        """
+        Submits a sequence of answers, one step after another, yielding each step as soon as its response arrives, and
+        stopping early once Akinator proposes a character or the game ends.
+
+        The request payload is built once for the whole sequence. Each request still waits for the previous response, as
+        it carries the step and progression returned by it.
+
+        :param answers: The answers to submit, in order, which can be produced asynchronously. Each can be "yes", "no", "i don't know", "probably", or "probably not".
+        :type answers: Union[Iterable[str], AsyncIterable[str]]
+        """
+        await self.__settle()
+        url = f"https://{self.language}.akinator.com/answer"
+        data = {
+            "sid": THEME_IDS[self.theme],
+            "cm": str(self.child_mode).lower(),
+            "session": self.session_id,
+            "signature": self.signature
+        }
+
+        async for answer in _iterate(answers):
+            if self.win or self.finished:
+                break
+            if not answer.lower() in ANSWER_MAP:
+                raise InvalidChoiceError(f"Invalid answer: {answer}. Valid answers are: {', '.join(ANSWER_MAP.keys())}")
+            data["step"] = self.step
+            data["progression"] = self.progression
+            data["answer"] = ANSWER_MAP[answer.lower()]
+            data["step_last_proposition"] = self.step_last_proposition
+            previous = self.state.copy() if self.undo is not None else None
+            try:
+                await self.__handler(await self.__post(url, data))
+                if previous is not None:
+                    self.undo.push(previous)
+                self.__track(self.answers + str(data["answer"]))
+            except (TransientError, CircuitOpenError):
+                raise
+            except Exception as e:
+                raise RuntimeError("Failed to submit the answers.") from e
+            yield Step(answer, self.step, self.question, self.progression, self.name_proposition if self.win and not self.finished else None)
+
+    async def answer_many(self, answers: Iterable[str]) -> List[Step]:
+        """
+        Submits a sequence of answers, one step after another, stopping early once Akinator proposes a character or the game ends.
+
+        Every answer is validated before the first request is sent.
+
+        :param answers: The answers to submit, in order. Each can be "yes", "no", "i don't know", "probably", or "probably not".
+        :type answers: Iterable[str]
+        :return: The step reached after each submitted answer. The answers left once Akinator proposes a character are not submitted.
+        :rtype: List[Step]
+        """
+        answers = list(answers)
+        for answer in answers:
+            if not answer.lower() in ANSWER_MAP:
+                raise InvalidChoiceError(f"Invalid answer: {answer}. Valid answers are: {', '.join(ANSWER_MAP.keys())}")
+        return [step async for step in self.answer_stream(answers)]
+
+    def predict(self, answer: str) -> Optional[CachedStep]:
+        """
+        Returns the step an answer to the current question is known to lead to, from the question cache, without sending any request.
+
+        :param answer: The answer to look up. Can be "yes", "no", "i don't know", "probably", or "probably not".
+        :type answer: str
+        :return: The cached step, or None if it is not cached, if there is no question cache, or if the answer would end the game.
+        :rtype: Optional[CachedStep]
+        """
+        if not answer.lower() in ANSWER_MAP:
+            raise InvalidChoiceError(f"Invalid answer: {answer}. Valid answers are: {', '.join(ANSWER_MAP.keys())}")
+        answer_id = ANSWER_MAP[answer.lower()]
+        if self.question_cache is None or self.finished or (self.win and answer_id != 1):
+            return None
+        move = "x" if self.win else str(answer_id)
+        return self.question_cache.get(self.language, self.theme, self.child_mode, self.answers + move, disk=False)
+
+    async def play(self, answers: Union[Iterable[str], AsyncIterable[str], Callable[[Event], Union[Optional[str], Awaitable[Optional[str]]]]]) -> AsyncIterator[Event]:
+        """
+        Plays the started game, yielding an immutable event for the current position, then one after every response, until the game ends or the answers run out.
+
+        The events are `Question`, `Proposition`, `Win`, `Defeat` and `Timeout`. `Win`, `Defeat` and `Timeout` end the game.
+
+        :param answers: The answers to give, either as an iterable or an asynchronous iterable, or as a callable receiving the last event and returning, or awaiting, the next answer, or None to stop.
+        :type answers: Union[Iterable[str], AsyncIterable[str], Callable[[Event], Union[Optional[str], Awaitable[Optional[str]]]]]
+        """
+        source = None if callable(answers) else _iterate(answers)
+        event = event_from_state(self.state)
+        while True:
+            yield event
+            if isinstance(event, (Win, Defeat)):
+                return
+            if source is None:
+                answer = answers(event)
+                if isawaitable(answer):
+                    answer = await answer
+            else:
+                try:
+                    answer = await source.__anext__()
+                except StopAsyncIteration:
+                    answer = None
+            if answer is None:
+                return
+            try:
+                await self.answer(answer)
+            except RuntimeError as e:
+                if isinstance(e.__cause__, SessionTimeoutError):
+                    yield Timeout(self.step)
+                    return
+                raise
+            event = event_from_state(self.state)
+
     async def back(self):
         """
         Goes back to the previous question in the game.
@@ -295,6 +475,8 @@ class AsyncClient:
         .. note::
 
             This method can only be called if the current step is greater than 0. If the step is 0, it raises a `CantGoBackAnyFurther` exception.        
+
+            With an `UndoHistory` keeping the previous step, it is restored without waiting, and the request is sent in a task.
         """
         if self.step == 0:
             raise CantGoBackAnyFurther()
@@ -308,11 +490,20 @@ class AsyncClient:
             "session": self.session_id,
             "signature": self.signature
         }
+        snapshot = self.undo.pop(self.step - 1) if self.undo is not None else None
+        if snapshot is not None:
+            return self.__restore(snapshot, data)
+
+        await self.__settle()
         self.win = False
 
         try:
-            response = await self.session.post(url, data=data)
+            response = await self.__post(url, data)
             await self.__handler(response)
+            self.__track(self.answers[:-1])
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to go back to the previous question.") from e
 
@@ -330,6 +521,7 @@ class AsyncClient:
         if self.finished:
             return await self.defeat()
 
+        await self.__settle()
         url = f"https://{self.language}.akinator.com/exclude"
         data = {
             "step": self.step,
@@ -343,8 +535,12 @@ class AsyncClient:
         self.id_proposition = ""
 
         try:
-            response = await self.session.post(url, data=data)
+            response = await self.__post(url, data)
             await self.__handler(response)
+            self.__track(self.answers + "x")
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to exclude the proposition.") from e
 
@@ -359,6 +555,7 @@ class AsyncClient:
         if not self.win:
             raise RuntimeError("You can only choose a proposition after Akinator has proposed a win.")
 
+        await self.__settle()
         url = f"https://{self.language}.akinator.com/choice"
         data = {
             "step": self.step,
@@ -373,7 +570,7 @@ class AsyncClient:
         }
 
         try:
-            response = await self.session.post(url, data=data, allow_redirects=True)
+            response = await self.__post(url, data, allow_redirects=True)
             if response.status_code not in range(200, 400):
                 response.raise_for_status()
 
@@ -381,16 +578,18 @@ class AsyncClient:
             self.win = True
             self.akitude = "triomphe.png"
             self.id_proposition = ""
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to choose the proposition.") from e
 
         try:
-            text = response.text
-            win_message = unescape(search(r'<span class="win-sentence">(.+?)<\/span>', text).group(1))
-            already_played = unescape(search(r'let tokenDejaJoue = "([\w\s]+)";', text).group(1))
-            times_selected = search(r'let timesSelected = "(\d+)";', text).group(1)
-            times = unescape(search(r'<span id="timesselected"><\/span>\s+([\w\s]+)<\/span>', text).group(1))
-            self.question = f"{win_message}\n{already_played} {times_selected} {times}"
+            started = perf_counter() if self.metrics.enabled else 0.0
+            fields = WIN_PAGE.extract(response.text)
+            if self.metrics.enabled:
+                self.metrics.timing("parse", perf_counter() - started, stage="win_page", language=self.language)
+            if all(fields.values()):
+                self.question = f"{unescape(fields['win_message'])}\n{unescape(fields['already_played'])} {fields['times_selected']} {unescape(fields['times'])}"
         except Exception:
             pass
 
@@ -427,6 +626,44 @@ class AsyncClient:
         self.question = questions[self.language]
         self.progression = 100
 
+    async def dump_state(self) -> bytes:
+        """
+        Serializes the current game, so that it can be resumed later with `from_state`, without keeping the client alive.
+        """
+        await self.__settle(strict=False)
+        return self.state.to_bytes()
+
+    @classmethod
+    def from_state(cls, state: Union[bytes, str, GameState], session: Optional[AsyncTransport] = None, **kwargs) -> "AsyncClient":
+        """
+        Creates a client resuming a game serialized with `dump_state`.
+
+        :param state: The serialized game, or a `GameState`.
+        :type state: Union[bytes, str, GameState]
+        :param session: An optional transport to use for making HTTP requests.
+        :type session: Optional[AsyncTransport]
+        :param kwargs: Other keyword arguments forwarded to the constructor.
+        """
+        if not isinstance(state, GameState):
+            state = GameState.from_bytes(state)
+        return cls(session, state=state, **kwargs)
+
+    async def close(self):
+        """
+        Closes the underlying transport and the worker thread of the undo history, if any, discarding any pending warm-up once pending requests are sent.
+        """
+        await self.__settle(strict=False)
+        self.__discard()
+        if self.undo is not None:
+            self.undo.close()
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
     @property
     def confidence(self) -> float:
         """
@@ -453,7 +690,7 @@ class AsyncClient:
         """
         Returns the URL of the current akitude image.
         """
-        return f"https://{self.language}.akinator.com/assets/img/akitudes_670x1096/{self.akitude}"
+        return AKITUDE_URL.format(language=self.language, akitude=self.akitude)
 
     def __str__(self):
         if self.win and not self.finished:
@@ -0,0 +1,262 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import NamedTuple, Optional, Tuple
+from collections import OrderedDict
+from json import dumps, loads
+from queue import Empty, Queue
+from threading import Lock, Thread
+import sqlite3
+import time
+
+from .state import GameState
+
+
+class CachedStep(NamedTuple):
+    """
+    What the server returned at the end of an answer path, as stored by `QuestionCache`.
+    """
+
+    step: int
+    question: str
+    progression: float
+    akitude: str
+    proposition: Optional[str] = None
+
+
+def _key(language: str, theme: str, child_mode: bool, answers: str) -> str:
+    return f"{language}:{theme}:{int(bool(child_mode))}:{answers}"
+
+
+class QuestionCache:
+    """
+    A cache of the question, akitude and progression, or proposition, reached by each answer path, per language, theme
+    and child mode.
+
+    Entries live in an in-memory LRU, and optionally in a SQLite file shared by processes and kept across restarts,
+    which is read when an entry is missing from memory. Entries expire `ttl` seconds after being stored. Clients given a
+    cache record every step they reach, and `Client.predict` looks up the step an answer would lead to.
+
+    Recording only touches memory: new entries are written to the file in batches by a background thread, so that
+    asynchronous clients never wait for the disk. `AsyncClient.predict` does not read the file either, and has missing
+    entries loaded into memory in the background instead, for the next lookup.
+
+    :param max_entries: The maximum number of entries kept in memory. Defaults to 10000.
+    :type max_entries: int
+    :param ttl: How long, in seconds, an entry stays valid. Defaults to a day.
+    :type ttl: float
+    :param path: An optional path to a SQLite database used as the disk tier.
+    :type path: Optional[str]
+
+    :ivar hits: The number of lookups which found a valid entry.
+    :ivar misses: The number of lookups which did not.
+    :ivar disk_hits: The number of hits served from the disk tier.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, Tuple[float, CachedStep]]" = OrderedDict()
+        self._db = None
+        self._db_lock = Lock()
+        self._queue: "Queue[Optional[tuple]]" = Queue()
+        self._writer = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS steps (key TEXT PRIMARY KEY, stored REAL NOT NULL, value TEXT NOT NULL)")
+            self._writer = Thread(target=self._write_behind, name="akinator-question-cache", daemon=True)
+            self._writer.start()
+
+    def _remember(self, key: str, stored: float, value: CachedStep):
+        self._entries[key] = (stored, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _memory(self, key: str, now: float) -> Optional[CachedStep]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+            del self._entries[key]
+        return None
+
+    def _load(self, key: str) -> Optional[CachedStep]:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            row = self._db.execute("SELECT stored, value FROM steps WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        value = CachedStep(*loads(row[1]))
+        with self._lock:
+            self._remember(key, row[0], value)
+            self.disk_hits += 1
+        return value
+
+    def _write(self, rows: list):
+        with self._db_lock:
+            try:
+                self._db.execute("BEGIN")
+                self._db.executemany("INSERT OR REPLACE INTO steps (key, stored, value) VALUES (?, ?, ?)", rows)
+                self._db.execute("COMMIT")
+            except sqlite3.Error:
+                if self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+                raise
+
+    def _write_behind(self):
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            rows = [item[1:] for item in batch if item is not None and item[0] == "put"]
+            try:
+                if rows:
+                    self._write(rows)
+                for item in batch:
+                    if item is not None and item[0] == "load":
+                        self._load(item[1])
+            except sqlite3.Error:
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def get(self, language: str, theme: str, child_mode: bool, answers: str, *, disk: bool = True) -> Optional[CachedStep]:
+        """
+        Returns the step reached by an answer path, or None if it is not cached.
+
+        :param language: The language of the game, e.g. "en".
+        :type language: str
+        :param theme: The theme of the game, e.g. "c".
+        :type theme: str
+        :param child_mode: Whether child mode is enabled.
+        :type child_mode: bool
+        :param answers: The answer path, one character per step, as in `GameState.answers`.
+        :type answers: str
+        :param disk: Whether to read an entry missing from memory from the file. Otherwise, it is loaded into memory in the background. Defaults to True.
+        :type disk: bool
+        """
+        key = _key(language, theme, child_mode, answers)
+        with self._lock:
+            value = self._memory(key, time.time())
+        if value is None and self._writer is not None:
+            if disk:
+                value = self._load(key)
+            else:
+                self._queue.put(("load", key))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def record(self, state: GameState) -> bool:
+        """
+        Stores the step a game has reached in memory, queuing it for the file, and returns whether it was already in
+        memory. Recording is not counted as a lookup.
+
+        :param state: The state of the game.
+        :type state: GameState
+        """
+        if state.answers is None or state.finished:
+            return False
+        proposition = state.name_proposition if state.win else None
+        value = CachedStep(state.step, state.question, state.progression, state.akitude, proposition)
+        key = _key(state.language, state.theme, state.child_mode, state.answers)
+        now = time.time()
+        with self._lock:
+            if self._memory(key, now) == value:
+                return True
+            self._remember(key, now, value)
+        if self._writer is not None:
+            self._queue.put(("put", key, now, dumps(value, ensure_ascii=False)))
+        return False
+
+    def flush(self):
+        """
+        Waits until every recorded entry has been written to the file, and every background load has completed.
+        """
+        if self._writer is not None:
+            self._queue.join()
+
+    def evict_expired(self) -> int:
+        """
+        Discards every expired entry, from memory and from disk, and returns the number of entries discarded from memory.
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (stored, _) in self._entries.items() if now - stored >= self.ttl]
+            for key in expired:
+                del self._entries[key]
+        self.flush()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM steps WHERE stored <= ?", (now - self.ttl,))
+        return len(expired)
+
+    def stats(self) -> dict:
+        """
+        Returns the number of entries in memory, hits, misses, disk hits and the hit rate.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def close(self):
+        """
+        Writes the queued entries and closes the disk tier, if any.
+        """
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,190 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, Optional
+from time import time
+from json import dump, load
+from os import replace
+from threading import Lock
+from urllib.parse import urlsplit
+from cloudscraper import CloudScraper, create_scraper
+
+
+def is_challenge(response) -> bool:
+    """
+    Returns whether a response is a Cloudflare challenge page rather than an answer from Akinator.
+
+    :param response: The response to inspect.
+    """
+    if response.status_code not in (403, 429, 503):
+        return False
+    if response.headers.get("cf-mitigated") == "challenge":
+        return True
+    return response.headers.get("Server", "").lower() == "cloudflare" and "challenge-platform" in response.text
+
+
+class ClearanceCache:
+    """
+    A cache of Cloudflare clearance cookies keyed by host and user agent, shared between sessions.
+
+    Sessions created through `create_scraper` are seeded with the freshest unexpired clearance and its user agent,
+    and report back any new clearance cookies they receive. An entry is only dropped when it expires, or when a
+    request made with it fails the challenge.
+
+    :param ttl: How long, in seconds, a clearance is considered valid. Defaults to 1800.
+    :type ttl: float
+    :param path: An optional path to a JSON file used to persist the cache across processes.
+    :type path: Optional[str]
+    """
+
+    def __init__(self, *, ttl: float = 1800.0, path: Optional[str] = None):
+        self.ttl = ttl
+        self.path = path
+        self._lock = Lock()
+        self._entries: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if path:
+            try:
+                with open(path, encoding="utf-8") as file:
+                    self._entries = load(file)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    @staticmethod
+    def _key(host: str, user_agent: str) -> str:
+        return f"{host}|{user_agent}"
+
+    def _save(self):
+        if not self.path:
+            return
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            dump(self._entries, file)
+        replace(temporary, self.path)
+
+    def get(self, host: str, user_agent: str) -> Optional[Dict[str, str]]:
+        """
+        Returns the cached clearance cookies for a host and user agent, or None if there are none or they have expired.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        :param user_agent: The user agent the clearance was issued for.
+        :type user_agent: str
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(host, user_agent))
+            if entry is None or entry["expires"] <= time():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(entry["cookies"])
+
+    def set(self, host: str, user_agent: str, cookies: Dict[str, str]):
+        """
+        Stores clearance cookies for a host and user agent.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        :param user_agent: The user agent the clearance was issued for.
+        :type user_agent: str
+        :param cookies: The clearance cookies.
+        :type cookies: Dict[str, str]
+        """
+        with self._lock:
+            self._entries[self._key(host, user_agent)] = {"host": host, "user_agent": user_agent, "cookies": dict(cookies), "expires": time() + self.ttl}
+            self._save()
+
+    def invalidate(self, host: str, user_agent: str):
+        """
+        Drops the clearance for a host and user agent, so that the next session solves the challenge again.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        :param user_agent: The user agent the clearance was issued for.
+        :type user_agent: str
+        """
+        with self._lock:
+            if self._entries.pop(self._key(host, user_agent), None) is not None:
+                self._save()
+
+    def seed(self, session: CloudScraper) -> int:
+        """
+        Copies every unexpired clearance into a session, adopting the user agent of the freshest one. Returns the number of hosts seeded.
+
+        :param session: The session to seed.
+        :type session: CloudScraper
+        """
+        with self._lock:
+            now = time()
+            entries = sorted((entry for entry in self._entries.values() if entry["expires"] > now), key=lambda entry: entry["expires"])
+            if not entries:
+                self.misses += 1
+                return 0
+            user_agent = entries[-1]["user_agent"]
+            session.headers["User-Agent"] = user_agent
+            seeded = [entry for entry in entries if entry["user_agent"] == user_agent]
+            for entry in seeded:
+                for name, value in entry["cookies"].items():
+                    session.cookies.set(name, value, domain=entry["host"], path="/")
+            self.hits += 1
+            return len(seeded)
+
+    def observe(self, session: CloudScraper, response):
+        """
+        Updates the cache from a response received by a session: challenged responses invalidate the clearance, and new clearance cookies are stored.
+
+        :param session: The session which received the response.
+        :type session: CloudScraper
+        :param response: The response received.
+        """
+        host = urlsplit(response.url).netloc
+        user_agent = session.headers.get("User-Agent", "")
+        if is_challenge(response):
+            self.invalidate(host, user_agent)
+            return
+
+        cookies = {cookie.name: cookie.value for cookie in session.cookies if cookie.name.startswith(("cf_", "__cf")) and host.endswith(cookie.domain.lstrip("."))}
+        if not cookies:
+            return
+        with self._lock:
+            entry = self._entries.get(self._key(host, user_agent))
+            if entry is not None and entry["cookies"] == cookies and entry["expires"] > time():
+                return
+        self.set(host, user_agent, cookies)
+
+    def create_scraper(self, **kwargs) -> CloudScraper:
+        """
+        Creates a `CloudScraper` session seeded from the cache, which keeps the cache up to date as it receives responses.
+
+        :param kwargs: Keyword arguments forwarded to `cloudscraper.create_scraper`.
+        """
+        session = create_scraper(**kwargs)
+        self.seed(session)
+        session.hooks["response"].append(lambda response, *args, **kwargs: self.observe(session, response))
+        return session
+
+    def __len__(self):
+        return len(self._entries)
@@ -22,75 +22,43 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Literal, Optional
-from re import search
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, Union
+from collections import deque
 from html import unescape
-from cloudscraper import CloudScraper, create_scraper
-
-from .exceptions import CantGoBackAnyFurther, InvalidLanguageError, InvalidChoiceError, InvalidThemeError
-
-LANG_MAP = {
-    "english": "en",
-    "arabic": "ar",
-    "chinese": "cn",
-    "german": "de",
-    "spanish": "es",
-    "french": "fr",
-    "hebrew": "il",
-    "italian": "it",
-    "japanese": "jp",
-    "korean": "kr",
-    "dutch": "nl",
-    "polish": "pl",
-    "portuguese": "pt",
-    "russian": "ru",
-    "turkish": "tr",
-    "indonesian": "id",
-}
-
-THEME_IDS = {"c": 1, "a": 14, "o": 2}
-
-# c - characters
-# a - animals
-# o - objects
-
-THEME_MAP = {
-    "en": ["c", "a", "o"],
-    "ar": ["c"],
-    "cn": ["c"],
-    "de": ["c", "a"],
-    "es": ["c", "a"],
-    "fr": ["c", "a", "o"],
-    "il": ["c"],
-    "it": ["c", "a"],
-    "jp": ["c", "a"],
-    "kr": ["c"],
-    "nl": ["c"],
-    "pl": ["c"],
-    "pt": ["c"],
-    "ru": ["c"],
-    "tr": ["c"],
-    "id": ["c"],
-}
-
-ANSWER_IDS = {
-    0: ["yes", "y", "0"],
-    1: ["no", "n", "1"],
-    2: ["i", "idk", "i dont know", "i don't know", "2"],
-    3: ["p", "probably", "3"],
-    4: ["pn", "probably not", "4"],
-}
-
-ANSWER_MAP = {item: key for key, values in ANSWER_IDS.items() for item in values}
-
-class Client:
+from time import perf_counter
+from threading import Lock
+from cloudscraper import create_scraper
+
+from .exceptions import CantGoBackAnyFurther, InvalidLanguageError, InvalidChoiceError, InvalidThemeError, CircuitOpenError, SessionTimeoutError, TransientError
+from .transport import Transport
+from .clearance import ClearanceCache
+from .parsing import START_PAGE, WIN_PAGE
+from .state import GameState, GameStateView, Step
+from .retry import send
+from .metrics import get_metrics
+from .events import Correction, Defeat, Event, Timeout, Win, event_from_state
+from .cache import CachedStep
+from .settings import ClientSettings
+from .constants import LANG_MAP, THEME_IDS, THEME_MAP, ANSWER_IDS, ANSWER_MAP, AKITUDE_URL # pylint: disable=unused-import
+
+
+class Client(GameStateView):
 
     """
     A class representing a client for the Akinator game.
 
-    :param session: An optional `CloudScraper` object to use for making HTTP requests. If not provided, a new session will be created.
-    :type session: Optional[CloudScraper]
-
+    :param session: An optional `Transport` to use for making HTTP requests, such as a `CloudScraper` object. If not provided, a new `CloudScraper` session will be created.
+    :type session: Optional[Transport]
+    :param timeout: An optional timeout, in seconds, applied to every request.
+    :type timeout: Optional[float]
+    :param clearance_cache: An optional `ClearanceCache` used to seed the default session with cached Cloudflare clearance. Ignored if `session` is provided.
+    :type clearance_cache: Optional[ClearanceCache]
+    :param state: An optional `GameState` to resume, e.g. a parked game. If not provided, a new, empty state is used.
+    :type state: Optional[GameState]
+    :param settings: The optional features of the client, such as retries, metrics, a question cache or local undo. Defaults to none.
+    :type settings: Optional[ClientSettings]
+
+    :ivar state: The `GameState` holding every per-game attribute below, which are exposed as attributes of the client.
     :ivar flag_photo: The URL of the flag photo associated with the current game session.
     :ivar photo: The URL of the character photo associated with the current game session.
     :ivar pseudo: The pseudo name of the player in the current game session.
@@ -118,47 +86,132 @@ class Client:
     :ivar akitude_url: The URL of the current akitude image associated with the game session.
     """
 
-    def __init__(self, session: Optional[CloudScraper] = None):
-        self.session = session if session else create_scraper()
-
-        self.flag_photo = None
-        self.photo = None
-        self.pseudo = None
-        self.theme = None
-        self.session_id = None
-        self.signature = None
-        self.identifiant = None
-        self.child_mode = False
-        self.language = None
-        self.theme = None
-
-        self.question = None
-        self.progression = None
-        self.step = None
-        self.akitude = None
-        self.step_last_proposition = ""
-        self.finished = False
-
-        self.win = False
-        self.id_proposition = None
-        self.name_proposition = None
-        self.description_proposition = None
-        self.proposition = ""
-        self.completion = None
+    def __init__(self, session: Optional[Transport] = None, *, timeout: Optional[float] = None, clearance_cache: Optional[ClearanceCache] = None, state: Optional[GameState] = None, settings: Optional[ClientSettings] = None):
+        if session is None:
+            session = clearance_cache.create_scraper() if clearance_cache else create_scraper()
+        self.session = session
+        self.timeout = timeout
+        self.state = state if state is not None else GameState()
+        settings = settings if settings is not None else ClientSettings()
+        self.retry = settings.retry
+        self.rate_limiter = settings.rate_limiter
+        self.circuit_breaker = settings.circuit_breaker
+        self.metrics = get_metrics(settings.metrics)
+        self.question_cache = settings.question_cache
+        self.speculation = settings.speculation
+        self.undo = settings.undo
+        self.__warmup = None
+        self.__reconciling = None
+        self.__unconfirmed = deque()
+        self.__lock = Lock()
+
+    def __post(self, url, data, **kwargs):
+        warmup, self.__warmup = self.__warmup, None
+        if warmup is not None:
+            warmup.use()
+        return self.__request(url, data, **kwargs)
+
+    def __request(self, url, data, **kwargs):
+        if not self.metrics.enabled:
+            return self.__send(url, data, **kwargs)
+        started = perf_counter()
+        try:
+            return self.__send(url, data, **kwargs)
+        finally:
+            self.metrics.timing("request", perf_counter() - started, endpoint=url.rsplit("/", 1)[-1], language=self.language)
+
+    def __send(self, url, data, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        if self.retry is None and self.rate_limiter is None and self.circuit_breaker is None:
+            return self.session.post(url, data=data, **kwargs)
+        return send(lambda: self.session.post(url, data=data, **kwargs), url, retry=self.retry, rate_limiter=self.rate_limiter, circuit_breaker=self.circuit_breaker)
+
+    def __track(self, answers: str):
+        self.answers = answers
+        if self.question_cache is not None:
+            self.question_cache.record(self.state)
+
+    def __prewarm(self):
+        self.__discard()
+        if self.speculation is not None and not self.finished and hasattr(self.session, "get"):
+            self.__warmup = self.speculation.warm(self.session.get, self.akitude_url)
+
+    def __discard(self):
+        if self.__warmup is not None:
+            self.__warmup.discard()
+            self.__warmup = None
+
+    def __settle(self, strict: bool = True):
+        if self.__reconciling is None:
+            return
+        reconciling, self.__reconciling = self.__reconciling, None
+        try:
+            reconciling.result()
+        except (TransientError, CircuitOpenError):
+            self.__roll_forward()
+            if strict:
+                raise
+        except Exception as e:
+            self.__roll_forward()
+            if strict:
+                raise RuntimeError("Failed to go back to the previous question.") from e
+
+    def __roll_forward(self):
+        # The server did not go back from the first unconfirmed step, so neither did the game.
+        with self.__lock:
+            state = self.__unconfirmed[0]
+            self.__unconfirmed.clear()
+            self.state = state
+            self.__track(state.answers)
+        self.__prewarm()
+
+    def __restore(self, snapshot, data):
+        self.__discard()
+        with self.__lock:
+            self.__unconfirmed.append(self.state.copy())
+            self.win = False
+            self.question = snapshot.question
+            self.step = snapshot.step
+            self.progression = snapshot.progression
+            self.akitude = snapshot.akitude
+            self.__track(snapshot.answers)
+        self.__reconciling = self.undo.executor().submit(self.__reconcile, self.__reconciling, data, snapshot)
+        self.__prewarm()
+
+    def __reconcile(self, previous, data, expected):
+        if previous is not None:
+            previous.result()
+        response = self.__request(f"https://{self.language}.akinator.com/cancel_answer", data)
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("completion") == "KO - TIMEOUT":
+            raise SessionTimeoutError()
+        self.__unconfirmed.popleft()
+        if "step" not in payload or (int(payload["step"]), payload["question"]) == (expected.step, expected.question):
+            return
+        event = Correction(int(payload["step"]), payload["question"], float(payload["progression"]), payload["akitude"], expected.step, expected.question)
+        with self.__lock:
+            if (self.step, self.question) == (expected.step, expected.question):
+                self.step, self.question, self.progression, self.akitude = event[:4]
+        self.undo.correct(event)
 
     def __handler(self, response):
         response.raise_for_status()
+        started = perf_counter() if self.metrics.enabled else 0.0
         try:
             data = response.json()
         except Exception as e:
             if "A technical problem has ocurred." in response.text:
                 raise RuntimeError("A technical problem has occurred. Please try again later.") from e
             raise RuntimeError("Failed to parse the response as JSON.") from e
+        if self.metrics.enabled:
+            self.metrics.timing("parse", perf_counter() - started, stage="json", language=self.language)
 
         if "completion" not in data:
             data["completion"] = self.completion
         if data["completion"] == "KO - TIMEOUT":
-            raise RuntimeError("The session has timed out. Please start a new game.")
+            raise SessionTimeoutError()
         if data["completion"] == "SOUNDLIKE":
             self.finished = True
             self.win = True
@@ -180,7 +233,14 @@ class Client:
             self.question = data["question"]
         self.completion = data["completion"]
 
-    def start_game(self, *, language: str = "en", child_mode: bool = False, theme: Literal["c", "a", "o"] = "c"):
+    def __extract_start_page(self, response, stream):
+        started = perf_counter() if self.metrics.enabled else 0.0
+        fields = START_PAGE.extract_response(response) if stream else START_PAGE.extract(response.text)
+        if self.metrics.enabled:
+            self.metrics.timing("parse", perf_counter() - started, stage="start_page", language=self.language)
+        return fields
+
+    def start_game(self, *, language: str = "en", child_mode: bool = False, theme: Literal["c", "a", "o"] = "c", stream: bool = False):
         """
         Starts a new game session with the specified language, child mode, and theme.
 
@@ -190,6 +250,8 @@ class Client:
         :type child_mode: bool
         :param theme: The theme to use for the game. Can be "c" (characters), "a" (animals), or "o" (objects). Defaults to "c".
         :type theme: Literal["c", "a", "o"]
+        :param stream: Whether to read the page incrementally and stop downloading it as soon as the session information and the first question are found. Defaults to False.
+        :type stream: bool
         """
         if language not in LANG_MAP and language not in LANG_MAP.values():
             raise InvalidLanguageError(f"Unsupported language: {language}. Supported languages: {', '.join(LANG_MAP.keys())}")
@@ -200,38 +262,42 @@ class Client:
         if theme not in THEME_MAP[LANG_MAP.get(language.lower(), language.lower())]:
             raise InvalidThemeError(f"Theme '{theme}' is not available for language '{language}'.")
 
+        self.__settle(strict=False)
+
         try:
             self.theme = theme
             self.language = LANG_MAP.get(language.lower(), language.lower())
             self.child_mode = child_mode
 
-            response = self.session.post(f"https://{self.language}.akinator.com/game", data={"sid": THEME_IDS[theme], "cm": str(child_mode).lower()})
+            response = self.__post(f"https://{self.language}.akinator.com/game", {"sid": THEME_IDS[theme], "cm": str(child_mode).lower()}, stream=stream)
             response.raise_for_status()
-            text = response.text
+            fields = self.__extract_start_page(response, stream)
 
-            self.session_id = search(r"#session'\).val\('(.+?)'\)", text).group(1)
-            self.signature = search(r"#signature'\).val\('(.+?)'\)", text).group(1)
-            self.identifiant = search(r"#identifiant'\).val\('(.+?)'\)", text).group(1)
+            self.session_id = fields["session_id"]
+            self.signature = fields["signature"]
+            self.identifiant = fields["identifiant"]
 
             if not all([self.session_id, self.signature, self.identifiant]):
                 raise ValueError("Failed to extract session information from the response.")
 
-            question = search(r'<div class="bubble-body"><p class="question-text" id="question-label">(.+)</p></div>', text)
-
-            if not question:
+            if not fields["question"]:
                 raise ValueError("Failed to extract the initial question from the response.")
 
-            self.question = unescape(question.group(1))
-
-            proposition = search(r'<div class="sub-bubble-propose"><p id="p-sub-bubble">([\w\s]+)</p></div>', text)
+            self.question = unescape(fields["question"])
 
-            if not proposition:
+            if not fields["proposition"]:
                 raise ValueError("Failed to extract the proposition from the response.")
 
-            self.proposition = unescape(proposition.group(1))
+            self.proposition = unescape(fields["proposition"])
             self.progression = 0
             self.step = 0
             self.akitude = "defi.png"
+            if self.undo is not None:
+                self.undo.clear()
+            self.__track("")
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to start the game.") from e
 
@@ -255,6 +321,9 @@ class Client:
                 return self.exclude()
             raise InvalidChoiceError("Invalid answer after Akinator has proposed a win. Only 'yes' or 'no' are valid answers at this point.")
 
+        self.__settle()
+        previous = self.state.copy() if self.undo is not None else None
+
         url = f"https://{self.language}.akinator.com/answer"
         data = {
             "step": self.step,
@@ -268,11 +337,108 @@ class Client:
         }
 
         try:
-            response = self.session.post(url, data=data)
+            response = self.__post(url, data)
             self.__handler(response)
+            if previous is not None:
+                self.undo.push(previous)
+            self.__track(self.answers + str(answer_id))
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to submit the answer.") from e
 
+    def answer_many(self, answers: Iterable[str]) -> List[Step]:
+        """
+        Submits a sequence of answers, one step after another, stopping early once Akinator proposes a character or the game ends.
+
+        Every answer is validated before the first request is sent, and the request payload is built once for the whole
+        sequence. Each request still waits for the previous response, as it carries the step and progression returned by it.
+
+        :param answers: The answers to submit, in order. Each can be "yes", "no", "i don't know", "probably", or "probably not".
+        :type answers: Iterable[str]
+        :return: The step reached after each submitted answer. The answers left once Akinator proposes a character are not submitted.
+        :rtype: List[Step]
+        """
+        answers = list(answers)
+        for answer in answers:
+            if not answer.lower() in ANSWER_MAP:
+                raise InvalidChoiceError(f"Invalid answer: {answer}. Valid answers are: {', '.join(ANSWER_MAP.keys())}")
+
+        self.__settle()
+        url = f"https://{self.language}.akinator.com/answer"
+        data = {
+            "sid": THEME_IDS[self.theme],
+            "cm": str(self.child_mode).lower(),
+            "session": self.session_id,
+            "signature": self.signature
+        }
+        trajectory = []
+
+        try:
+            for answer in answers:
+                if self.win or self.finished:
+                    break
+                data["step"] = self.step
+                data["progression"] = self.progression
+                data["answer"] = ANSWER_MAP[answer.lower()]
+                data["step_last_proposition"] = self.step_last_proposition
+                previous = self.state.copy() if self.undo is not None else None
+                self.__handler(self.__post(url, data))
+                if previous is not None:
+                    self.undo.push(previous)
+                self.__track(self.answers + str(data["answer"]))
+                trajectory.append(Step(answer, self.step, self.question, self.progression, self.name_proposition if self.win and not self.finished else None))
+        except (TransientError, CircuitOpenError):
+            raise
+        except Exception as e:
+            raise RuntimeError("Failed to submit the answers.") from e
+        return trajectory
+
+    def predict(self, answer: str) -> Optional[CachedStep]:
+        """
+        Returns the step an answer to the current question is known to lead to, from the question cache, without sending any request.
+
+        :param answer: The answer to look up. Can be "yes", "no", "i don't know", "probably", or "probably not".
+        :type answer: str
+        :return: The cached step, or None if it is not cached, if there is no question cache, or if the answer would end the game.
+        :rtype: Optional[CachedStep]
+        """
+        if not answer.lower() in ANSWER_MAP:
+            raise InvalidChoiceError(f"Invalid answer: {answer}. Valid answers are: {', '.join(ANSWER_MAP.keys())}")
+        answer_id = ANSWER_MAP[answer.lower()]
+        if self.question_cache is None or self.finished or (self.win and answer_id != 1):
+            return None
+        move = "x" if self.win else str(answer_id)
+        return self.question_cache.get(self.language, self.theme, self.child_mode, self.answers + move)
+
+    def play(self, answers: Union[Iterable[str], Callable[[Event], Optional[str]]]) -> Iterator[Event]:
+        """
+        Plays the started game, yielding an immutable event for the current position, then one after every response, until the game ends or the answers run out.
+
+        The events are `Question`, `Proposition`, `Win`, `Defeat` and `Timeout`. `Win`, `Defeat` and `Timeout` end the game.
+
+        :param answers: The answers to give, either as an iterable, or as a callable receiving the last event and returning the next answer, or None to stop.
+        :type answers: Union[Iterable[str], Callable[[Event], Optional[str]]]
+        """
+        source = None if callable(answers) else iter(answers)
+        event = event_from_state(self.state)
+        while True:
+            yield event
+            if isinstance(event, (Win, Defeat)):
+                return
+            answer = answers(event) if source is None else next(source, None)
+            if answer is None:
+                return
+            try:
+                self.answer(answer)
+            except RuntimeError as e:
+                if isinstance(e.__cause__, SessionTimeoutError):
+                    yield Timeout(self.step)
+                    return
+                raise
+            event = event_from_state(self.state)
+
     def back(self):
         """
         Goes back to the previous question in the game.
@@ -280,6 +446,8 @@ class Client:
         .. note::
 
             This method can only be called if the current step is greater than 0. If the step is 0, it raises a `CantGoBackAnyFurther` exception.        
+
+            With an `UndoHistory` keeping the previous step, it is restored without waiting, and the request is sent in the background.
         """
         if self.step == 0:
             raise CantGoBackAnyFurther()
@@ -293,11 +461,20 @@ class Client:
             "session": self.session_id,
             "signature": self.signature
         }
+        snapshot = self.undo.pop(self.step - 1) if self.undo is not None else None
+        if snapshot is not None:
+            return self.__restore(snapshot, data)
+
+        self.__settle()
         self.win = False
 
         try:
-            response = self.session.post(url, data=data)
+            response = self.__post(url, data)
             self.__handler(response)
+            self.__track(self.answers[:-1])
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to go back to the previous question.") from e
 
@@ -315,6 +492,7 @@ class Client:
         if self.finished:
             return self.defeat()
 
+        self.__settle()
         url = f"https://{self.language}.akinator.com/exclude"
         data = {
             "step": self.step,
@@ -328,8 +506,12 @@ class Client:
         self.id_proposition = ""
 
         try:
-            response = self.session.post(url, data=data)
+            response = self.__post(url, data)
             self.__handler(response)
+            self.__track(self.answers + "x")
+            self.__prewarm()
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to exclude the proposition.") from e
 
@@ -344,6 +526,7 @@ class Client:
         if not self.win:
             raise RuntimeError("You can only choose a proposition after Akinator has proposed a win.")
 
+        self.__settle()
         url = f"https://{self.language}.akinator.com/choice"
         data = {
             "step": self.step,
@@ -358,7 +541,7 @@ class Client:
         }
 
         try:
-            response = self.session.post(url, data=data, allow_redirects=True)
+            response = self.__post(url, data, allow_redirects=True)
             if response.status_code not in range(200, 400):
                 response.raise_for_status()
 
@@ -366,16 +549,18 @@ class Client:
             self.win = True
             self.akitude = "triomphe.png"
             self.id_proposition = ""
+        except (TransientError, CircuitOpenError):
+            raise
         except Exception as e:
             raise RuntimeError("Failed to choose the proposition.") from e
 
         try:
-            text = response.text
-            win_message = unescape(search(r'<span class="win-sentence">(.+?)<\/span>', text).group(1))
-            already_played = unescape(search(r'let tokenDejaJoue = "([\w\s]+)";', text).group(1))
-            times_selected = search(r'let timesSelected = "(\d+)";', text).group(1)
-            times = unescape(search(r'<span id="timesselected"><\/span>\s+([\w\s]+)<\/span>', text).group(1))
-            self.question = f"{win_message}\n{already_played} {times_selected} {times}"
+            started = perf_counter() if self.metrics.enabled else 0.0
+            fields = WIN_PAGE.extract(response.text)
+            if self.metrics.enabled:
+                self.metrics.timing("parse", perf_counter() - started, stage="win_page", language=self.language)
+            if all(fields.values()):
+                self.question = f"{unescape(fields['win_message'])}\n{unescape(fields['already_played'])} {fields['times_selected']} {unescape(fields['times'])}"
         except Exception:
             pass
 
@@ -412,6 +597,44 @@ class Client:
         self.question = questions[self.language]
         self.progression = 100
 
+    def dump_state(self) -> bytes:
+        """
+        Serializes the current game, so that it can be resumed later with `from_state`, without keeping the client alive.
+        """
+        self.__settle(strict=False)
+        return self.state.to_bytes()
+
+    @classmethod
+    def from_state(cls, state: Union[bytes, str, GameState], session: Optional[Transport] = None, **kwargs) -> "Client":
+        """
+        Creates a client resuming a game serialized with `dump_state`.
+
+        :param state: The serialized game, or a `GameState`.
+        :type state: Union[bytes, str, GameState]
+        :param session: An optional transport to use for making HTTP requests.
+        :type session: Optional[Transport]
+        :param kwargs: Other keyword arguments forwarded to the constructor.
+        """
+        if not isinstance(state, GameState):
+            state = GameState.from_bytes(state)
+        return cls(session, state=state, **kwargs)
+
+    def close(self):
+        """
+        Closes the underlying transport and the worker thread of the undo history, if any, discarding any pending warm-up once pending requests are sent.
+        """
+        self.__settle(strict=False)
+        self.__discard()
+        if self.undo is not None:
+            self.undo.close()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     @property
     def confidence(self) -> float:
         """
@@ -438,7 +661,7 @@ class Client:
         """
         Returns the URL of the current akitude image.
         """
-        return f"https://{self.language}.akinator.com/assets/img/akitudes_670x1096/{self.akitude}"
+        return AKITUDE_URL.format(language=self.language, akitude=self.akitude)
 
     def __str__(self):
         if self.win and not self.finished:
@@ -0,0 +1,94 @@
+"""MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+LANG_MAP = {
+    "english": "en",
+    "arabic": "ar",
+    "chinese": "cn",
+    "german": "de",
+    "spanish": "es",
+    "french": "fr",
+    "hebrew": "il",
+    "italian": "it",
+    "japanese": "jp",
+    "korean": "kr",
+    "dutch": "nl",
+    "polish": "pl",
+    "portuguese": "pt",
+    "russian": "ru",
+    "turkish": "tr",
+    "indonesian": "id",
+}
+
+THEME_IDS = {"c": 1, "a": 14, "o": 2}
+
+# c - characters
+# a - animals
+# o - objects
+
+THEME_MAP = {
+    "en": ["c", "a", "o"],
+    "ar": ["c"],
+    "cn": ["c"],
+    "de": ["c", "a"],
+    "es": ["c", "a"],
+    "fr": ["c", "a", "o"],
+    "il": ["c"],
+    "it": ["c", "a"],
+    "jp": ["c", "a"],
+    "kr": ["c"],
+    "nl": ["c"],
+    "pl": ["c"],
+    "pt": ["c"],
+    "ru": ["c"],
+    "tr": ["c"],
+    "id": ["c"],
+}
+
+ANSWER_IDS = {
+    0: ["yes", "y", "0"],
+    1: ["no", "n", "1"],
+    2: ["i", "idk", "i dont know", "i don't know", "2"],
+    3: ["p", "probably", "3"],
+    4: ["pn", "probably not", "4"],
+}
+
+ANSWER_MAP = {item: key for key, values in ANSWER_IDS.items() for item in values}
+
+AKITUDE_URL = "https://{language}.akinator.com/assets/img/akitudes_670x1096/{akitude}"
+
+# Every akitude Akinator can show: the ones returned by /answer as the game progresses, and the ones of the end screens.
+AKITUDES = (
+    "defi.png",
+    "serein.png",
+    "inspiration_legere.png",
+    "inspiration_forte.png",
+    "confiant.png",
+    "mobile.png",
+    "leger_decouragement.png",
+    "vrai_decouragement.png",
+    "surprise.png",
+    "tension.png",
+    "triomphe.png",
+    "deception.png",
+)
@@ -0,0 +1,435 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+from json import dumps, loads
+from random import Random
+from threading import Lock
+from uuid import uuid4
+import os
+import struct
+
+from .pages import ENDPOINTS, GAME_PAGE, WIN_PAGE, akitude, json_response, parse_form, route
+from .transport import Response
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+KNOWLEDGE_MAGIC = b"AKIKB"
+KNOWLEDGE_VERSION = 1
+
+_HEADER = struct.Struct("<5sB2xI")
+_ALIGNMENT = 64
+
+# The weight given to "yes" by each answer, in the order of the answer ids: "yes", "no", "i don't know", "probably"
+# and "probably not". The likelihood of an answer is `weight * p + (1 - weight) * (1 - p)`, where `p` is the
+# probability of the character being answered "yes" to the question.
+_ANSWER_WEIGHTS = (0.95, 0.05, 0.5, 0.75, 0.25)
+
+
+def _require_numpy(name):
+    if numpy is None:
+        raise RuntimeError(f"{name} requires the 'numpy' package. Install it with `pip install akinator[engine]`.")
+
+
+class KnowledgeBase:
+    """
+    The characters and questions known to a `LocalEngine`, with the probability of every character being answered
+    "yes" to every question.
+
+    The matrix is stored question-major, i.e. with one row of characters per question, so that updating the scores of
+    every character after an answer reads a single contiguous row. Knowledge bases are saved to a single binary file,
+    which `load` memory-maps instead of reading, so that opening one with hundreds of thousands of characters is almost
+    instant and its pages are shared between processes.
+
+    :param questions: The text of every question.
+    :type questions: Sequence[str]
+    :param characters: The name and description of every character.
+    :type characters: Sequence[Tuple[str, str]]
+    :param matrix: The probabilities, of shape (questions, characters), as floats between 0 and 1 or as `uint8` scaled to 255.
+    :type matrix: numpy.ndarray
+    :param priors: The prior probability of every character, e.g. its popularity. Defaults to uniform.
+    :type priors: Optional[numpy.ndarray]
+    """
+
+    def __init__(self, questions: Sequence[str], characters: Sequence[Tuple[str, str]], matrix, priors=None):
+        _require_numpy("KnowledgeBase")
+        self.questions = list(questions)
+        self.characters = [tuple(character) for character in characters]
+        if not isinstance(matrix, numpy.ndarray) or matrix.dtype not in (numpy.float32, numpy.uint8):
+            matrix = numpy.asarray(matrix, dtype=numpy.float32)
+        self.matrix = matrix
+        if self.matrix.shape != (len(self.questions), len(self.characters)):
+            raise ValueError(f"The matrix should be of shape ({len(self.questions)}, {len(self.characters)}), not {self.matrix.shape}.")
+        if priors is None:
+            priors = numpy.full(len(self.characters), 1 / max(1, len(self.characters)), dtype=numpy.float32)
+        self.priors = numpy.asarray(priors, dtype=numpy.float32)
+        if self.priors.shape != (len(self.characters),):
+            raise ValueError(f"The priors should be of shape ({len(self.characters)},), not {self.priors.shape}.")
+
+    def probabilities(self, questions, characters=None):
+        """
+        Returns the probabilities of the given questions, for the given characters or for all of them, as floats.
+
+        :param questions: The index of a question, or an array of indices.
+        :param characters: An optional array of character indices.
+        """
+        rows = self.matrix[questions] if characters is None else self.matrix[numpy.ix_(numpy.atleast_1d(questions), characters)]
+        if rows.dtype == numpy.uint8:
+            return rows.astype(numpy.float32) / 255
+        return rows
+
+    def save(self, path: str):
+        """
+        Saves the knowledge base to a binary file, atomically.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        header = dumps({
+            "questions": self.questions,
+            "characters": self.characters,
+            "dtype": self.matrix.dtype.name,
+        }, ensure_ascii=False).encode()
+        start = _HEADER.size + len(header)
+        padding = -start % _ALIGNMENT
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(_HEADER.pack(KNOWLEDGE_MAGIC, KNOWLEDGE_VERSION, len(header) + padding))
+            file.write(header + b" " * padding)
+            file.write(numpy.ascontiguousarray(self.priors, dtype=numpy.float32).tobytes())
+            file.write(numpy.ascontiguousarray(self.matrix).tobytes())
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "KnowledgeBase":
+        """
+        Opens a knowledge base saved with `save`, memory-mapping its priors and matrix.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        _require_numpy("KnowledgeBase")
+        with open(path, "rb") as file:
+            magic, version, length = _HEADER.unpack(file.read(_HEADER.size))
+            if magic != KNOWLEDGE_MAGIC:
+                raise ValueError(f"{path} is not a knowledge base.")
+            if version != KNOWLEDGE_VERSION:
+                raise ValueError(f"Unsupported knowledge base version: {version}.")
+            header = loads(file.read(length))
+        offset = _HEADER.size + length
+        characters, questions = len(header["characters"]), len(header["questions"])
+        priors = numpy.memmap(path, dtype=numpy.float32, mode="r", offset=offset, shape=(characters,)) if characters else None
+        offset += characters * 4
+        matrix = numpy.memmap(path, dtype=header["dtype"], mode="r", offset=offset, shape=(questions, characters)) if characters and questions else numpy.zeros((questions, characters), dtype=header["dtype"])
+        return cls(header["questions"], header["characters"], matrix, priors)
+
+    def __len__(self):
+        return len(self.characters)
+
+
+class _Game:
+    __slots__ = ("session", "signature", "identifiant", "scores", "history", "asked", "excluded", "question", "proposed")
+
+    def __init__(self, session, signature, identifiant, scores):
+        self.session = session
+        self.signature = signature
+        self.identifiant = identifiant
+        self.scores = scores
+        self.history: List[Tuple[int, int]] = []
+        self.asked = set()
+        self.excluded = set()
+        self.question = -1
+        self.proposed = -1
+
+
+class EngineSettings(NamedTuple):
+    """
+    How a `LocalEngine` chooses questions and when it proposes a character.
+
+    :param threshold: The probability above which the most likely character is proposed. Defaults to 0.85.
+    :type threshold: float
+    :param propose_after: The number of steps after which a character is proposed anyway. Defaults to 20.
+    :type propose_after: int
+    :param max_steps: The number of steps after which the engine gives up. Defaults to 80.
+    :type max_steps: int
+    :param candidates: The number of most likely characters considered when choosing a question. Defaults to 128.
+    :type candidates: int
+    """
+
+    threshold: float = 0.85
+    propose_after: int = 20
+    max_steps: int = 80
+    candidates: int = 128
+
+
+class LocalEngine:
+    """
+    An offline guessing engine answering the requests of `Client` / `AsyncClient` like akinator.com does, through
+    `EngineTransport` / `AsyncEngineTransport`, so that games go on when the service is slow or unreachable.
+
+    Every game keeps the log-probability of each character. An answer multiplies it by the likelihood of the answer
+    for every character at once, and going back replays the remaining answers from the priors in a single batched
+    update. The next question is the one with the highest expected information gain over the `candidates` most likely
+    characters, and a character is proposed once its probability reaches `threshold`, or every `propose_after` steps,
+    as set by `EngineSettings`.
+
+    Every game holds one float per character, so `max_sessions` bounds the memory used by abandoned games. Languages,
+    themes and child mode are accepted but all share the same knowledge base.
+
+    :param knowledge: The knowledge base, or the path of one to load.
+    :type knowledge: Union[KnowledgeBase, str]
+    :param settings: How questions are chosen and characters proposed. Defaults to `EngineSettings()`.
+    :type settings: Optional[EngineSettings]
+    :param max_sessions: The maximum number of games kept, the oldest being timed out first. Defaults to 1000.
+    :type max_sessions: int
+    :param seed: An optional seed making the session identifiers reproducible.
+    :type seed: Optional[int]
+    """
+
+    def __init__(self, knowledge: Union[KnowledgeBase, str], settings: Optional[EngineSettings] = None, *, max_sessions: int = 1000, seed: Optional[int] = None):
+        _require_numpy("LocalEngine")
+        self.knowledge = knowledge if isinstance(knowledge, KnowledgeBase) else KnowledgeBase.load(knowledge)
+        self.settings = settings if settings is not None else EngineSettings()
+        self.max_sessions = max_sessions
+        self._random = Random(seed)
+        self._lock = Lock()
+        self._sessions: "OrderedDict[str, _Game]" = OrderedDict()
+        weights = numpy.array(_ANSWER_WEIGHTS, dtype=numpy.float32)
+        self._intercepts = 1 - weights
+        self._slopes = 2 * weights - 1
+        with numpy.errstate(divide="ignore"):
+            self._log_priors = numpy.log(numpy.asarray(self.knowledge.priors, dtype=numpy.float32))
+
+    def update(self, scores, answers: Sequence[Tuple[int, int]]):
+        """
+        Adds the log-likelihood of a sequence of answers to the scores of every character, in place.
+
+        :param scores: The log-probabilities of the characters.
+        :type scores: numpy.ndarray
+        :param answers: The (question index, answer id) pairs to apply.
+        :type answers: Sequence[Tuple[int, int]]
+        """
+        if not answers:
+            return scores
+        questions, answer_ids = (numpy.array(column) for column in zip(*answers))
+        likelihoods = self._intercepts[answer_ids, None] + self._slopes[answer_ids, None] * self.knowledge.probabilities(questions)
+        scores += numpy.log(likelihoods).sum(axis=0)
+        return scores
+
+    def posterior(self, answers: Sequence[Tuple[int, int]] = (), excluded=()):
+        """
+        Returns the probability of every character given a sequence of answers.
+
+        :param answers: The (question index, answer id) pairs given so far.
+        :type answers: Sequence[Tuple[int, int]]
+        :param excluded: The indices of the characters already rejected.
+        """
+        scores = self.update(self._log_priors.copy(), answers)
+        scores[list(excluded)] = -numpy.inf
+        return self._normalize(scores)
+
+    @staticmethod
+    def _normalize(scores):
+        top = scores.max()
+        if not numpy.isfinite(top):
+            return numpy.zeros_like(scores)
+        probabilities = numpy.exp(scores - top)
+        return probabilities / probabilities.sum()
+
+    def _next_question(self, game, probabilities) -> int:
+        count = len(self.knowledge.questions)
+        if len(game.asked) >= count:
+            return -1
+        candidates = min(self.settings.candidates, probabilities.size)
+        top = numpy.argpartition(probabilities, -candidates)[-candidates:] if candidates < probabilities.size else numpy.arange(probabilities.size)
+        weights = probabilities[top]
+        weights = weights / weights.sum()
+        matrix = self.knowledge.probabilities(numpy.arange(count), top).astype(numpy.float64)
+        # The mutual information between the character and a yes/no answer: H(answer) - E[H(answer | character)].
+        gains = _entropy(matrix @ weights) - _entropy(matrix) @ weights
+        gains[list(game.asked)] = -numpy.inf
+        return int(numpy.argmax(gains))
+
+    def handle(self, language: str, endpoint: str, form: Dict[str, str]) -> Response:
+        """
+        Handles a request and returns its response.
+
+        :param language: The language of the request, i.e. the subdomain of the requested host.
+        :type language: str
+        :param endpoint: The requested endpoint, e.g. "answer".
+        :type endpoint: str
+        :param form: The form data of the request.
+        :type form: Dict[str, str]
+        """
+        url = f"https://{language}.akinator.com/{endpoint}"
+        if endpoint not in ENDPOINTS:
+            return Response(404, b"Not Found", {"Content-Type": "text/plain"}, url)
+        with self._lock:
+            if endpoint == "game":
+                return self._start(url)
+            game = self._sessions.get(str(form.get("session")))
+            if game is None or str(form.get("signature")) != game.signature:
+                return json_response({"completion": "KO - TIMEOUT"}, url)
+            self._sessions.move_to_end(game.session)
+            return self._play(game, endpoint, form, url)
+
+    def _play(self, game, endpoint, form, url):
+        step = int(form.get("step") or 0)
+        if endpoint == "answer":
+            return self._answer(game, form, step, url)
+        if endpoint == "exclude":
+            if game.proposed >= 0:
+                game.excluded.add(game.proposed)
+                game.scores[game.proposed] = -numpy.inf
+                game.proposed = -1
+            return self._step(game, step, step, url)
+        if endpoint == "choice":
+            del self._sessions[game.session]
+            return Response(200, WIN_PAGE.format(times=1).encode(), {"Content-Type": "text/html; charset=utf-8"}, url)
+        if game.history:
+            restored = game.history.pop()[0]
+            if game.question != restored:
+                # The question showing when the player went back was never answered, so it can be asked again.
+                game.asked.discard(game.question)
+            game.question = restored
+            game.scores = self.update(self._log_priors.copy(), game.history)
+            game.scores[list(game.excluded)] = -numpy.inf
+            game.proposed = -1
+        return self._question(game, max(0, step - 1), self._normalize(game.scores), url)
+
+    def _answer(self, game, form, step, url):
+        if game.question < 0:
+            # Every question has been asked, or the knowledge base has none: there is nothing to answer.
+            return Response(400, b"No question to answer.", {"Content-Type": "text/plain"}, url)
+        game.history.append((game.question, int(form.get("answer", 2))))
+        self.update(game.scores, game.history[-1:])
+        return self._step(game, step, int(form.get("step_last_proposition") or 0), url)
+
+    def _start(self, url):
+        game = _Game(str(uuid4()), str(self._random.randint(10 ** 8, 10 ** 10)), uuid4().hex[:10], self._log_priors.copy())
+        self._sessions[game.session] = game
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        game.question = self._next_question(game, self._normalize(game.scores))
+        if game.question >= 0:
+            game.asked.add(game.question)
+        question = self.knowledge.questions[game.question] if game.question >= 0 else ""
+        page = GAME_PAGE.format(question=question, session=game.session, signature=game.signature, identifiant=game.identifiant)
+        return Response(200, page.encode(), {"Content-Type": "text/html; charset=utf-8"}, url)
+
+    def _step(self, game, step, step_last_proposition, url):
+        probabilities = self._normalize(game.scores)
+        best = int(numpy.argmax(probabilities))
+        settings = self.settings
+        if probabilities[best] <= 0 or step + 1 >= settings.max_steps:
+            del self._sessions[game.session]
+            return json_response({"completion": "SOUNDLIKE"}, url)
+        if probabilities[best] >= settings.threshold or step + 1 - step_last_proposition >= settings.propose_after or len(game.asked) >= len(self.knowledge.questions):
+            game.proposed = best
+            name, description = self.knowledge.characters[best]
+            return json_response({
+                "completion": "OK",
+                "id_proposition": str(best),
+                "id_base_proposition": str(best),
+                "valide_contrainte": "1",
+                "name_proposition": name,
+                "description_proposition": description,
+                "flag_photo": 0,
+                "photo": "",
+                "pseudo": "local",
+                "nb_elements": 1,
+            }, url)
+        game.question = self._next_question(game, probabilities)
+        if game.question >= 0:
+            game.asked.add(game.question)
+        return self._question(game, step + 1, probabilities, url)
+
+    def _question(self, game, step, probabilities, url):
+        progression = float(probabilities.max()) * 100 if probabilities.size else 0.0
+        return json_response({
+            "completion": "OK",
+            "akitude": akitude(progression),
+            "step": str(step),
+            "progression": f"{progression:.5f}",
+            "question_id": str(game.question),
+            "question": self.knowledge.questions[game.question],
+        }, url)
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+def _entropy(probabilities):
+    probabilities = numpy.clip(probabilities, 1e-9, 1 - 1e-9)
+    return -(probabilities * numpy.log2(probabilities) + (1 - probabilities) * numpy.log2(1 - probabilities))
+
+
+class EngineTransport:
+    """
+    A `Transport` answering every request in-process from a `LocalEngine`, for playing without akinator.com.
+
+    :param engine: The engine to use.
+    :type engine: LocalEngine
+    """
+
+    def __init__(self, engine: LocalEngine):
+        self.engine = engine
+
+    def post(self, url, data=None, **_kwargs):
+        """
+        Performs a POST request against the local engine.
+        """
+        return self.engine.handle(*route(url), parse_form(data))
+
+    def close(self):
+        """
+        Does nothing, as no resources are held.
+        """
+
+
+class AsyncEngineTransport:
+    """
+    An `AsyncTransport` answering every request in-process from a `LocalEngine`, on the event loop.
+
+    :param engine: The engine to use.
+    :type engine: LocalEngine
+    """
+
+    def __init__(self, engine: LocalEngine):
+        self.engine = engine
+
+    async def post(self, url, data=None, **_kwargs):
+        """
+        Performs a POST request against the local engine.
+        """
+        return self.engine.handle(*route(url), parse_form(data))
+
+    async def close(self):
+        """
+        Does nothing, as no resources are held.
+        """
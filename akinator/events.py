@@ -0,0 +1,109 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import NamedTuple, Optional, Union
+
+from .state import GameState
+
+
+class Question(NamedTuple):
+    """
+    Emitted when Akinator asks a question.
+    """
+
+    step: int
+    question: str
+    progression: float
+    akitude: str
+
+
+class Proposition(NamedTuple):
+    """
+    Emitted when Akinator proposes a character. Answer "yes" to choose it, or "no" to exclude it.
+    """
+
+    step: int
+    id: str
+    name: str
+    description: str
+    photo: Optional[str]
+
+
+class Win(NamedTuple):
+    """
+    Emitted when the proposed character has been chosen, ending the game.
+    """
+
+    name: Optional[str]
+    description: Optional[str]
+    message: str
+
+
+class Defeat(NamedTuple):
+    """
+    Emitted when Akinator gives up, ending the game.
+    """
+
+    message: str
+
+
+class Timeout(NamedTuple):
+    """
+    Emitted when the server reports that the session has timed out, ending the game.
+    """
+
+    step: int
+
+
+class Correction(NamedTuple):
+    """
+    Passed to the `on_correction` callback of an `UndoHistory` when the server disagrees with a step restored locally
+    by `back`. The client then shows the question reported by the server, described by this event.
+    """
+
+    step: int
+    question: str
+    progression: float
+    akitude: str
+    expected_step: int
+    expected_question: str
+
+
+Event = Union[Question, Proposition, Win, Defeat, Timeout]
+
+
+def event_from_state(state: GameState) -> Event:
+    """
+    Returns the event describing the current position of a game.
+
+    :param state: The state of the game.
+    :type state: GameState
+    """
+    if state.finished:
+        if state.win:
+            return Win(state.name_proposition, state.description_proposition, state.question)
+        return Defeat(state.question)
+    if state.win:
+        return Proposition(state.step, state.id_proposition, state.name_proposition, state.description_proposition, state.photo)
+    return Question(state.step, state.question, state.progression, state.akitude)
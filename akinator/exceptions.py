@@ -22,6 +22,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from typing import Optional
+
 
 class AkinatorException(Exception):
     """Base exception for Akinator-related errors."""
@@ -45,3 +47,38 @@ class InvalidThemeError(AkinatorException):
     """Raised when an invalid theme is specified."""
     def __init__(self, message: str = "Invalid theme specified."):
         super().__init__(message)
+
+class PoolTimeoutError(AkinatorException):
+    """Raised when no pooled session becomes available in time."""
+    def __init__(self, message: str = "Timed out waiting for a pooled session."):
+        super().__init__(message)
+
+class TransientError(AkinatorException, RuntimeError):
+    """Raised when a request keeps failing with a transient error, such as a 429, a 503 or a connection error, after every retry."""
+    def __init__(self, message: str = "The request failed with a transient error.", status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+    def __reduce__(self):
+        # Keeps the status code when the error is sent back from a shard process.
+        return type(self), (str(self), self.status_code)
+
+class CircuitOpenError(AkinatorException, RuntimeError):
+    """Raised when requests to a host are shed because too many of them have failed recently."""
+    def __init__(self, message: str = "Too many requests have failed recently. Please try again later."):
+        super().__init__(message)
+
+class ReplayError(AkinatorException):
+    """Raised when a replayed request has no matching recorded response."""
+    def __init__(self, message: str = "No recorded response matches the request."):
+        super().__init__(message)
+
+class SessionTimeoutError(AkinatorException, RuntimeError):
+    """Raised when the server reports that the game session has timed out."""
+    def __init__(self, message: str = "The session has timed out. Please start a new game."):
+        super().__init__(message)
+
+class ExecutorSaturatedError(AkinatorException, RuntimeError):
+    """Raised when a request is rejected because the queue of a bounded executor is full."""
+    def __init__(self, message: str = "Too many requests are already queued. Please try again later."):
+        super().__init__(message)
@@ -0,0 +1,221 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Callable, Literal, Optional, TypeVar
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+import asyncio
+
+from .exceptions import ExecutorSaturatedError
+from .metrics import MetricsSink, get_metrics
+
+T = TypeVar("T")
+
+POLICIES = ("raise", "wait")
+
+
+class BoundedExecutor:
+    """
+    A named thread pool running blocking calls, such as `CloudScraper` requests, off the event loop, with a bounded queue.
+
+    `AsyncCloudScraper` runs its requests on one instead of the loop's default executor, so that a burst of Akinator
+    traffic cannot starve the other users of `asyncio.to_thread`, and the other way around. Pass the same executor to
+    several transports to bound their combined load.
+
+    Once `max_workers` calls are running and `max_queue` more are waiting, new calls are rejected with
+    `ExecutorSaturatedError` under the "raise" policy, or wait for a slot without holding a thread under the "wait"
+    policy. With `metrics`, the time each call spends waiting for a thread is recorded as "queue_wait" and the time it
+    runs as "execution", both tagged with the name of the executor.
+
+    :param max_workers: The maximum number of threads. Defaults to 16.
+    :type max_workers: int
+    :param max_queue: The maximum number of calls waiting for a thread. Defaults to no limit.
+    :type max_queue: Optional[int]
+    :param policy: What to do with calls once the queue is full: "raise" or "wait". Defaults to "raise".
+    :type policy: Literal["raise", "wait"]
+    :param name: The name of the executor, used as the prefix of its threads and as a metrics tag. Defaults to "akinator-cloudscraper".
+    :type name: str
+    :param metrics: An optional `MetricsSink` recording the queue wait and execution times.
+    :type metrics: Optional[MetricsSink]
+
+    :ivar submitted: The number of calls accepted.
+    :ivar rejected: The number of calls rejected under the "raise" policy.
+    :ivar completed: The number of calls finished, failed or cancelled.
+    """
+
+    def __init__(self, max_workers: int = 16, *, max_queue: Optional[int] = None, policy: Literal["raise", "wait"] = "raise", name: str = "akinator-cloudscraper", metrics: Optional[MetricsSink] = None):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue cannot be negative.")
+        if policy not in POLICIES:
+            raise ValueError(f"Unsupported policy: {policy}. Supported policies: {', '.join(POLICIES)}")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.policy = policy
+        self.name = name
+        self.metrics = get_metrics(metrics)
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self._pending = 0
+        self._running = 0
+        self._waiters = deque()
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """
+        Returns the maximum number of calls running or queued at once, or None if the queue is unbounded.
+        """
+        return None if self.max_queue is None else self.max_workers + self.max_queue
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+            return self._executor
+
+    async def _acquire(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self.capacity is None or self._pending < self.capacity:
+                    self._pending += 1
+                    self.submitted += 1
+                    return
+                if self.policy == "raise":
+                    self.rejected += 1
+                    raise ExecutorSaturatedError(f"{self.name} already has {self._pending} requests running or queued.")
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    with self._lock:
+                        self._wake_next()
+                raise
+
+    def _wake_next(self):
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            try:
+                loop.call_soon_threadsafe(self._wake, waiter)
+                return
+            except RuntimeError:
+                continue
+
+    def _wake(self, waiter):
+        if waiter.done():
+            with self._lock:
+                self._wake_next()
+        else:
+            waiter.set_result(None)
+
+    def _release(self, _):
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+            self._wake_next()
+
+    async def run(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Runs a blocking callable in a thread of the executor and returns its result.
+
+        :param function: The callable to run.
+        :type function: Callable[..., T]
+        """
+        await self._acquire()
+        submitted = perf_counter()
+
+        def call():
+            started = perf_counter()
+            with self._lock:
+                self._running += 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                finished = perf_counter()
+                with self._lock:
+                    self._running -= 1
+                if self.metrics.enabled:
+                    self.metrics.timing("queue_wait", started - submitted, executor=self.name)
+                    self.metrics.timing("execution", finished - started, executor=self.name)
+
+        try:
+            future = self._get_executor().submit(call)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        """
+        Returns the number of calls running and queued, and the counters.
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "waiting": sum(not waiter.done() for _, waiter in self._waiters),
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "completed": self.completed,
+            }
+
+    def shutdown(self, wait: bool = False):
+        """
+        Shuts the threads down, cancelling the queued calls. The executor starts new threads if it is used again.
+
+        :param wait: Whether to wait for the running calls to finish. Defaults to False.
+        :type wait: bool
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_DEFAULT_EXECUTOR: Optional[BoundedExecutor] = None
+
+
+def get_default_executor() -> BoundedExecutor:
+    """
+    Returns the process-wide `BoundedExecutor` used by `AsyncCloudScraper`, creating it on first use. It runs up to 16
+    requests at once, queues up to 256 more, and makes the rest wait for a slot.
+    """
+    global _DEFAULT_EXECUTOR # pylint: disable=global-statement
+    if _DEFAULT_EXECUTOR is None:
+        _DEFAULT_EXECUTOR = BoundedExecutor(16, max_queue=256, policy="wait")
+    return _DEFAULT_EXECUTOR
@@ -0,0 +1,367 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from time import monotonic
+from threading import Event, Lock, Thread
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+
+from .client import Client
+from .constants import LANG_MAP
+from .async_client import AsyncClient
+
+
+def _key(language: str, child_mode: bool, theme: str) -> Tuple[str, bool, str]:
+    return LANG_MAP.get(language.lower(), language.lower()), child_mode, theme
+
+
+def _discard(clients: Iterable[Client]):
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+class GamePool:
+    """
+    A pool keeping already-started games warm, so that a new game can be handed out without waiting for `start_game`.
+
+    Games are kept per (language, child mode, theme), refilled in background threads, and discarded once they have
+    been idle for `max_idle` seconds, well before the server times the session out.
+
+    :param factory: A callable creating a new `Client`. Defaults to `Client`.
+    :type factory: Optional[Callable[[], Client]]
+    :param size: The number of warm games kept per key. Defaults to 2.
+    :type size: int
+    :param max_idle: How long, in seconds, a warm game is kept before being discarded. Defaults to 300.
+    :type max_idle: float
+    :param workers: The number of threads used to start games. Defaults to 4.
+    :type workers: int
+    """
+
+    def __init__(self, factory: Optional[Callable[[], Client]] = None, *, size: int = 2, max_idle: float = 300.0, workers: int = 4):
+        self.factory = factory if factory else Client
+        self.size = size
+        self.max_idle = max_idle
+
+        self._lock = Lock()
+        self._games: Dict[tuple, deque] = {}
+        self._pending: Dict[tuple, int] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="akinator-game-pool")
+        self._closed = Event()
+        self._sweeper = Thread(target=self._sweep, name="akinator-game-pool-sweeper", daemon=True)
+        self._sweeper.start()
+
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.failures = 0
+
+    def _start(self, key: tuple) -> Client:
+        client = self.factory()
+        try:
+            client.start_game(language=key[0], child_mode=key[1], theme=key[2])
+        except Exception:
+            _discard([client])
+            raise
+        return client
+
+    def _refill_one(self, key: tuple):
+        try:
+            client = self._start(key)
+        except Exception:
+            with self._lock:
+                self._pending[key] -= 1
+                self.failures += 1
+            return
+        with self._lock:
+            self._pending[key] -= 1
+            closed = self._closed.is_set()
+            if not closed:
+                self._games.setdefault(key, deque()).append((client, monotonic()))
+        if closed:
+            _discard([client])
+
+    def _refill(self, key: tuple):
+        # Submitted under the lock `close` takes to shut the executor down, so that no refill is submitted after it.
+        with self._lock:
+            missing = self.size - len(self._games.get(key, ())) - self._pending.get(key, 0)
+            if self._closed.is_set() or missing <= 0:
+                return
+            self._pending[key] = self._pending.get(key, 0) + missing
+            for _ in range(missing):
+                self._executor.submit(self._refill_one, key)
+
+    def _evict(self) -> int:
+        deadline = monotonic() - self.max_idle
+        with self._lock:
+            evicted = []
+            for games in self._games.values():
+                while games and games[0][1] <= deadline:
+                    evicted.append(games.popleft()[0])
+            self.evicted += len(evicted)
+            keys = list(self._games)
+        _discard(evicted)
+        for key in keys:
+            self._refill(key)
+        return len(evicted)
+
+    def _sweep(self):
+        while not self._closed.wait(self.max_idle / 4):
+            self._evict()
+
+    def warm(self, *, language: str = "en", child_mode: bool = False, theme: str = "c"):
+        """
+        Starts keeping warm games for the given language, child mode and theme.
+
+        :param language: The language of the games. Defaults to "en".
+        :type language: str
+        :param child_mode: Whether child mode is enabled. Defaults to False.
+        :type child_mode: bool
+        :param theme: The theme of the games. Defaults to "c".
+        :type theme: str
+        """
+        key = _key(language, child_mode, theme)
+        with self._lock:
+            self._games.setdefault(key, deque())
+        self._refill(key)
+
+    def get(self, *, language: str = "en", child_mode: bool = False, theme: str = "c") -> Client:
+        """
+        Returns a started game, taken from the pool if one is warm, or started on the spot otherwise. The pool is refilled in the background.
+
+        :param language: The language of the game. Defaults to "en".
+        :type language: str
+        :param child_mode: Whether child mode is enabled. Defaults to False.
+        :type child_mode: bool
+        :param theme: The theme of the game. Defaults to "c".
+        :type theme: str
+        """
+        key = _key(language, child_mode, theme)
+        deadline = monotonic() - self.max_idle
+        client = None
+        stale = []
+        with self._lock:
+            games = self._games.setdefault(key, deque())
+            while games:
+                candidate, started = games.pop()
+                if started > deadline:
+                    client = candidate
+                    break
+                stale.append(candidate)
+            self.evicted += len(stale)
+            if client is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        _discard(stale)
+        self._refill(key)
+        return client if client is not None else self._start(key)
+
+    def available(self, *, language: str = "en", child_mode: bool = False, theme: str = "c") -> int:
+        """
+        Returns the number of warm games for the given language, child mode and theme.
+        """
+        with self._lock:
+            return len(self._games.get(_key(language, child_mode, theme), ()))
+
+    def close(self):
+        """
+        Stops refilling the pool, cancels queued refills and closes every warm game.
+        """
+        with self._lock:
+            self._closed.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            games = [client for entries in self._games.values() for client, _ in entries]
+            self._games.clear()
+        _discard(games)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncGamePool:
+    """
+    An asynchronous pool keeping already-started games warm, refilled by tasks on the running event loop.
+
+    :param factory: A callable creating a new `AsyncClient`. Defaults to `AsyncClient`.
+    :type factory: Optional[Callable[[], AsyncClient]]
+    :param size: The number of warm games kept per key. Defaults to 2.
+    :type size: int
+    :param max_idle: How long, in seconds, a warm game is kept before being discarded. Defaults to 300.
+    :type max_idle: float
+    """
+
+    def __init__(self, factory: Optional[Callable[[], AsyncClient]] = None, *, size: int = 2, max_idle: float = 300.0):
+        self.factory = factory if factory else AsyncClient
+        self.size = size
+        self.max_idle = max_idle
+
+        self._games: Dict[tuple, deque] = {}
+        self._pending: Dict[tuple, int] = {}
+        self._tasks = set()
+        self._closing = set()
+        self._sweeper = None
+        self._closed = False
+
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.failures = 0
+
+    async def _start(self, key: tuple) -> AsyncClient:
+        client = self.factory()
+        try:
+            await client.start_game(language=key[0], child_mode=key[1], theme=key[2])
+        except BaseException:
+            self._discard([client])
+            raise
+        return client
+
+    async def _refill_one(self, key: tuple):
+        try:
+            client = await self._start(key)
+        except Exception:
+            self.failures += 1
+            return
+        finally:
+            self._pending[key] -= 1
+        if self._closed:
+            self._discard([client])
+            return
+        self._games.setdefault(key, deque()).append((client, monotonic()))
+
+    def _spawn(self, coroutine, tasks: Optional[set] = None):
+        tasks = self._tasks if tasks is None else tasks
+        task = asyncio.get_running_loop().create_task(coroutine)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    def _discard(self, clients: Iterable[AsyncClient]):
+        for client in clients:
+            self._spawn(client.close(), self._closing)
+
+    def _refill(self, key: tuple):
+        missing = self.size - len(self._games.get(key, ())) - self._pending.get(key, 0)
+        if self._closed or missing <= 0:
+            return
+        self._pending[key] = self._pending.get(key, 0) + missing
+        for _ in range(missing):
+            self._spawn(self._refill_one(key))
+        if self._sweeper is None:
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep())
+
+    def _evict(self) -> int:
+        deadline = monotonic() - self.max_idle
+        evicted = []
+        for games in self._games.values():
+            while games and games[0][1] <= deadline:
+                evicted.append(games.popleft()[0])
+        self.evicted += len(evicted)
+        self._discard(evicted)
+        for key in list(self._games):
+            self._refill(key)
+        return len(evicted)
+
+    async def _sweep(self):
+        while not self._closed:
+            await asyncio.sleep(self.max_idle / 4)
+            self._evict()
+
+    def warm(self, *, language: str = "en", child_mode: bool = False, theme: str = "c"):
+        """
+        Starts keeping warm games for the given language, child mode and theme. Must be called from a running event loop.
+
+        :param language: The language of the games. Defaults to "en".
+        :type language: str
+        :param child_mode: Whether child mode is enabled. Defaults to False.
+        :type child_mode: bool
+        :param theme: The theme of the games. Defaults to "c".
+        :type theme: str
+        """
+        key = _key(language, child_mode, theme)
+        self._games.setdefault(key, deque())
+        self._refill(key)
+
+    async def get(self, *, language: str = "en", child_mode: bool = False, theme: str = "c") -> AsyncClient:
+        """
+        Returns a started game, taken from the pool if one is warm, or started on the spot otherwise. The pool is refilled in the background.
+
+        :param language: The language of the game. Defaults to "en".
+        :type language: str
+        :param child_mode: Whether child mode is enabled. Defaults to False.
+        :type child_mode: bool
+        :param theme: The theme of the game. Defaults to "c".
+        :type theme: str
+        """
+        key = _key(language, child_mode, theme)
+        deadline = monotonic() - self.max_idle
+        games = self._games.setdefault(key, deque())
+        client = None
+        stale = []
+        while games:
+            candidate, started = games.pop()
+            if started > deadline:
+                client = candidate
+                break
+            stale.append(candidate)
+        self.evicted += len(stale)
+        self._discard(stale)
+        self._refill(key)
+        if client is None:
+            self.misses += 1
+            return await self._start(key)
+        self.hits += 1
+        return client
+
+    def available(self, *, language: str = "en", child_mode: bool = False, theme: str = "c") -> int:
+        """
+        Returns the number of warm games for the given language, child mode and theme.
+        """
+        return len(self._games.get(_key(language, child_mode, theme), ()))
+
+    async def close(self):
+        """
+        Stops refilling the pool, cancels pending refills and closes every warm game.
+        """
+        self._closed = True
+        tasks = list(self._tasks) + ([self._sweeper] if self._sweeper else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._discard(client for entries in self._games.values() for client, _ in entries)
+        self._games.clear()
+        await asyncio.gather(*self._closing, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,243 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+from threading import Lock
+
+
+class Histogram:
+    """
+    A log-linear histogram in the style of HdrHistogram, recording durations with a bounded relative error.
+
+    Values are recorded in microseconds. Values below `2 ** precision` are counted exactly, and larger values are
+    counted in buckets whose width is at most `2 ** -(precision - 1)` of their value, so that percentiles are accurate
+    to within that relative error whatever the range of the values.
+
+    :param precision: The number of significant bits kept per value. Defaults to 7, i.e. a relative error under 1.6%.
+    :type precision: int
+    """
+
+    def __init__(self, precision: int = 7):
+        self.precision = precision
+        self._half = 1 << (precision - 1)
+        self._lock = Lock()
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.precision
+        if shift <= 0:
+            return value
+        return (1 << self.precision) + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _lowest(self, index: int) -> int:
+        if index < 1 << self.precision:
+            return index
+        shift, mantissa = divmod(index - (1 << self.precision), self._half)
+        return (mantissa + self._half) << (shift + 1)
+
+    def record(self, seconds: float):
+        """
+        Records a duration.
+
+        :param seconds: The duration, in seconds.
+        :type seconds: float
+        """
+        value = max(0, int(seconds * 1e6))
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None or value < self.min else self.min
+            self.max = value if self.max is None or value > self.max else self.max
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns the given percentile of the recorded durations, in seconds, or 0 if nothing has been recorded.
+
+        :param percentile: The percentile, between 0 and 100.
+        :type percentile: float
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, round(percentile / 100 * self.count))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    return min(self._lowest(index), self.max) / 1e6
+            return self.max / 1e6
+
+    @property
+    def mean(self) -> float:
+        """
+        Returns the mean of the recorded durations, in seconds.
+        """
+        return self.total / self.count / 1e6 if self.count else 0.0
+
+    def merge(self, other: "Histogram"):
+        """
+        Adds the values recorded by another histogram with the same precision.
+
+        :param other: The histogram to merge.
+        :type other: Histogram
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge histograms with different precisions.")
+        with other._lock: # pylint: disable=protected-access
+            counts = dict(other._counts) # pylint: disable=protected-access
+            count, total, low, high = other.count, other.total, other.min, other.max
+        if not count:
+            return
+        with self._lock:
+            for index, value in counts.items():
+                self._counts[index] = self._counts.get(index, 0) + value
+            self.count += count
+            self.total += total
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99, 99.9)) -> dict:
+        """
+        Returns the count, mean, maximum and given percentiles of the recorded durations, in seconds.
+
+        :param percentiles: The percentiles to report. Defaults to p50, p90, p99 and p99.9.
+        :type percentiles: Iterable[float]
+        """
+        summary = {"count": self.count, "mean": self.mean, "max": (self.max or 0) / 1e6}
+        for percentile in percentiles:
+            summary[f"p{percentile:g}"] = self.percentile(percentile)
+        return summary
+
+
+class MetricsSink:
+    """
+    The interface through which clients report timings. This base class discards everything.
+
+    Clients check `enabled` before timing anything, so the default sink costs a single attribute lookup per call.
+
+    Clients report the following timings:
+
+    - "request", tagged with `endpoint` ("game", "answer", "cancel_answer", "exclude" or "choice") and `language`, around each network call.
+    - "parse", tagged with `stage` ("start_page", "json" or "win_page") and `language`, around each parse step.
+    """
+
+    enabled = False
+
+    def timing(self, name: str, seconds: float, **tags):
+        """
+        Records a duration.
+
+        :param name: The name of the timing, e.g. "request".
+        :type name: str
+        :param seconds: The duration, in seconds.
+        :type seconds: float
+        :param tags: Tags qualifying the timing, e.g. `endpoint="answer"`.
+        """
+
+
+NULL_METRICS = MetricsSink()
+
+
+class HistogramMetrics(MetricsSink):
+    """
+    A `MetricsSink` keeping an in-process `Histogram` per timing name and set of tags.
+
+    :param precision: The precision of the histograms. Defaults to 7.
+    :type precision: int
+    """
+
+    enabled = True
+
+    def __init__(self, precision: int = 7):
+        self.precision = precision
+        self._lock = Lock()
+        self._histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+
+    def histogram(self, name: str, **tags) -> Histogram:
+        """
+        Returns the histogram of a timing name and set of tags, creating it on first use.
+
+        :param name: The name of the timing, e.g. "request".
+        :type name: str
+        :param tags: Tags qualifying the timing, e.g. `endpoint="answer"`.
+        """
+        key = (name, tuple(sorted(tags.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self.precision))
+        return histogram
+
+    def timing(self, name: str, seconds: float, **tags):
+        self.histogram(name, **tags).record(seconds)
+
+    def aggregate(self, name: str, **tags) -> Histogram:
+        """
+        Returns a histogram merging every histogram of a timing name whose tags include the given ones, e.g. every language of an endpoint.
+
+        :param name: The name of the timing, e.g. "request".
+        :type name: str
+        :param tags: The tags to filter on.
+        """
+        merged = Histogram(self.precision)
+        wanted = set(tags.items())
+        for (key_name, key_tags), histogram in list(self._histograms.items()):
+            if key_name == name and wanted <= set(key_tags):
+                merged.merge(histogram)
+        return merged
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99, 99.9)) -> Dict[str, dict]:
+        """
+        Returns the summary of every histogram, keyed by timing name and tags, e.g. "request endpoint=answer language=en".
+
+        :param percentiles: The percentiles to report. Defaults to p50, p90, p99 and p99.9.
+        :type percentiles: Iterable[float]
+        """
+        return {
+            " ".join([name, *(f"{key}={value}" for key, value in tags)]): histogram.summary(percentiles)
+            for (name, tags), histogram in sorted(self._histograms.items())
+        }
+
+    def reset(self):
+        """
+        Discards every histogram.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+
+def get_metrics(metrics: Optional[MetricsSink]) -> MetricsSink:
+    """
+    Returns the given sink, or the shared no-op sink if None.
+
+    :param metrics: The sink, if any.
+    :type metrics: Optional[MetricsSink]
+    """
+    return metrics if metrics is not None else NULL_METRICS
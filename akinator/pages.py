@@ -0,0 +1,123 @@
+"""MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from typing import Dict, Tuple
+from json import dumps
+from urllib.parse import parse_qsl, urlsplit
+
+from .constants import AKITUDES
+from .transport import Response
+
+# The pages and responses below mimic akinator.com closely enough for the clients to parse them. They are shared by
+# the offline stand-ins for the service: `LocalEngine` and the fakes of `akinator.testing`.
+
+GAME_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Akinator</title></head>
+<body>
+<div id="game_content">
+<div class="bubble-body"><p class="question-text" id="question-label">{question}</p></div>
+<div class="sub-bubble-propose"><p id="p-sub-bubble">I think of</p></div>
+</div>
+<script>
+$(function () {{
+    $('#session').val('{session}');
+    $('#signature').val('{signature}');
+    $('#identifiant').val('{identifiant}');
+}});
+</script>
+</body>
+</html>
+"""
+
+WIN_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<script>
+  let tokenDejaJoue = "I have already played";
+  let timesSelected = "{times}";
+</script>
+</head>
+<body>
+<div class="bubble-win"><span class="win-sentence">Great, I guessed right one more time!</span>
+<span class="times"><span id="timesselected"></span>
+        times</span></div>
+</body>
+</html>
+"""
+
+ENDPOINTS = ("game", "answer", "cancel_answer", "exclude", "choice")
+
+# The akitudes returned by /answer as the progression grows, one per 20%.
+PROGRESS_AKITUDES = AKITUDES[:5]
+
+
+def route(url: str) -> Tuple[str, str]:
+    """
+    Returns the language and endpoint of a request, from an akinator.com URL, e.g. `https://fr.akinator.com/answer`,
+    or from a local one, e.g. `http://127.0.0.1:8080/fr/answer`.
+
+    :param url: The requested URL.
+    :type url: str
+    """
+    parts = urlsplit(url)
+    path = parts.path.strip("/").split("/")
+    if len(path) == 2:
+        return path[0], path[1]
+    return (parts.hostname or "en").split(".")[0], path[-1]
+
+
+def parse_form(data) -> Dict[str, str]:
+    """
+    Returns the form data of a request, given as a mapping or URL-encoded, as strings.
+
+    :param data: The form data, if any.
+    """
+    if data is None:
+        return {}
+    if isinstance(data, (bytes, str)):
+        return dict(parse_qsl(data.decode() if isinstance(data, bytes) else data))
+    return {key: str(value) for key, value in dict(data).items()}
+
+
+def akitude(progression: float) -> str:
+    """
+    Returns the akitude shown at a progression.
+
+    :param progression: The progression, in percent.
+    :type progression: float
+    """
+    return PROGRESS_AKITUDES[min(len(PROGRESS_AKITUDES) - 1, int(progression // 20))]
+
+
+def json_response(data: dict, url: str) -> Response:
+    """
+    Returns a JSON response, as sent by the endpoints other than /game and /choice.
+
+    :param data: The payload.
+    :type data: dict
+    :param url: The requested URL.
+    :type url: str
+    """
+    return Response(200, dumps(data).encode(), {"Content-Type": "application/json"}, url)
@@ -0,0 +1,242 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, NamedTuple, Optional, Pattern, Sequence
+from re import compile as compile_pattern
+from time import perf_counter
+from codecs import getincrementaldecoder
+from threading import Lock
+
+STREAM_CHUNK_SIZE = 4096
+
+
+class Field(NamedTuple):
+    """
+    A field extracted from a page: a literal anchor locating it cheaply, and a pattern matched at the anchor.
+    """
+
+    name: str
+    anchor: str
+    pattern: Pattern
+
+
+class PageExtractor:
+    """
+    Extracts a fixed set of fields from a page.
+
+    Each field is located with `str.find` on its literal anchor and matched with its precompiled pattern at that position,
+    so the page is never scanned by the regular expression engine. As with `re.search`, the first match of every field
+    is returned. Extractors hold no per-page state and can be shared by concurrent clients.
+
+    :param fields: The fields to extract.
+    :type fields: Sequence[Field]
+
+    :ivar count: The number of pages parsed.
+    :ivar total_time: The cumulative time spent parsing, in seconds.
+    :ivar last_time: The time spent parsing the last page, in seconds.
+    """
+
+    def __init__(self, fields: Sequence[Field]):
+        self.fields = tuple(fields)
+        self.count = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+        self._lock = Lock()
+
+    @staticmethod
+    def _find(field: Field, text: str, start: int, end: Optional[int] = None):
+        end = len(text) if end is None else end
+        position = text.find(field.anchor, start, end)
+        while position != -1:
+            match = field.pattern.match(text, position, end)
+            if match:
+                return match
+            position = text.find(field.anchor, position + 1, end)
+        return None
+
+    def _record(self, elapsed: float):
+        with self._lock:
+            self.last_time = elapsed
+            self.total_time += elapsed
+            self.count += 1
+
+    def extract(self, text: str) -> Dict[str, Optional[str]]:
+        """
+        Extracts every field from a page. Fields which cannot be found are mapped to None.
+
+        :param text: The page to parse.
+        :type text: str
+        """
+        started = perf_counter()
+        values = {}
+        for field in self.fields:
+            match = self._find(field, text, 0)
+            values[field.name] = match.group(1) if match else None
+        self._record(perf_counter() - started)
+        return values
+
+    def stream(self, encoding: Optional[str] = None) -> "StreamExtraction":
+        """
+        Returns an incremental extraction, fed with the body of a page chunk by chunk.
+
+        :param encoding: The encoding of byte chunks. Defaults to "utf-8".
+        :type encoding: Optional[str]
+        """
+        return StreamExtraction(self, encoding)
+
+    def extract_response(self, response, chunk_size: int = STREAM_CHUNK_SIZE) -> Dict[str, Optional[str]]:
+        """
+        Extracts every field from a response opened with `stream=True`, and closes it as soon as every field is found, without downloading the rest of the body.
+
+        :param response: A streamed response exposing `iter_content` and `close`.
+        :param chunk_size: The size of the chunks read from the response. Defaults to 4096.
+        :type chunk_size: int
+        """
+        extraction = self.stream(getattr(response, "encoding", None))
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if extraction.feed(chunk):
+                    break
+        finally:
+            response.close()
+        return extraction.close()
+
+    async def extract_async_response(self, response, chunk_size: int = STREAM_CHUNK_SIZE) -> Dict[str, Optional[str]]:
+        """
+        An asynchronous equivalent of `extract_response`, for responses exposing `aiter_content`.
+
+        :param response: A streamed response exposing `aiter_content` and `close`.
+        :param chunk_size: The size of the chunks read from the response. Defaults to 4096.
+        :type chunk_size: int
+        """
+        extraction = self.stream(getattr(response, "encoding", None))
+        try:
+            async for chunk in response.aiter_content(chunk_size):
+                if extraction.feed(chunk):
+                    break
+        finally:
+            response.close()
+        return extraction.close()
+
+    def stats(self) -> dict:
+        """
+        Returns the number of pages parsed, along with the total, mean and last parse time in seconds.
+        """
+        with self._lock:
+            return {
+                "count": self.count,
+                "total_time": self.total_time,
+                "mean_time": self.total_time / self.count if self.count else 0.0,
+                "last_time": self.last_time,
+            }
+
+
+class StreamExtraction:
+    """
+    An incremental extraction created by `PageExtractor.stream`.
+
+    Only complete lines are searched, so that a greedy pattern is never matched against a truncated line, and each
+    field resumes its search where the previous chunk left off.
+
+    :param extractor: The extractor whose fields are extracted.
+    :type extractor: PageExtractor
+    :param encoding: The encoding of byte chunks. Defaults to "utf-8".
+    :type encoding: Optional[str]
+
+    :ivar consumed: The number of characters received so far.
+    """
+
+    def __init__(self, extractor: PageExtractor, encoding: Optional[str] = None):
+        self.extractor = extractor
+        self.values: Dict[str, Optional[str]] = {field.name: None for field in extractor.fields}
+        self.consumed = 0
+        self._decoder = getincrementaldecoder(encoding if encoding else "utf-8")(errors="replace")
+        self._remaining = list(extractor.fields)
+        self._resume = {field.name: 0 for field in extractor.fields}
+        self._buffer = ""
+        self._scanned = 0
+        self._elapsed = 0.0
+
+    @property
+    def done(self) -> bool:
+        """
+        Returns whether every field has been found.
+        """
+        return not self._remaining
+
+    def _scan(self, end: int):
+        for field in list(self._remaining):
+            start = self._resume[field.name]
+            match = self.extractor._find(field, self._buffer, start, end) # pylint: disable=protected-access
+            if match:
+                self.values[field.name] = match.group(1)
+                self._remaining.remove(field)
+            else:
+                pending = self._buffer.find(field.anchor, start, end)
+                self._resume[field.name] = pending if pending != -1 else end
+        self._scanned = end
+
+    def feed(self, chunk) -> bool:
+        """
+        Feeds the next chunk of the page, as bytes or text, and returns whether every field has been found.
+
+        :param chunk: The next chunk of the page.
+        """
+        started = perf_counter()
+        text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        self.consumed += len(text)
+        self._buffer += text
+        end = self._buffer.rfind("\n") + 1
+        if end > self._scanned:
+            self._scan(end)
+        self._elapsed += perf_counter() - started
+        return self.done
+
+    def close(self) -> Dict[str, Optional[str]]:
+        """
+        Finishes the extraction, searching the last incomplete line if needed, and returns the extracted fields.
+        """
+        started = perf_counter()
+        if self._remaining:
+            self._buffer += self._decoder.decode(b"", final=True)
+            self._scan(len(self._buffer))
+        self._elapsed += perf_counter() - started
+        self.extractor._record(self._elapsed) # pylint: disable=protected-access
+        return self.values
+
+
+START_PAGE = PageExtractor([
+    Field("session_id", "#session'", compile_pattern(r"#session'\).val\('(.+?)'\)")),
+    Field("signature", "#signature'", compile_pattern(r"#signature'\).val\('(.+?)'\)")),
+    Field("identifiant", "#identifiant'", compile_pattern(r"#identifiant'\).val\('(.+?)'\)")),
+    Field("question", '<div class="bubble-body">', compile_pattern(r'<div class="bubble-body"><p class="question-text" id="question-label">(.+)</p></div>')),
+    Field("proposition", '<div class="sub-bubble-propose">', compile_pattern(r'<div class="sub-bubble-propose"><p id="p-sub-bubble">([\w\s]+)</p></div>')),
+])
+
+WIN_PAGE = PageExtractor([
+    Field("win_message", '<span class="win-sentence">', compile_pattern(r'<span class="win-sentence">(.+?)<\/span>')),
+    Field("already_played", "let tokenDejaJoue", compile_pattern(r'let tokenDejaJoue = "([\w\s]+)";')),
+    Field("times_selected", "let timesSelected", compile_pattern(r'let timesSelected = "(\d+)";')),
+    Field("times", '<span id="timesselected">', compile_pattern(r'<span id="timesselected"><\/span>\s+([\w\s]+)<\/span>')),
+])
@@ -0,0 +1,438 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Callable, Dict, Optional
+from time import monotonic
+from threading import Condition, Lock
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from urllib.parse import urlsplit
+from asyncio import CancelledError, TimeoutError as AsyncTimeoutError, ensure_future, get_running_loop, shield, to_thread, wait_for
+from cloudscraper import CloudScraper, create_scraper
+from requests import RequestException
+
+from .exceptions import PoolTimeoutError
+from .executor import BoundedExecutor
+
+
+def _wake(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class SessionPool:
+    """
+    A thread-safe pool of `CloudScraper` sessions keyed by host, so that TCP, TLS and Cloudflare handshakes are amortised across games.
+
+    :param max_per_host: The maximum number of sessions, idle or borrowed, kept per host. Defaults to 4.
+    :type max_per_host: int
+    :param idle_timeout: How long, in seconds, an idle session is kept before being evicted. Defaults to 60.
+    :type idle_timeout: float
+    :param acquire_timeout: How long, in seconds, to wait for a free session before raising `PoolTimeoutError`. Defaults to waiting forever.
+    :type acquire_timeout: Optional[float]
+    :param health_check: An optional callable receiving an idle session before it is handed out. Sessions for which it returns False are discarded.
+    :type health_check: Optional[Callable[[CloudScraper], bool]]
+    :param factory: An optional callable creating new sessions. Defaults to `cloudscraper.create_scraper`.
+    :type factory: Optional[Callable[[], CloudScraper]]
+    """
+
+    def __init__(self, *, max_per_host: int = 4, idle_timeout: float = 60.0, acquire_timeout: Optional[float] = None, health_check: Optional[Callable[[CloudScraper], bool]] = None, factory: Optional[Callable[[], CloudScraper]] = None):
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be at least 1.")
+
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_check = health_check
+        self.factory = factory if factory else create_scraper
+
+        self._lock = Lock()
+        self._conditions: Dict[str, Condition] = {}
+        self._idle: Dict[str, deque] = {}
+        self._sizes: Dict[str, int] = {}
+        self._waiters: Dict[str, deque] = {}
+        self._counters = {"created": 0, "reused": 0, "evicted": 0, "discarded": 0}
+
+    def _evict(self, host: str, now: float):
+        idle = self._idle.get(host)
+        expired = []
+        while idle and now - idle[0][1] > self.idle_timeout:
+            expired.append(idle.popleft()[0])
+        self._sizes[host] = self._sizes.get(host, 0) - len(expired)
+        self._counters["evicted"] += len(expired)
+        if expired:
+            self._notify(host, len(expired))
+        return expired
+
+    def _reserve(self, host: str, expired: list):
+        expired.extend(self._evict(host, monotonic()))
+        if self._idle.get(host):
+            return True, self._idle[host].pop()[0]
+        if self._sizes.get(host, 0) < self.max_per_host:
+            self._sizes[host] = self._sizes.get(host, 0) + 1
+            return True, None
+        return False, None
+
+    def _checkout(self, host: str, session: Optional[CloudScraper], expired: list) -> Optional[CloudScraper]:
+        for stale in expired:
+            stale.close()
+
+        if session is None:
+            try:
+                session = self.factory()
+            except Exception:
+                self._forget(host)
+                raise
+            with self._lock:
+                self._counters["created"] += 1
+            return session
+
+        if self.health_check is None or self.health_check(session):
+            with self._lock:
+                self._counters["reused"] += 1
+            return session
+
+        self.release(host, session, discard=True)
+        return None
+
+    def _condition(self, host: str) -> Condition:
+        # One condition per host, all sharing the pool's lock, so that a session released for a host never wakes a
+        # thread waiting for another one instead of a thread waiting for that host.
+        condition = self._conditions.get(host)
+        if condition is None:
+            condition = self._conditions[host] = Condition(self._lock)
+        return condition
+
+    def _notify(self, host: Optional[str] = None, count: Optional[int] = None):
+        for key in [host] if host is not None else list(self._conditions):
+            if count is None:
+                self._condition(key).notify_all()
+            else:
+                self._condition(key).notify(count)
+        for key in [host] if host is not None else list(self._waiters):
+            waiters = self._waiters.get(key, ())
+            for _ in range(len(waiters) if count is None else min(count, len(waiters))):
+                loop, waiter = waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_wake, waiter)
+                except RuntimeError:
+                    pass
+
+    def _abandon(self, host: str, entry: tuple):
+        with self._lock:
+            if entry in self._waiters.get(host, ()):
+                self._waiters[host].remove(entry)
+            else:
+                self._notify(host, 1)
+
+    def acquire(self, host: str) -> CloudScraper:
+        """
+        Borrows a session for the given host, creating one if the host is below its limit.
+
+        :param host: The host the session will talk to, e.g. "en.akinator.com".
+        :type host: str
+        """
+        deadline = None if self.acquire_timeout is None else monotonic() + self.acquire_timeout
+        while True:
+            expired = []
+            with self._lock:
+                ready, session = self._reserve(host, expired)
+                while not ready:
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise PoolTimeoutError(f"Timed out waiting for a pooled session for {host}.")
+                    self._condition(host).wait(remaining)
+                    ready, session = self._reserve(host, expired)
+
+            session = self._checkout(host, session, expired)
+            if session is not None:
+                return session
+
+    async def acquire_async(self, host: str) -> CloudScraper:
+        """
+        Borrows a session for the given host like `acquire`, but waits for a free session on the event loop instead of blocking a thread.
+
+        :param host: The host the session will talk to, e.g. "en.akinator.com".
+        :type host: str
+        """
+        loop = get_running_loop()
+        deadline = None if self.acquire_timeout is None else monotonic() + self.acquire_timeout
+        while True:
+            expired = []
+            with self._lock:
+                ready, session = self._reserve(host, expired)
+                if not ready:
+                    waiter = loop.create_future()
+                    entry = (loop, waiter)
+                    self._waiters.setdefault(host, deque()).append(entry)
+
+            if ready:
+                checkout = ensure_future(to_thread(self._checkout, host, session, expired))
+                try:
+                    session = await shield(checkout)
+                except CancelledError:
+                    checkout.add_done_callback(partial(self._orphaned, host))
+                    raise
+                if session is not None:
+                    return session
+                continue
+
+            for stale in expired:
+                stale.close()
+            remaining = None if deadline is None else deadline - monotonic()
+            try:
+                await wait_for(waiter, remaining)
+            except AsyncTimeoutError as e:
+                self._abandon(host, entry)
+                raise PoolTimeoutError(f"Timed out waiting for a pooled session for {host}.") from e
+            except BaseException:
+                self._abandon(host, entry)
+                raise
+
+    def _orphaned(self, host: str, done):
+        if not done.cancelled() and done.exception() is None and done.result() is not None:
+            self.release(host, done.result())
+
+    def _forget(self, host: str):
+        with self._lock:
+            self._sizes[host] -= 1
+            self._notify(host, 1)
+
+    def release(self, host: str, session: CloudScraper, *, discard: bool = False):
+        """
+        Returns a borrowed session to the pool.
+
+        :param host: The host the session was borrowed for.
+        :type host: str
+        :param session: The session to return.
+        :type session: CloudScraper
+        :param discard: Whether to close the session instead of keeping it, e.g. after a connection error. Defaults to False.
+        :type discard: bool
+        """
+        if discard:
+            session.close()
+            with self._lock:
+                self._counters["discarded"] += 1
+            self._forget(host)
+            return
+
+        with self._lock:
+            self._idle.setdefault(host, deque()).append((session, monotonic()))
+            self._notify(host, 1)
+
+    @contextmanager
+    def borrow(self, host: str):
+        """
+        A context manager borrowing a session for the given host. The session is discarded if the body raises a `requests` error.
+
+        :param host: The host the session will talk to.
+        :type host: str
+        """
+        session = self.acquire(host)
+        try:
+            yield session
+        except RequestException:
+            self.release(host, session, discard=True)
+            raise
+        except Exception:
+            self.release(host, session)
+            raise
+        self.release(host, session)
+
+    def evict_idle(self) -> int:
+        """
+        Closes every session that has been idle for longer than `idle_timeout`, and returns how many were closed.
+        """
+        with self._lock:
+            now = monotonic()
+            expired = [session for host in list(self._idle) for session in self._evict(host, now)]
+        for session in expired:
+            session.close()
+        return len(expired)
+
+    def stats(self) -> dict:
+        """
+        Returns the pool counters, along with the number of idle and open sessions per host.
+        """
+        with self._lock:
+            return {
+                **self._counters,
+                "idle": {host: len(idle) for host, idle in self._idle.items()},
+                "open": dict(self._sizes),
+            }
+
+    def close(self):
+        """
+        Closes every idle session. Borrowed sessions are closed when they are released with `discard=True`, or left to the borrower.
+        """
+        with self._lock:
+            idle = [entry[0] for entries in self._idle.values() for entry in entries]
+            for host, entries in self._idle.items():
+                self._sizes[host] -= len(entries)
+            self._idle.clear()
+            self._notify()
+        for session in idle:
+            session.close()
+
+
+_DEFAULT_POOL: Optional[SessionPool] = None
+
+
+def get_default_pool() -> SessionPool:
+    """
+    Returns the process-wide `SessionPool`, creating it on first use.
+    """
+    global _DEFAULT_POOL # pylint: disable=global-statement
+    if _DEFAULT_POOL is None:
+        _DEFAULT_POOL = SessionPool()
+    return _DEFAULT_POOL
+
+
+def _hold(response, release: Callable[[], None]):
+    # Keeps a session borrowed until the body of a streamed response has been read, or abandoned, and the response closed.
+    close = response.close
+    released = Lock()
+
+    def closing():
+        try:
+            close()
+        finally:
+            if released.acquire(blocking=False):
+                release()
+
+    response.close = closing
+    return response
+
+
+class PooledSession:
+    """
+    A `Transport` that borrows a session from a `SessionPool` for every request, keyed by the request's host.
+
+    With `stream=True`, the session is only returned to the pool once the response is closed, as its body is read
+    through the session's connection.
+
+    :param pool: The pool to borrow from. Defaults to the process-wide pool returned by `get_default_pool`.
+    :type pool: Optional[SessionPool]
+    """
+
+    def __init__(self, pool: Optional[SessionPool] = None):
+        self.pool = pool if pool else get_default_pool()
+
+    def post(self, url, data=None, json=None, **kwargs):
+        """
+        Performs a POST request using a pooled session.
+        """
+        if kwargs.get("stream"):
+            return self._stream("post", url, data=data, json=json, **kwargs)
+        with self.pool.borrow(urlsplit(url).netloc) as session:
+            return session.post(url, data=data, json=json, **kwargs)
+
+    def get(self, url, **kwargs):
+        """
+        Performs a GET request using a pooled session.
+        """
+        if kwargs.get("stream"):
+            return self._stream("get", url, **kwargs)
+        with self.pool.borrow(urlsplit(url).netloc) as session:
+            return session.get(url, **kwargs)
+
+    def _stream(self, method, url, **kwargs):
+        host = urlsplit(url).netloc
+        session = self.pool.acquire(host)
+        try:
+            response = getattr(session, method)(url, **kwargs)
+        except RequestException:
+            self.pool.release(host, session, discard=True)
+            raise
+        except Exception:
+            self.pool.release(host, session)
+            raise
+        return _hold(response, partial(self.pool.release, host, session))
+
+    def close(self):
+        """
+        Does nothing, as the sessions belong to the shared pool.
+        """
+
+
+class AsyncPooledSession:
+    """
+    An `AsyncTransport` that borrows a session from a `SessionPool` for every request, running it in a thread.
+
+    Waiting for a free session happens on the event loop, so a thread is only used while a request is in flight. As
+    with `PooledSession`, a streamed response keeps its session until it is closed.
+
+    :param pool: The pool to borrow from. Defaults to the process-wide pool returned by `get_default_pool`.
+    :type pool: Optional[SessionPool]
+    :param executor: An optional `BoundedExecutor` running the requests. Defaults to the event loop's default executor.
+    :type executor: Optional[BoundedExecutor]
+    """
+
+    def __init__(self, pool: Optional[SessionPool] = None, *, executor: Optional[BoundedExecutor] = None):
+        self.session = PooledSession(pool)
+        self.pool = self.session.pool
+        self.executor = executor
+
+    async def _request(self, method, url, **kwargs):
+        host = urlsplit(url).netloc
+        session = await self.pool.acquire_async(host)
+        call = getattr(session, method)
+        stream = kwargs.get("stream", False)
+        request = ensure_future(self.executor.run(call, url, **kwargs) if self.executor else to_thread(call, url, **kwargs))
+        request.add_done_callback(partial(self._done, host, session, stream))
+        try:
+            response = await shield(request)
+        except CancelledError:
+            if stream:
+                request.add_done_callback(partial(self._abandoned, host, session))
+            raise
+        return _hold(response, partial(self.pool.release, host, session)) if stream else response
+
+    def _done(self, host, session, stream, done):
+        if done.cancelled() or done.exception() is not None:
+            self.pool.release(host, session, discard=not done.cancelled() and isinstance(done.exception(), RequestException))
+        elif not stream:
+            self.pool.release(host, session)
+
+    def _abandoned(self, host, session, done):
+        if not done.cancelled() and done.exception() is None:
+            _hold(done.result(), partial(self.pool.release, host, session)).close()
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        """
+        An asynchronous method to perform a POST request using a pooled session.
+        """
+        return await self._request("post", url, data=data, json=json, **kwargs)
+
+    async def get(self, url, **kwargs):
+        """
+        An asynchronous method to perform a GET request using a pooled session.
+        """
+        return await self._request("get", url, **kwargs)
+
+    async def close(self):
+        """
+        Does nothing, as the sessions belong to the shared pool.
+        """
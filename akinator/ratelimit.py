@@ -0,0 +1,194 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, Optional
+from time import monotonic, sleep
+from threading import Lock
+import asyncio
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket, refilled continuously at `rate` tokens per second up to `capacity`.
+
+    Callers reserve a token and wait until it is due, so that waiters are served in order even when the bucket is empty.
+
+    :param rate: The number of tokens added per second.
+    :type rate: float
+    :param capacity: The maximum number of tokens, i.e. the burst size. Defaults to `rate`, with a minimum of 1.
+    :type capacity: Optional[float]
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def set_rate(self, rate: float):
+        """
+        Changes the refill rate of the bucket, keeping the tokens accumulated so far.
+
+        :param rate: The new number of tokens added per second.
+        :type rate: float
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate
+
+    def _reserve(self, tokens: float) -> float:
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Takes tokens if they are available right away, and returns whether they were.
+
+        :param tokens: The number of tokens to take. Defaults to 1.
+        :type tokens: float
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Takes tokens, blocking until they are due. Returns the time waited, in seconds.
+
+        :param tokens: The number of tokens to take. Defaults to 1.
+        :type tokens: float
+        """
+        delay = self._reserve(tokens)
+        if delay:
+            sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """
+        Takes tokens, sleeping asynchronously until they are due. Returns the time waited, in seconds.
+
+        :param tokens: The number of tokens to take. Defaults to 1.
+        :type tokens: float
+        """
+        delay = self._reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """
+    A set of token buckets, one per host, e.g. one per Akinator language subdomain.
+
+    :param rate: The number of requests allowed per second and per host.
+    :type rate: float
+    :param capacity: The burst size of each host. Defaults to `rate`, with a minimum of 1.
+    :type capacity: Optional[float]
+    :param overrides: Optional per-host rates, taking precedence over `rate`.
+    :type overrides: Optional[Dict[str, float]]
+    :param adaptive: Whether to halve the rate of a host when it answers with a 429, and to recover it progressively on success. Defaults to False.
+    :type adaptive: bool
+    :param min_rate: The lowest rate an adaptive host can be slowed down to. Defaults to 0.1.
+    :type min_rate: float
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, *, overrides: Optional[Dict[str, float]] = None, adaptive: bool = False, min_rate: float = 0.1):
+        self.rate = rate
+        self.capacity = capacity
+        self.overrides = dict(overrides) if overrides else {}
+        self.adaptive = adaptive
+        self.min_rate = min_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """
+        Returns the token bucket of a host, creating it on first use.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    bucket = self._buckets[host] = TokenBucket(self.overrides.get(host, self.rate), self.capacity)
+        return bucket
+
+    def penalize(self, host: str):
+        """
+        Halves the rate of a host, down to `min_rate`, if the limiter is adaptive. Called when the host answers with a 429.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        if self.adaptive:
+            bucket = self.bucket(host)
+            bucket.set_rate(max(self.min_rate, bucket.rate / 2))
+
+    def reward(self, host: str):
+        """
+        Raises the rate of a slowed down host by a tenth of its configured rate, if the limiter is adaptive. Called after a successful request.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        if self.adaptive:
+            bucket = self.bucket(host)
+            target = self.overrides.get(host, self.rate)
+            if bucket.rate < target:
+                bucket.set_rate(min(target, bucket.rate + target / 10))
+
+    def acquire(self, host: str) -> float:
+        """
+        Takes a token for a host, blocking until it is due. Returns the time waited, in seconds.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        return self.bucket(host).acquire()
+
+    async def acquire_async(self, host: str) -> float:
+        """
+        Takes a token for a host, sleeping asynchronously until it is due. Returns the time waited, in seconds.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        return await self.bucket(host).acquire_async()
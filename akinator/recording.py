@@ -0,0 +1,333 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from base64 import b64decode, b64encode
+from collections import defaultdict, deque
+from json import dumps, loads
+from threading import Lock
+import gzip
+import os
+
+from cloudscraper import create_scraper
+
+from .exceptions import ReplayError
+from .transport import AsyncCloudScraper, AsyncTransport, Response, Transport
+
+CASSETTE_VERSION = 1
+
+# Only the headers the clients look at are recorded, to keep cassettes small.
+RECORDED_HEADERS = ("Content-Type", "Retry-After", "Server", "cf-mitigated")
+
+
+class Interaction(NamedTuple):
+    """
+    A recorded request and its response. The body of a GET response, i.e. an image, is stored base64-encoded.
+    """
+
+    url: str
+    data: Dict[str, str]
+    status_code: int
+    headers: Dict[str, str]
+    body: str
+    method: str = "POST"
+
+    def key(self) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+        """
+        Returns the key matching a replayed request to this interaction.
+        """
+        return _key(self.method, self.url, self.data)
+
+    def response(self) -> Response:
+        """
+        Returns the recorded response.
+        """
+        content = b64decode(self.body) if self.method == "GET" else self.body.encode("utf-8")
+        return Response(self.status_code, content, self.headers, self.url)
+
+
+def _form(data: Any) -> Dict[str, str]:
+    return {key: str(value) for key, value in dict(data).items()} if data else {}
+
+
+def _key(method: str, url: str, data: Dict[str, str]) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+    return method, url, tuple(sorted(data.items()))
+
+
+class Cassette:
+    """
+    An ordered list of recorded interactions, stored on disk as gzip-compressed JSON lines.
+
+    :param interactions: The interactions of the cassette. Defaults to none.
+    :type interactions: Optional[List[Interaction]]
+    """
+
+    def __init__(self, interactions: Optional[List[Interaction]] = None):
+        self.interactions = list(interactions) if interactions else []
+        self._lock = Lock()
+
+    def record(self, url: str, data: Any, response, method: str = "POST") -> Interaction:
+        """
+        Records a request and its response, reading the whole body of the response.
+
+        :param url: The URL of the request.
+        :type url: str
+        :param data: The form data of the request.
+        :type data: Any
+        :param response: The response. Its body is read in full.
+        :param method: The method of the request, "POST" or "GET". Defaults to "POST".
+        :type method: str
+        """
+        headers = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+        body = b64encode(response.content).decode("ascii") if method == "GET" else response.text
+        interaction = Interaction(url, _form(data), response.status_code, headers, body, method)
+        with self._lock:
+            self.interactions.append(interaction)
+        return interaction
+
+    def save(self, path: str):
+        """
+        Writes the cassette to a file, atomically.
+
+        :param path: The path of the file, conventionally ending with ".jsonl.gz".
+        :type path: str
+        """
+        temporary = f"{path}.tmp"
+        with gzip.open(temporary, "wt", encoding="utf-8") as file:
+            file.write(dumps({"version": CASSETTE_VERSION}) + "\n")
+            for interaction in list(self.interactions):
+                file.write(dumps(interaction, ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """
+        Reads a cassette written by `save`.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            header = loads(file.readline() or "{}")
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version: {header.get('version')}.")
+            return cls([Interaction(*loads(line)) for line in file if line.strip()])
+
+    def __len__(self):
+        return len(self.interactions)
+
+    def __iter__(self) -> Iterator[Interaction]:
+        return iter(list(self.interactions))
+
+
+class RecordingTransport:
+    """
+    A `Transport` recording every request and response it forwards to another transport into a `Cassette`.
+
+    Responses are read in full before being returned, so streamed requests are recorded whole.
+
+    :param transport: The transport to forward requests to. If not provided, a new `CloudScraper` session is created.
+    :type transport: Optional[Transport]
+    :param cassette: The cassette to record into. If not provided, a new, empty one is used.
+    :type cassette: Optional[Cassette]
+    """
+
+    def __init__(self, transport: Optional[Transport] = None, cassette: Optional[Cassette] = None):
+        self.transport = transport if transport is not None else create_scraper()
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    def post(self, url, data=None, json=None, **kwargs):
+        """
+        Performs a POST request through the wrapped transport and records it.
+        """
+        kwargs.pop("stream", None)
+        response = self.transport.post(url, data=data, json=json, **kwargs)
+        return self.cassette.record(url, data, response).response()
+
+    def get(self, url, **kwargs):
+        """
+        Performs a GET request, e.g. for an image, through the wrapped transport and records it.
+        """
+        kwargs.pop("stream", None)
+        response = self.transport.get(url, **kwargs)
+        return self.cassette.record(url, None, response, "GET").response()
+
+    def save(self, path: str):
+        """
+        Writes the recorded cassette to a file.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        self.cassette.save(path)
+
+    def close(self):
+        """
+        Closes the wrapped transport.
+        """
+        self.transport.close()
+
+
+class AsyncRecordingTransport:
+    """
+    An `AsyncTransport` recording every request and response it forwards to another transport into a `Cassette`.
+
+    :param transport: The transport to forward requests to. If not provided, a new `AsyncCloudScraper` is created.
+    :type transport: Optional[AsyncTransport]
+    :param cassette: The cassette to record into. If not provided, a new, empty one is used.
+    :type cassette: Optional[Cassette]
+    """
+
+    def __init__(self, transport: Optional[AsyncTransport] = None, cassette: Optional[Cassette] = None):
+        self.transport = transport if transport is not None else AsyncCloudScraper()
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        """
+        Performs a POST request through the wrapped transport and records it.
+        """
+        kwargs.pop("stream", None)
+        response = await self.transport.post(url, data=data, json=json, **kwargs)
+        return self.cassette.record(url, data, response).response()
+
+    async def get(self, url, **kwargs):
+        """
+        Performs a GET request, e.g. for an image, through the wrapped transport and records it.
+        """
+        kwargs.pop("stream", None)
+        response = await self.transport.get(url, **kwargs)
+        return self.cassette.record(url, None, response, "GET").response()
+
+    def save(self, path: str):
+        """
+        Writes the recorded cassette to a file.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        self.cassette.save(path)
+
+    async def close(self):
+        """
+        Closes the wrapped transport.
+        """
+        await self.transport.close()
+
+
+class ReplayTransport:
+    """
+    A `Transport` answering requests from a `Cassette`, without any network access.
+
+    A request is answered with the next unused response recorded for the same method, URL and form data, so games recorded
+    concurrently can be replayed in any order. Recorded games replay identically, since the session and signature the
+    client sends come from the recorded `/game` page. Responses are decoded once, when the transport is created.
+
+    :param cassette: The cassette to replay, or the path of a file written by `Cassette.save`.
+    :type cassette: Union[Cassette, str]
+    :param repeat: Whether to start over once every response recorded for a request has been served, e.g. to replay the same games in a profiling loop. Defaults to False.
+    :type repeat: bool
+    """
+
+    def __init__(self, cassette, *, repeat: bool = False):
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        self.repeat = repeat
+        self._recorded: Dict[Tuple, List[Response]] = defaultdict(list)
+        for interaction in self.cassette:
+            self._recorded[interaction.key()].append(interaction.response())
+        self._lock = Lock()
+        self.rewind()
+
+    def rewind(self):
+        """
+        Makes every recorded response available again.
+        """
+        with self._lock:
+            self._pending: Dict[Tuple, Deque[Response]] = {key: deque(responses) for key, responses in self._recorded.items()}
+
+    def _replay(self, method, url, data):
+        key = _key(method, url, _form(data))
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                raise ReplayError(f"No recorded response for {method} {url} with {dict(key[2])}.")
+            if not pending:
+                if not self.repeat:
+                    raise ReplayError(f"Every response recorded for {method} {url} with {dict(key[2])} has been replayed.")
+                pending.extend(self._recorded[key])
+            return pending.popleft()
+
+    def post(self, url, data=None, **_kwargs):
+        """
+        Returns the recorded response to a POST request.
+        """
+        return self._replay("POST", url, data)
+
+    def get(self, url, **_kwargs):
+        """
+        Returns the recorded response to a GET request.
+        """
+        return self._replay("GET", url, None)
+
+    def close(self):
+        """
+        Does nothing, as no resources are held.
+        """
+
+
+class AsyncReplayTransport:
+    """
+    An `AsyncTransport` answering requests from a `Cassette`, without any network access, through a `ReplayTransport`.
+
+    :param cassette: The cassette to replay, or the path of a file written by `Cassette.save`.
+    :type cassette: Union[Cassette, str]
+    :param repeat: Whether to start over once every response recorded for a request has been served. Defaults to False.
+    :type repeat: bool
+    """
+
+    def __init__(self, cassette, *, repeat: bool = False):
+        self.transport = ReplayTransport(cassette, repeat=repeat)
+        self.cassette = self.transport.cassette
+
+    def rewind(self):
+        """
+        Makes every recorded response available again.
+        """
+        self.transport.rewind()
+
+    async def post(self, url, data=None, **kwargs):
+        """
+        Returns the recorded response to a POST request.
+        """
+        return self.transport.post(url, data, **kwargs)
+
+    async def get(self, url, **kwargs):
+        """
+        Returns the recorded response to a GET request.
+        """
+        return self.transport.get(url, **kwargs)
+
+    async def close(self):
+        """
+        Does nothing, as no resources are held.
+        """
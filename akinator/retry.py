@@ -0,0 +1,369 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type
+from time import monotonic, sleep
+from random import uniform
+from threading import Lock
+from urllib.parse import urlsplit
+import asyncio
+
+from requests import ConnectionError as RequestsConnectionError, ConnectTimeout as RequestsConnectTimeout
+from urllib3.exceptions import NewConnectionError
+
+from .exceptions import CircuitOpenError, TransientError
+from .ratelimit import HostRateLimiter
+
+try:
+    from aiohttp import ClientConnectorError, ClientError
+except ImportError:
+    ClientConnectorError = ClientError = RequestsConnectTimeout
+
+RETRY_STATUSES = (429, 503)
+RETRY_EXCEPTIONS = (RequestsConnectTimeout, ClientConnectorError, ConnectionRefusedError)
+
+# Errors raised by the transport itself, which count as failures of the host whether or not they are retried.
+_TRANSPORT_EXCEPTIONS = (OSError, asyncio.TimeoutError, ClientError)
+
+
+def _failed_to_connect(error: BaseException) -> bool:
+    reason = getattr(error.args[0], "reason", None) if isinstance(error, RequestsConnectionError) and error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class RetryPolicy:
+    """
+    Retries requests failing with a transient error, waiting an exponentially growing, fully jittered delay between attempts.
+
+    Only failures which the server is known not to have acted on are retried by default: 429 and 503 responses, which are
+    returned by Cloudflare and by overloaded servers before the game is touched, and errors raised while connecting,
+    before the request is sent. Read timeouts and connections dropped mid-request are not retried, as the server may
+    already have applied a non-idempotent request such as an answer.
+
+    :param max_attempts: The maximum number of attempts per request, including the first one. Defaults to 3.
+    :type max_attempts: int
+    :param base_delay: The delay before the first retry, in seconds, before jitter. Defaults to 0.25.
+    :type base_delay: float
+    :param max_delay: The maximum delay between two attempts, in seconds. Defaults to 5.
+    :type max_delay: float
+    :param statuses: The status codes considered transient. Defaults to (429, 503).
+    :type statuses: Iterable[int]
+    :param exceptions: The exceptions considered transient, along with `requests` connection errors caused by a failure to open the connection. Defaults to `RETRY_EXCEPTIONS`: connect timeouts, `aiohttp` connector errors and refused connections.
+    :type exceptions: Tuple[Type[BaseException], ...]
+
+    :ivar attempts: The number of requests sent, including retries.
+    :ivar retries: The number of retries.
+    :ivar failures: The number of requests which failed after every attempt.
+    :ivar retry_time: The latency added by retries, in seconds: failed attempts and the delays after them.
+    """
+
+    def __init__(self, *, max_attempts: int = 3, base_delay: float = 0.25, max_delay: float = 5.0, statuses: Iterable[int] = RETRY_STATUSES, exceptions: Tuple[Type[BaseException], ...] = RETRY_EXCEPTIONS):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self.exceptions = exceptions
+
+        self._lock = Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.retry_time = 0.0
+
+    def delay(self, attempt: int, response=None) -> float:
+        """
+        Returns the delay before the given retry, honouring the `Retry-After` header of the failed response if any.
+
+        :param attempt: The number of attempts made so far.
+        :type attempt: int
+        :param response: The failed response, if any.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(self.max_delay, float(retry_after))
+        return uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def retryable(self, error: BaseException) -> bool:
+        """
+        Returns whether a request which raised the given exception can be retried.
+
+        :param error: The exception raised by the request.
+        :type error: BaseException
+        """
+        return isinstance(error, self.exceptions) or _failed_to_connect(error)
+
+    def record(self, attempts: int = 0, retries: int = 0, failures: int = 0, retry_time: float = 0.0):
+        """
+        Adds to the retry counters.
+        """
+        with self._lock:
+            self.attempts += attempts
+            self.retries += retries
+            self.failures += failures
+            self.retry_time += retry_time
+
+    def stats(self) -> dict:
+        """
+        Returns the retry counters.
+        """
+        with self._lock:
+            return {"attempts": self.attempts, "retries": self.retries, "failures": self.failures, "retry_time": self.retry_time}
+
+
+class CircuitBreaker:
+    """
+    Sheds requests to a host once it has failed `failure_threshold` times in a row, until `reset_timeout` has elapsed.
+    Transport errors, such as refused connections and timeouts, 429 responses and 5xx responses all count as failures,
+    whether or not they are retried.
+
+    After the timeout, a single trial request is let through: the circuit closes again if it succeeds, and reopens otherwise.
+    If the trial ends without an outcome, e.g. because it was cancelled, it is released with `release` so that the next
+    request becomes the trial.
+
+    :param failure_threshold: The number of consecutive failures opening the circuit of a host. Defaults to 5.
+    :type failure_threshold: int
+    :param reset_timeout: How long, in seconds, the circuit stays open. Defaults to 30.
+    :type reset_timeout: float
+
+    :ivar opened: The number of times a circuit has opened.
+    :ivar rejected: The number of requests shed.
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = Lock()
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial: Dict[str, bool] = {}
+        self.opened = 0
+        self.rejected = 0
+
+    def state(self, host: str) -> str:
+        """
+        Returns the state of the circuit of a host: "closed", "open" or "half-open".
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return "closed"
+            return "open" if monotonic() - opened_at < self.reset_timeout else "half-open"
+
+    def allow(self, host: str) -> bool:
+        """
+        Raises `CircuitOpenError` if requests to a host are currently shed, and returns whether the request is the trial of a half-open circuit.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return False
+            if monotonic() - opened_at >= self.reset_timeout and not self._trial.get(host):
+                self._trial[host] = True
+                return True
+            self.rejected += 1
+        raise CircuitOpenError(f"Requests to {host} are shed after {self.failure_threshold} consecutive failures.")
+
+    def release(self, host: str):
+        """
+        Gives up the trial request of a half-open circuit without recording an outcome, letting the next request through.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        with self._lock:
+            self._trial.pop(host, None)
+
+    def record_success(self, host: str):
+        """
+        Records a successful request to a host, closing its circuit.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        with self._lock:
+            self._failures[host] = 0
+            self._opened_at.pop(host, None)
+            self._trial.pop(host, None)
+
+    def record_failure(self, host: str):
+        """
+        Records a failure of a request to a host, opening its circuit if needed.
+
+        :param host: The host, e.g. "en.akinator.com".
+        :type host: str
+        """
+        with self._lock:
+            failures = self._failures[host] = self._failures.get(host, 0) + 1
+            if self._trial.pop(host, False) or (failures >= self.failure_threshold and host not in self._opened_at):
+                self._opened_at[host] = monotonic()
+                self.opened += 1
+
+
+class _Attempts:
+    """
+    The retry, rate limiting and circuit breaking decisions shared by `send` and `send_async`, around the request itself.
+    """
+
+    def __init__(self, url: str, retry: Optional[RetryPolicy], rate_limiter: Optional[HostRateLimiter], circuit_breaker: Optional[CircuitBreaker]):
+        self.host = urlsplit(url).netloc
+        self.policy = retry if retry is not None else RetryPolicy(max_attempts=1)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.attempt = 0
+        self.failed_time = 0.0
+        self.started = 0.0
+        self._trial = False
+
+    def begin(self):
+        """
+        Starts an attempt, raising `CircuitOpenError` if the host is shed.
+        """
+        self.attempt += 1
+        self._trial = self.circuit_breaker.allow(self.host) if self.circuit_breaker is not None else False
+
+    def sent(self):
+        """
+        Marks the moment the request is sent, once the rate limiter let it through.
+        """
+        self.started = monotonic()
+
+    def failed(self, error: BaseException):
+        """
+        Re-raises an exception raised by the request unless it can be retried, recording a failure of the host first if
+        the transport raised it.
+        """
+        if not self.policy.retryable(error):
+            if self.circuit_breaker is not None and isinstance(error, _TRANSPORT_EXCEPTIONS):
+                self._trial = False
+                self.circuit_breaker.record_failure(self.host)
+            raise error
+
+    def abandon(self):
+        """
+        Releases the trial of a half-open circuit if the attempt ended without an outcome, e.g. cancelled or with a non-transient error.
+        """
+        if self._trial:
+            self._trial = False
+            self.circuit_breaker.release(self.host)
+
+    def finish(self, response=None, error: Optional[BaseException] = None) -> Optional[float]:
+        """
+        Records the outcome of an attempt, and returns the delay before the next one, or None if the response is final.
+        Raises `TransientError` once every attempt has failed.
+        """
+        self._trial = False
+        status = getattr(response, "status_code", None)
+        if self.circuit_breaker is not None:
+            if error is not None or status in self.policy.statuses or (status or 0) >= 500:
+                self.circuit_breaker.record_failure(self.host)
+            else:
+                self.circuit_breaker.record_success(self.host)
+        if error is None and status not in self.policy.statuses:
+            if self.rate_limiter is not None:
+                self.rate_limiter.reward(self.host)
+            self.policy.record(attempts=1, retry_time=self.failed_time)
+            return None
+
+        if self.rate_limiter is not None and status == 429:
+            self.rate_limiter.penalize(self.host)
+        self.failed_time += monotonic() - self.started
+
+        if self.attempt >= self.policy.max_attempts:
+            self.policy.record(attempts=1, failures=1, retry_time=self.failed_time)
+            if error is not None:
+                raise TransientError(f"The request to {self.host} failed after {self.attempt} attempt(s): {error}") from error
+            raise TransientError(f"The request to {self.host} failed after {self.attempt} attempt(s) with status {response.status_code}.", response.status_code)
+
+        delay = self.policy.delay(self.attempt, response)
+        self.policy.record(attempts=1, retries=1)
+        if response is not None and hasattr(response, "close"):
+            response.close()
+        self.failed_time += delay
+        return delay
+
+
+def send(request: Callable, url: str, *, retry: Optional[RetryPolicy] = None, rate_limiter: Optional[HostRateLimiter] = None, circuit_breaker: Optional[CircuitBreaker] = None):
+    """
+    Sends a request through the optional rate limiter, circuit breaker and retry policy, and returns its response.
+
+    :param request: A callable sending the request and returning its response.
+    :type request: Callable
+    :param url: The URL of the request, used to key the rate limiter and circuit breaker by host.
+    :type url: str
+    """
+    attempts = _Attempts(url, retry, rate_limiter, circuit_breaker)
+    while True:
+        attempts.begin()
+        try:
+            if rate_limiter is not None:
+                rate_limiter.acquire(attempts.host)
+            attempts.sent()
+            try:
+                response, error = request(), None
+            except Exception as exception:
+                attempts.failed(exception)
+                response, error = None, exception
+            delay = attempts.finish(response, error)
+        finally:
+            attempts.abandon()
+        if delay is None:
+            return response
+        sleep(delay)
+
+
+async def send_async(request: Callable, url: str, *, retry: Optional[RetryPolicy] = None, rate_limiter: Optional[HostRateLimiter] = None, circuit_breaker: Optional[CircuitBreaker] = None):
+    """
+    An asynchronous equivalent of `send`, for a callable returning an awaitable response.
+
+    :param request: A callable sending the request and returning an awaitable of its response.
+    :type request: Callable
+    :param url: The URL of the request, used to key the rate limiter and circuit breaker by host.
+    :type url: str
+    """
+    attempts = _Attempts(url, retry, rate_limiter, circuit_breaker)
+    while True:
+        attempts.begin()
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.acquire_async(attempts.host)
+            attempts.sent()
+            try:
+                response, error = await request(), None
+            except Exception as exception:
+                attempts.failed(exception)
+                response, error = None, exception
+            delay = attempts.finish(response, error)
+        finally:
+            attempts.abandon()
+        if delay is None:
+            return response
+        await asyncio.sleep(delay)
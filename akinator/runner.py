@@ -0,0 +1,218 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, NamedTuple, Optional, Union
+from time import perf_counter
+from inspect import isawaitable
+import asyncio
+
+from .async_client import AsyncClient, _iterate
+from .constants import LANG_MAP
+from .executor import BoundedExecutor
+from .pool import AsyncPooledSession, SessionPool
+from .ratelimit import HostRateLimiter
+from .state import GameState
+
+Policy = Callable[[AsyncClient], Union[str, Awaitable[str]]]
+
+
+class GameResult(NamedTuple):
+    """
+    The outcome of a game played by `GameRunner`.
+    """
+
+    index: int
+    state: GameState
+    steps: int
+    duration: float
+    error: Optional[BaseException] = None
+
+    @property
+    def win(self) -> bool:
+        """
+        Returns whether Akinator guessed right.
+        """
+        return self.error is None and self.state.finished and self.state.win
+
+
+class GameSettings(NamedTuple):
+    """
+    The games started by `GameRunner`.
+
+    :param language: The language of the games. Defaults to "en".
+    :type language: str
+    :param child_mode: Whether child mode is enabled. Defaults to False.
+    :type child_mode: bool
+    :param theme: The theme of the games. Defaults to "c".
+    :type theme: str
+    """
+
+    language: str = "en"
+    child_mode: bool = False
+    theme: str = "c"
+
+
+class GameRunner:
+    """
+    Drives many games concurrently on `AsyncClient`, with a global concurrency limit and optional per-host rate limits.
+
+    Each game is played by an answer policy: a callable receiving the client and returning, or awaiting, the next answer.
+    Answering "yes" or "no" to a proposition chooses or excludes it, as with `AsyncClient.answer`.
+
+    :param factory: A callable creating a new `AsyncClient` for each game, closed once the game ends. Defaults to clients sharing a `SessionPool` and a `BoundedExecutor` owned by the runner, both sized for `concurrency`.
+    :type factory: Optional[Callable[[], AsyncClient]]
+    :param concurrency: The maximum number of games played at once. Defaults to 100.
+    :type concurrency: int
+    :param rate_limiter: An optional `HostRateLimiter` applied before every request.
+    :type rate_limiter: Optional[HostRateLimiter]
+    :param max_steps: The maximum number of answers given in a single game. Defaults to 80.
+    :type max_steps: int
+    :param game: The language, child mode and theme of the games. Defaults to English characters, without child mode.
+    :type game: Optional[GameSettings]
+    """
+
+    def __init__(self, factory: Optional[Callable[[], AsyncClient]] = None, *, concurrency: int = 100, rate_limiter: Optional[HostRateLimiter] = None, max_steps: int = 80, game: Optional[GameSettings] = None):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        self._pool = None if factory else SessionPool(max_per_host=concurrency)
+        self._executor = None if factory else BoundedExecutor(concurrency, policy="wait", name="akinator-runner")
+        self.factory = factory if factory else self._create_client
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.max_steps = max_steps
+        game = game if game is not None else GameSettings()
+        self.language = game.language
+        self.child_mode = game.child_mode
+        self.theme = game.theme
+        self.host = f"{LANG_MAP.get(game.language.lower(), game.language.lower())}.akinator.com"
+
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _create_client(self) -> AsyncClient:
+        return AsyncClient(AsyncPooledSession(self._pool, executor=self._executor))
+
+    async def _throttle(self):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self.host)
+
+    async def play(self, policy: Policy, index: int = 0) -> GameResult:
+        """
+        Plays a single game with an answer policy. Errors are reported in the result rather than raised.
+
+        :param policy: The answer policy.
+        :type policy: Callable[[AsyncClient], Union[str, Awaitable[str]]]
+        :param index: The index of the game, reported in the result. Defaults to 0.
+        :type index: int
+        """
+        started = perf_counter()
+        client = self.factory()
+        steps = 0
+        self.started += 1
+        try:
+            await self._throttle()
+            await client.start_game(language=self.language, child_mode=self.child_mode, theme=self.theme)
+            while not client.finished and steps < self.max_steps:
+                answer = policy(client)
+                if isawaitable(answer):
+                    answer = await answer
+                await self._throttle()
+                await client.answer(answer)
+                steps += 1
+        except Exception as error:
+            self.failed += 1
+            return GameResult(index, client.state, steps, perf_counter() - started, error)
+        finally:
+            try:
+                await client.close()
+            except Exception:
+                pass
+        self.completed += 1
+        return GameResult(index, client.state, steps, perf_counter() - started)
+
+    async def run(self, policies: Union[Iterable[Policy], AsyncIterable[Policy]]) -> AsyncIterator[GameResult]:
+        """
+        Plays one game per policy and yields the results as games complete.
+
+        Policies are only pulled from the stream when a slot is free, so an unbounded or slow stream is consumed at the pace of the games.
+
+        :param policies: An iterable or asynchronous iterable of answer policies.
+        :type policies: Union[Iterable[Policy], AsyncIterable[Policy]]
+        """
+        results = asyncio.Queue()
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks = set()
+
+        def finished(task):
+            tasks.discard(task)
+            slots.release()
+            if not task.cancelled():
+                results.put_nowait(task.result())
+
+        async def produce():
+            index = 0
+            async for policy in _iterate(policies):
+                await slots.acquire()
+                task = asyncio.get_running_loop().create_task(self.play(policy, index))
+                tasks.add(task)
+                task.add_done_callback(finished)
+                index += 1
+            return index
+
+        producer = asyncio.get_running_loop().create_task(produce())
+        getter = None
+        yielded = 0
+        try:
+            while not (producer.done() and yielded == producer.result()):
+                getter = asyncio.ensure_future(results.get())
+                await asyncio.wait({getter} if producer.done() else {getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yielded += 1
+                    yield getter.result()
+                else:
+                    getter.cancel()
+                    producer.result()
+        finally:
+            if getter is not None:
+                getter.cancel()
+            producer.cancel()
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(producer, *tasks, return_exceptions=True)
+
+    async def close(self):
+        """
+        Closes the sessions and stops the threads of the default factory. Does nothing with a custom factory.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._pool is not None:
+            self._pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,62 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from typing import NamedTuple, Optional
+
+from .cache import QuestionCache
+from .metrics import MetricsSink
+from .ratelimit import HostRateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .speculation import Speculation
+from .undo import UndoHistory
+
+
+class ClientSettings(NamedTuple):
+    """
+    The optional features of a `Client` or `AsyncClient`, all disabled by default.
+
+    :param retry: An optional `RetryPolicy` retrying requests which fail with a transient error.
+    :type retry: Optional[RetryPolicy]
+    :param rate_limiter: An optional `HostRateLimiter` applied before every request.
+    :type rate_limiter: Optional[HostRateLimiter]
+    :param circuit_breaker: An optional `CircuitBreaker` shedding requests to failing hosts.
+    :type circuit_breaker: Optional[CircuitBreaker]
+    :param metrics: An optional `MetricsSink` receiving the latency of every request and parse step, such as a `HistogramMetrics`.
+    :type metrics: Optional[MetricsSink]
+    :param question_cache: An optional `QuestionCache` recording the step reached by every answer path, used by `predict`.
+    :type question_cache: Optional[QuestionCache]
+    :param speculation: An optional `Speculation` warming the connection to Akinator while the player decides.
+    :type speculation: Optional[Speculation]
+    :param undo: An optional `UndoHistory`, specific to a single client and closed with it, so that `back` restores the previous step instantly and confirms it with the server in the background.
+    :type undo: Optional[UndoHistory]
+    """
+
+    retry: Optional[RetryPolicy] = None
+    rate_limiter: Optional[HostRateLimiter] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+    metrics: Optional[MetricsSink] = None
+    question_cache: Optional[QuestionCache] = None
+    speculation: Optional[Speculation] = None
+    undo: Optional[UndoHistory] = None
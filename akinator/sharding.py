@@ -0,0 +1,451 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import Future
+from itertools import count
+from threading import Lock, Thread
+from zlib import crc32
+import asyncio
+import multiprocessing
+import os
+
+from .async_client import AsyncClient
+from .pool import AsyncPooledSession
+from .state import GameState, GameStateView, Step
+
+# The methods a shard runs, and whether their return value is sent back.
+SHARD_METHODS = {
+    "start_game": False,
+    "answer": False,
+    "back": False,
+    "exclude": False,
+    "choose": False,
+    "defeat": False,
+    "answer_many": True,
+}
+
+# The number of games whose client a shard keeps between calls. Older ones are closed, and created again from the state
+# sent with their next call.
+_MAX_GAMES = 10000
+
+
+def _default_factory() -> AsyncClient:
+    return AsyncClient(AsyncPooledSession())
+
+
+class _Games:
+    """
+    The clients of the games played by a shard, each created by the factory and kept until the game ends.
+
+    A kept client is reused only if the call carries the state it last returned, as its undo history and warm-up
+    belong to that state. Otherwise, e.g. for a game resumed from an older state, a new client is created.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncClient]):
+        self.factory = factory
+        self._clients: "OrderedDict[str, Tuple[AsyncClient, bytes]]" = OrderedDict()
+        self._closing = set()
+
+    def checkout(self, state: Optional[bytes]) -> AsyncClient:
+        """
+        Returns the client of the game a call is for, removing it from the kept clients while the call runs.
+
+        :param state: The serialized state sent with the call, if the game has started.
+        :type state: Optional[bytes]
+        """
+        restored = GameState.from_bytes(state) if state else GameState()
+        client, sent = self._clients.pop(restored.session_id, (None, None)) if restored.session_id else (None, None)
+        if client is not None and sent == state:
+            return client
+        if client is not None:
+            self._close(client)
+        client = self.factory()
+        client.state = restored
+        return client
+
+    def checkin(self, client: AsyncClient, state: bytes):
+        """
+        Keeps the client of a game after a call, or closes it if the game has ended.
+
+        :param client: The client the call used.
+        :type client: AsyncClient
+        :param state: The serialized state returned by the call.
+        :type state: bytes
+        """
+        if not client.session_id or client.finished:
+            self._close(client)
+            return
+        self._clients[client.session_id] = (client, state)
+        while len(self._clients) > _MAX_GAMES:
+            self._close(self._clients.popitem(last=False)[1][0])
+
+    def _close(self, client):
+        task = asyncio.ensure_future(client.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closed)
+
+    def _closed(self, task):
+        self._closing.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def close(self):
+        """
+        Closes every kept client, and waits for the ones being closed.
+        """
+        clients, self._clients = self._clients, OrderedDict()
+        for client, _ in clients.values():
+            self._close(client)
+        await asyncio.gather(*self._closing, return_exceptions=True)
+
+
+async def _call(games: _Games, connection, message):
+    request_id, method, state, args, kwargs = message
+    client = games.checkout(state)
+    result = error = None
+    try:
+        result = await getattr(client, method)(*args, **kwargs)
+    except Exception as e:
+        error = e
+    reply = (request_id, client.state.to_bytes(), result if SHARD_METHODS[method] else None, error, error.__cause__ if error is not None else None)
+    try:
+        connection.send(reply)
+    except Exception:
+        connection.send((request_id, reply[1], None, RuntimeError(repr(error)), None))
+    games.checkin(client, reply[1])
+
+
+async def _serve_async(connection, factory):
+    loop = asyncio.get_running_loop()
+    messages = asyncio.Queue()
+
+    def read():
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                message = None
+            loop.call_soon_threadsafe(messages.put_nowait, message)
+            if message is None:
+                return
+
+    games = _Games(factory)
+    Thread(target=read, name="akinator-shard-reader", daemon=True).start()
+    tasks = set()
+    while True:
+        message = await messages.get()
+        if message is None:
+            break
+        task = loop.create_task(_call(games, connection, message))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await games.close()
+
+
+def _serve(connection, factory):
+    asyncio.run(_serve_async(connection, factory))
+
+
+class _Shard:
+    def __init__(self, index: int, factory: Callable[[], AsyncClient], context):
+        self.index = index
+        self.calls = 0
+        self.pending: Dict[int, Future] = {}
+        self._ids = count()
+        self._lock = Lock()
+        self._connection, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, factory), name=f"akinator-shard-{index}", daemon=True)
+        self.process.start()
+        child.close()
+        self._reader = Thread(target=self._read, name=f"akinator-shard-{index}-reader", daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        while True:
+            try:
+                request_id, state, result, error, cause = self._connection.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                future = self.pending.pop(request_id, None)
+            if future is not None:
+                if error is not None and cause is not None:
+                    error.__cause__ = cause
+                future.set_result((state, result, error))
+        with self._lock:
+            pending, self.pending = self.pending, {}
+        for future in pending.values():
+            future.set_exception(RuntimeError(f"Shard {self.index} exited."))
+
+    def call(self, method: str, state: Optional[bytes], args: tuple, kwargs: dict) -> Future:
+        """
+        Sends a call to the shard, and returns a future resolved with the new state, the result and the error.
+
+        :param method: The `AsyncClient` method to call, one of `SHARD_METHODS`.
+        :type method: str
+        :param state: The serialized state of the game, if it has started.
+        :type state: Optional[bytes]
+        :param args: The positional arguments of the method.
+        :type args: tuple
+        :param kwargs: The keyword arguments of the method.
+        :type kwargs: dict
+        """
+        future = Future()
+        with self._lock:
+            request_id = next(self._ids)
+            self.pending[request_id] = future
+            self.calls += 1
+            self._connection.send((request_id, method, state, args, kwargs))
+        return future
+
+    def close(self, timeout: float):
+        """
+        Stops the shard once its pending calls are answered, terminating it if it takes longer than `timeout` seconds.
+
+        :param timeout: How long, in seconds, to wait for the process.
+        :type timeout: float
+        """
+        with self._lock:
+            try:
+                self._connection.send(None)
+            except (OSError, ValueError):
+                pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self._connection.close()
+        self._reader.join(timeout)
+
+
+class ShardedClient(GameStateView):
+    """
+    A client whose games are played in the processes of a `ShardedRunner`, with the same interface as `AsyncClient`.
+
+    Only the `GameState` travels between processes: each call sends the state to the shard owning the game, which plays
+    the step with its own `AsyncClient` and sends the new state back. Exceptions raised in the shard are raised again here.
+
+    :param runner: The runner owning the shards.
+    :type runner: ShardedRunner
+    :param state: An optional `GameState` to resume. If not provided, a new, empty state is used.
+    :type state: Optional[GameState]
+
+    :ivar state: The `GameState` of the game, whose attributes are exposed as attributes of the client.
+    :ivar shard: The shard playing the game, once known.
+    """
+
+    confidence = AsyncClient.confidence
+    theme_id = AsyncClient.theme_id
+    theme_name = AsyncClient.theme_name
+    akitude_url = AsyncClient.akitude_url
+    play = AsyncClient.play
+    __str__ = AsyncClient.__str__
+
+    def __init__(self, runner: "ShardedRunner", state: Optional[GameState] = None):
+        self.runner = runner
+        self.state = state if state is not None else GameState()
+        self.shard = None
+
+    async def _call(self, method: str, *args, **kwargs) -> Any:
+        if self.shard is None or method == "start_game":
+            self.shard = self.runner.shard_for(self.session_id if method != "start_game" else None)
+        shard = self.shard
+        state = self.state.to_bytes() if self.session_id else None
+        state, result, error = await asyncio.wrap_future(shard.call(method, state, args, kwargs))
+        self.state = GameState.from_bytes(state)
+        self.runner.claim(self.session_id, shard, self.finished)
+        if error is not None:
+            raise error
+        return result
+
+    async def start_game(self, *, language: str = "en", child_mode: bool = False, theme: str = "c", stream: bool = False):
+        """
+        Starts a new game session, as `AsyncClient.start_game`.
+        """
+        self.state = GameState()
+        await self._call("start_game", language=language, child_mode=child_mode, theme=theme, stream=stream)
+
+    async def answer(self, answer: str):
+        """
+        Submits an answer to the current question, as `AsyncClient.answer`.
+        """
+        await self._call("answer", answer)
+
+    async def answer_many(self, answers: List[str]) -> List[Step]:
+        """
+        Submits a sequence of answers in a single call to the shard, as `AsyncClient.answer_many`.
+        """
+        return await self._call("answer_many", list(answers))
+
+    async def back(self):
+        """
+        Goes back to the previous question, as `AsyncClient.back`.
+        """
+        await self._call("back")
+
+    async def exclude(self):
+        """
+        Excludes the current proposition, as `AsyncClient.exclude`.
+        """
+        await self._call("exclude")
+
+    async def choose(self):
+        """
+        Chooses the current proposition, as `AsyncClient.choose`.
+        """
+        await self._call("choose")
+
+    async def defeat(self):
+        """
+        Handles the defeat scenario in the game, as `AsyncClient.defeat`.
+        """
+        await self._call("defeat")
+
+    async def dump_state(self) -> bytes:
+        """
+        Serializes the current game, as `AsyncClient.dump_state`.
+        """
+        return self.state.to_bytes()
+
+    async def close(self):
+        """
+        Does nothing, as the shards belong to the runner.
+        """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __repr__(self):
+        return f"<Sharded Akinator Client (Language: {self.language}, Step: {self.step}, Progression: {self.progression}%)>"
+
+
+class ShardedRunner:
+    """
+    Spreads games over a set of worker processes, so that the parsing, JSON decoding and Cloudflare challenge solving of
+    thousands of concurrent games use every core.
+
+    Each shard is a process running its own event loop, which plays many games at once, each with its own `AsyncClient`
+    created by `factory`. A game's client is kept in the shard between calls, so that its undo history and warm-ups
+    carry over. New games go to the least busy shard and stay there, keeping its cookies and connections. A game resumed
+    from its state goes back to the shard which last played it, and keeps its client, as long as the runner has
+    played it recently; otherwise, it is assigned to a shard by session ID, and gets a new client. Clients are obtained with `client`, and can be used with `GameRunner`
+    through `GameRunner(factory=runner.client)`.
+
+    Metrics, caches and warm-ups configured by `factory` stay in the shards. Objects which must not be shared between
+    games, such as an `UndoHistory`, must be created by each call of `factory`.
+
+    :param shards: The number of worker processes. Defaults to the number of CPUs.
+    :type shards: Optional[int]
+    :param factory: A picklable callable, e.g. a module-level function, creating the `AsyncClient` of each game. Defaults to clients sharing the shard's `SessionPool`.
+    :type factory: Optional[Callable[[], AsyncClient]]
+    :param start_method: The multiprocessing start method, e.g. "spawn". Defaults to the platform's default.
+    :type start_method: Optional[str]
+    """
+
+    def __init__(self, shards: Optional[int] = None, factory: Optional[Callable[[], AsyncClient]] = None, *, start_method: Optional[str] = None):
+        shards = shards if shards else os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError("shards must be at least 1.")
+        context = multiprocessing.get_context(start_method)
+        self.shards = [_Shard(index, factory if factory else _default_factory, context) for index in range(shards)]
+        self._owners: "OrderedDict[str, _Shard]" = OrderedDict()
+        self._lock = Lock()
+
+    def shard_for(self, session_id: Optional[str]) -> _Shard:
+        """
+        Returns the shard owning a session, or the least busy shard for a new game.
+
+        :param session_id: The session ID of the game, if it has started.
+        :type session_id: Optional[str]
+        """
+        if not session_id:
+            return min(self.shards, key=lambda shard: len(shard.pending))
+        with self._lock:
+            owner = self._owners.get(session_id)
+        return owner if owner is not None else self.shards[crc32(session_id.encode()) % len(self.shards)]
+
+    def claim(self, session_id: Optional[str], shard: _Shard, finished: bool = False):
+        """
+        Records the shard which last played a session, so that clients resuming it are routed there. Called by the clients.
+
+        :param session_id: The session ID of the game.
+        :type session_id: Optional[str]
+        :param shard: The shard which played the call.
+        :type shard: _Shard
+        :param finished: Whether the game has ended, in which case the session is forgotten. Defaults to False.
+        :type finished: bool
+        """
+        if not session_id:
+            return
+        with self._lock:
+            self._owners.pop(session_id, None)
+            if not finished:
+                self._owners[session_id] = shard
+                while len(self._owners) > _MAX_GAMES:
+                    self._owners.popitem(last=False)
+
+    def client(self, state: Optional[Union[GameState, bytes, str]] = None) -> ShardedClient:
+        """
+        Returns a new client playing in the shards, optionally resuming a game.
+
+        :param state: An optional game to resume, as a `GameState` or serialized by `dump_state`.
+        :type state: Optional[Union[GameState, bytes, str]]
+        """
+        if state is not None and not isinstance(state, GameState):
+            state = GameState.from_bytes(state)
+        return ShardedClient(self, state)
+
+    def stats(self) -> List[Tuple[int, int]]:
+        """
+        Returns, for each shard, the number of calls it received and the number still pending.
+        """
+        return [(shard.calls, len(shard.pending)) for shard in self.shards]
+
+    def close(self, timeout: float = 5.0):
+        """
+        Stops every shard, waiting for their pending calls to complete.
+
+        :param timeout: How long, in seconds, to wait for each shard before terminating it. Defaults to 5.
+        :type timeout: float
+        """
+        for shard in self.shards:
+            shard.close(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
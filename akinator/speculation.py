@@ -0,0 +1,264 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Awaitable, Callable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Lock, Thread
+from time import monotonic
+import asyncio
+
+
+class _Timer:
+    """
+    A call scheduled by `_Scheduler`, which can be cancelled until it is due.
+    """
+
+    __slots__ = ("callback", "args")
+
+    def __init__(self, callback: Callable, args: tuple):
+        self.callback = callback
+        self.args = args
+
+    def cancel(self):
+        """
+        Prevents the call if it has not been made yet.
+        """
+        self.callback = None
+
+
+class _Scheduler:
+    """
+    A single thread waiting for the warm-ups of every synchronous client, instead of one parked timer thread per
+    question. Due warm-ups are sent by a small pool of threads, so that a slow one does not delay the others.
+    """
+
+    def __init__(self, workers: int = 4):
+        self.workers = workers
+        self._condition = Condition()
+        self._timers: List[Tuple[float, int, _Timer]] = []
+        self._sequence = count()
+        self._thread: Optional[Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def schedule(self, delay: float, callback: Callable, *args) -> _Timer:
+        """
+        Calls `callback(*args)` on the pool after `delay` seconds, unless the returned timer is cancelled first.
+        """
+        timer = _Timer(callback, args)
+        with self._condition:
+            heappush(self._timers, (monotonic() + delay, next(self._sequence), timer))
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="akinator-warmup")
+                self._thread = Thread(target=self._run, name="akinator-warmup-scheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return timer
+
+    def _due(self) -> _Timer:
+        with self._condition:
+            while True:
+                while self._timers and self._timers[0][2].callback is None:
+                    heappop(self._timers)
+                if not self._timers:
+                    self._condition.wait()
+                    continue
+                remaining = self._timers[0][0] - monotonic()
+                if remaining <= 0:
+                    return heappop(self._timers)[2]
+                self._condition.wait(remaining)
+
+    def _run(self):
+        while True:
+            timer = self._due()
+            callback, timer.callback = timer.callback, None
+            if callback is not None:
+                self._executor.submit(callback, *timer.args)
+
+
+_SCHEDULER = _Scheduler()
+
+
+class Warmup:
+    """
+    A warm-up of the connection to a host, scheduled by `Speculation.warm` or `Speculation.warm_async`.
+
+    :ivar state: "pending" until the request is sent, then "sending", "warm" or "failed", and "used" or "discarded" once the client moved on.
+    """
+
+    def __init__(self, speculation: "Speculation"):
+        self.speculation = speculation
+        self.state = "pending"
+        self._lock = Lock()
+        self._handle = None
+
+    def _begin(self) -> bool:
+        with self._lock:
+            if self.state != "pending":
+                return False
+            self.state = "sending"
+        self.speculation.record(issued=1)
+        return True
+
+    def _finish(self, warm: bool):
+        with self._lock:
+            previous = self.state
+            if previous == "sending":
+                self.state = "warm" if warm else "failed"
+        if previous != "sending" or not warm:
+            self.speculation.record(wasted=1)
+
+    def start(self, get: Callable, url: str, delay: float):
+        """
+        Sends the warm-up after a delay from the threads shared by every synchronous client.
+        """
+        self._handle = _SCHEDULER.schedule(delay, self._send, get, url)
+
+    def start_async(self, get: Callable[..., Awaitable], url: str, delay: float):
+        """
+        Sends the warm-up from a task on the running event loop after a delay, for asynchronous clients.
+        """
+        self._handle = asyncio.ensure_future(self._send_async(get, url, delay))
+
+    def _send(self, get: Callable, url: str):
+        if not self._begin():
+            return
+        try:
+            get(url).close()
+        except Exception:
+            self._finish(False)
+            return
+        self._finish(True)
+
+    async def _send_async(self, get: Callable[..., Awaitable], url: str, delay: float):
+        await asyncio.sleep(delay)
+        if not self._begin():
+            return
+        try:
+            (await get(url)).close()
+        except Exception:
+            self._finish(False)
+            return
+        self._finish(True)
+
+    def _stop(self, state: str) -> str:
+        with self._lock:
+            previous, self.state = self.state, state
+        if previous == "pending" and self._handle is not None:
+            self._handle.cancel()
+        return previous
+
+    def use(self):
+        """
+        Marks the warm-up as used by the next request of the client, cancelling it if it has not been sent yet.
+        """
+        previous = self._stop("used")
+        self.speculation.record(saved=1 if previous == "warm" else 0, misses=0 if previous == "warm" else 1)
+
+    def discard(self):
+        """
+        Cancels the warm-up if it has not been sent yet, e.g. when the game ends, and counts it as wasted if it has.
+        """
+        if self._stop("discarded") == "warm":
+            self.speculation.record(wasted=1)
+
+
+class Speculation:
+    """
+    Opt-in pre-warming of the connection to Akinator while the player decides, shared by any number of clients.
+
+    Whenever a client given a `Speculation` reaches a question, it schedules a warm-up: if the player has not answered
+    after `warm_after` seconds, the current akitude image is fetched from the same host through the client's transport,
+    so that the answer is sent on an open, recently used connection, with fresh Cloudflare cookies, instead of
+    reconnecting after the idle connection was closed. Answers are never sent ahead of the player: anything sent with
+    the session and signature of a game advances it on the server. Transports without a `get` method are not warmed.
+
+    :param warm_after: How long, in seconds, the player can think before the connection is warmed. Defaults to 10.
+    :type warm_after: float
+
+    :ivar issued: The number of warm-up requests sent.
+    :ivar saved: The number of requests sent on a connection warmed by a completed warm-up.
+    :ivar wasted: The number of warm-up requests which failed, or were not followed by a request of the client.
+    :ivar misses: The number of requests sent without a completed warm-up, mostly because the player answered before `warm_after`.
+    """
+
+    def __init__(self, warm_after: float = 10.0):
+        if warm_after < 0:
+            raise ValueError("warm_after cannot be negative.")
+        self.warm_after = warm_after
+        self.issued = 0
+        self.saved = 0
+        self.wasted = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def warm(self, get: Callable, url: str) -> Warmup:
+        """
+        Schedules a warm-up GET request to a URL from the threads shared by every synchronous client.
+
+        :param get: The `get` method of the client's transport.
+        :type get: Callable
+        :param url: The URL to fetch, on the host of the game.
+        :type url: str
+        """
+        warmup = Warmup(self)
+        warmup.start(get, url, self.warm_after)
+        return warmup
+
+    def warm_async(self, get: Callable[..., Awaitable], url: str) -> Warmup:
+        """
+        Schedules a warm-up GET request to a URL from a task on the running event loop, for asynchronous clients.
+
+        :param get: The `get` coroutine method of the client's transport.
+        :type get: Callable[..., Awaitable]
+        :param url: The URL to fetch, on the host of the game.
+        :type url: str
+        """
+        warmup = Warmup(self)
+        warmup.start_async(get, url, self.warm_after)
+        return warmup
+
+    def record(self, issued: int = 0, saved: int = 0, wasted: int = 0, misses: int = 0):
+        """
+        Adds to the counters. Called by the warm-ups.
+        """
+        with self._lock:
+            self.issued += issued
+            self.saved += saved
+            self.wasted += wasted
+            self.misses += misses
+
+    def stats(self) -> dict:
+        """
+        Returns the number of warm-ups issued, requests saved, warm-ups wasted and misses, and the share of warm-ups which were used.
+        """
+        with self._lock:
+            return {
+                "issued": self.issued,
+                "saved": self.saved,
+                "wasted": self.wasted,
+                "misses": self.misses,
+                "efficiency": self.saved / self.issued if self.issued else 0.0,
+            }
@@ -0,0 +1,198 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import NamedTuple, Optional, Union
+from json import dumps, loads
+
+STATE_VERSION = 2
+
+
+class GameState:
+    """
+    A compact record of everything describing a game, kept separate from the transport used to play it.
+
+    Parking a game only requires keeping its state: a client can be rebuilt around it later, with any session.
+
+    :ivar language: The language used for the game session, represented as a string (e.g., "en" for English).
+    :ivar theme: The theme of the game session, which can be "c" (characters), "a" (animals), or "o" (objects).
+    :ivar child_mode: A boolean indicating whether child mode is enabled for the game session.
+    :ivar session_id: The unique identifier for the current game session.
+    :ivar signature: The signature for the current game session.
+    :ivar identifiant: The unique identifier for the player in the current game session.
+    :ivar question: The current question being asked in the game session.
+    :ivar progression: The progression percentage of the game session, represented as a float.
+    :ivar step: The current step number in the game session.
+    :ivar akitude: The current akitude image associated with the game session.
+    :ivar step_last_proposition: The last proposition made in the current step.
+    :ivar finished: A boolean indicating whether the game session has finished.
+    :ivar win: A boolean indicating whether the player has won the game session.
+    :ivar id_proposition: The unique identifier for the current proposition in the game session.
+    :ivar name_proposition: The name of the current proposition in the game session.
+    :ivar description_proposition: The description of the current proposition in the game session.
+    :ivar proposition: The current proposition being made in the game session.
+    :ivar completion: The completion status of the game session.
+    :ivar flag_photo: The URL of the flag photo associated with the current game session.
+    :ivar photo: The URL of the character photo associated with the current game session.
+    :ivar pseudo: The pseudo name of the player in the current game session.
+    :ivar answers: The path of answers leading to the current step, one character per step: the answer ID, or "x" for an excluded proposition.
+    """
+
+    __slots__ = (
+        "language", "theme", "child_mode", "session_id", "signature", "identifiant",
+        "question", "progression", "step", "akitude", "step_last_proposition", "finished",
+        "win", "id_proposition", "name_proposition", "description_proposition", "proposition", "completion",
+        "flag_photo", "photo", "pseudo", "answers",
+    )
+
+    def __init__(self, **kwargs):
+        self.language = None
+        self.theme = None
+        self.child_mode = False
+        self.session_id = None
+        self.signature = None
+        self.identifiant = None
+
+        self.question = None
+        self.progression = None
+        self.step = None
+        self.akitude = None
+        self.step_last_proposition = ""
+        self.finished = False
+
+        self.win = False
+        self.id_proposition = None
+        self.name_proposition = None
+        self.description_proposition = None
+        self.proposition = ""
+        self.completion = None
+
+        self.flag_photo = None
+        self.photo = None
+        self.pseudo = None
+        self.answers = ""
+
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def copy(self) -> "GameState":
+        """
+        Returns a shallow copy of the state.
+        """
+        state = GameState.__new__(GameState)
+        for name in self.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
+
+    def to_dict(self) -> dict:
+        """
+        Returns the state as a dictionary.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the state into a compact JSON array of its values, prefixed by a format version.
+        """
+        return dumps([STATE_VERSION, *(getattr(self, name) for name in self.__slots__)], ensure_ascii=False, separators=(",", ":")).encode()
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str]) -> "GameState":
+        """
+        Deserializes a state produced by `to_bytes`, including by an earlier version of the library.
+
+        :param data: The serialized state.
+        :type data: Union[bytes, str]
+        """
+        values = loads(data)
+        if not isinstance(values, list) or not values or values[0] not in (1, STATE_VERSION):
+            raise ValueError("Unsupported game state format.")
+        # Version 1 predates the `answers` slot.
+        names = cls.__slots__ if values[0] == STATE_VERSION else cls.__slots__[:-1]
+        if len(values) != len(names) + 1:
+            raise ValueError("Malformed game state.")
+        state = cls()
+        for name, value in zip(names, values[1:]):
+            setattr(state, name, value)
+        return state
+
+    def __eq__(self, other):
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"<GameState (Language: {self.language}, Theme: {self.theme}, Step: {self.step}, Progression: {self.progression}%)>"
+
+
+class Step(NamedTuple):
+    """
+    A step of a game, recorded after an answer by `Client.answer_many` and `AsyncClient.answer_stream`.
+    """
+
+    answer: str
+    step: int
+    question: str
+    progression: float
+    proposition: Optional[str] = None
+
+
+def _state_attribute(name: str) -> property:
+    def getter(self):
+        return getattr(self.state, name)
+
+    def setter(self, value):
+        setattr(self.state, name, value)
+
+    return property(getter, setter, doc=f"The `{name}` attribute of the current `GameState`.")
+
+
+class GameStateView:
+    """
+    A mixin exposing every `GameState` attribute of `self.state` as an attribute of the object itself.
+    """
+
+    state: Optional[GameState] = None
+
+    language = _state_attribute("language")
+    theme = _state_attribute("theme")
+    child_mode = _state_attribute("child_mode")
+    session_id = _state_attribute("session_id")
+    signature = _state_attribute("signature")
+    identifiant = _state_attribute("identifiant")
+    question = _state_attribute("question")
+    progression = _state_attribute("progression")
+    step = _state_attribute("step")
+    akitude = _state_attribute("akitude")
+    step_last_proposition = _state_attribute("step_last_proposition")
+    finished = _state_attribute("finished")
+    win = _state_attribute("win")
+    id_proposition = _state_attribute("id_proposition")
+    name_proposition = _state_attribute("name_proposition")
+    description_proposition = _state_attribute("description_proposition")
+    proposition = _state_attribute("proposition")
+    completion = _state_attribute("completion")
+    flag_photo = _state_attribute("flag_photo")
+    photo = _state_attribute("photo")
+    pseudo = _state_attribute("pseudo")
+    answers = _state_attribute("answers")
@@ -0,0 +1,509 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, NamedTuple, Optional
+from collections import Counter, OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from random import Random
+from threading import Lock, Thread
+from uuid import uuid4
+import asyncio
+import time
+
+from requests import Session
+
+from .pages import ENDPOINTS, GAME_PAGE, WIN_PAGE, akitude, json_response, parse_form, route
+from .transport import AsyncCloudScraper, AsyncHTTPSession, AsyncTransport, Response, Transport, aiohttp
+
+QUESTIONS = [
+    "Is your character real?",
+    "Is your character a girl?",
+    "Is your character from a video game?",
+    "Does your character have a beard?",
+    "Is your character a YouTuber?",
+    "Is your character older than 40?",
+    "Does your character wear glasses?",
+    "Is your character known for singing?",
+    "Is your character from an anime?",
+    "Does your character have superpowers?",
+]
+
+CHARACTERS = [
+    ("Mario", "Video game character"),
+    ("Sherlock Holmes", "Fictional detective"),
+    ("Marie Curie", "Physicist and chemist"),
+    ("Pikachu", "Pokemon"),
+    ("Darth Vader", "Star Wars"),
+]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class Conditions(NamedTuple):
+    """
+    The latency and failures injected by a `FakeAkinator`.
+
+    :param latency: The base latency of every request, in seconds. Defaults to 0.
+    :type latency: float
+    :param jitter: A random latency, in seconds, added to the base latency. Defaults to 0.
+    :type jitter: float
+    :param error_rate: The probability of a request failing with `error_status`. Defaults to 0.
+    :type error_rate: float
+    :param error_status: The status code of injected errors. Defaults to 503.
+    :type error_status: int
+    :param timeout_rate: The probability of an answer ending the session with "KO - TIMEOUT". Defaults to 0.
+    :type timeout_rate: float
+    :param soundlike_rate: The probability of an answer ending the game with "SOUNDLIKE". Defaults to 0.
+    :type soundlike_rate: float
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    timeout_rate: float = 0.0
+    soundlike_rate: float = 0.0
+
+
+class FakeAkinator:
+    """
+    An offline stand-in for the Akinator service, answering `/game`, `/answer`, `/cancel_answer`, `/exclude` and
+    `/choice` with pages and JSON shaped like the real ones, so that clients can be tested and benchmarked without
+    reaching akinator.com.
+
+    Akinator proposes a character once the progression reaches 90%, or every `propose_after` steps. The fake is
+    driven through `FakeServer` over HTTP, or in-process through `FakeTransport` / `AsyncFakeTransport`.
+
+    :param conditions: The latency and failures to inject. Defaults to none.
+    :type conditions: Optional[Conditions]
+    :param propose_after: The number of steps after which a character is proposed. Defaults to 20.
+    :type propose_after: int
+    :param max_sessions: The maximum number of sessions kept, the oldest being timed out first. Defaults to 10000.
+    :type max_sessions: int
+    :param seed: An optional seed making the injected latency, errors and games reproducible.
+    :type seed: Optional[int]
+
+    :ivar conditions: The injected `Conditions`, which can be replaced while serving.
+    :ivar requests: A `Counter` of the requests received per endpoint.
+    :ivar injected: A `Counter` of the injected failures per kind: "error", "timeout" or "soundlike".
+    """
+
+    def __init__(self, conditions: Optional[Conditions] = None, *, propose_after: int = 20, max_sessions: int = 10000, seed: Optional[int] = None):
+        self.conditions = conditions if conditions is not None else Conditions()
+        self.propose_after = propose_after
+        self.max_sessions = max_sessions
+        self.requests = Counter()
+        self.injected = Counter()
+        self._random = Random(seed)
+        self._lock = Lock()
+        self._sessions: "OrderedDict[str, dict]" = OrderedDict()
+
+    def delay(self) -> float:
+        """
+        Returns the latency of the next request, in seconds.
+        """
+        conditions = self.conditions
+        if not conditions.jitter:
+            return conditions.latency
+        with self._lock:
+            return conditions.latency + self._random.random() * conditions.jitter
+
+    def _roll(self, rate: float) -> bool:
+        return rate > 0 and self._random.random() < rate
+
+    def _error(self, url):
+        if self._roll(self.conditions.error_rate):
+            self.injected["error"] += 1
+            return Response(self.conditions.error_status, b"", {"Content-Type": "text/plain", "Retry-After": "0"}, url)
+        return None
+
+    def _failure(self):
+        for kind, rate, completion in (("timeout", self.conditions.timeout_rate, "KO - TIMEOUT"), ("soundlike", self.conditions.soundlike_rate, "SOUNDLIKE")):
+            if self._roll(rate):
+                self.injected[kind] += 1
+                return completion
+        return None
+
+    def handle(self, language: str, endpoint: str, form: Dict[str, str]) -> Response:
+        """
+        Handles a request and returns its response, without applying the latency.
+
+        :param language: The language of the request, i.e. the subdomain of the requested host.
+        :type language: str
+        :param endpoint: The requested endpoint, e.g. "answer".
+        :type endpoint: str
+        :param form: The form data of the request.
+        :type form: Dict[str, str]
+        """
+        url = f"https://{language}.akinator.com/{endpoint}"
+        with self._lock:
+            self.requests[endpoint] += 1
+            if endpoint not in ENDPOINTS:
+                return Response(404, b"Not Found", {"Content-Type": "text/plain"}, url)
+            error = self._error(url)
+            if error is not None:
+                return error
+            if endpoint == "game":
+                return self._start(language, form, url)
+
+            game = self._sessions.get(str(form.get("session")))
+            if game is None or str(form.get("signature")) != game["signature"]:
+                return json_response({"completion": "KO - TIMEOUT"}, url)
+            self._sessions.move_to_end(game["session"])
+            return self._play(game, endpoint, form, url)
+
+    def _play(self, game, endpoint, form, url):
+        if endpoint == "choice":
+            del self._sessions[game["session"]]
+            return Response(200, WIN_PAGE.format(times=self._random.randint(1, 99999)).encode(), {"Content-Type": "text/html; charset=utf-8"}, url)
+        if endpoint != "cancel_answer":
+            completion = self._failure()
+            if completion is not None:
+                del self._sessions[game["session"]]
+                return json_response({"completion": completion}, url)
+        if endpoint == "answer":
+            return self._answer(game, form, url)
+        if endpoint == "exclude":
+            game["character"] = (game["character"] + 1) % len(CHARACTERS)
+            game["progression"] = max(0.0, game["progression"] - 30)
+            return self._question(game, game["step"] + 1, url)
+        return self._question(game, max(0, game["step"] - 1), url)
+
+    def asset(self, url: str) -> Response:
+        """
+        Handles a GET request for an image, e.g. an akitude or a photo, and returns a small fake PNG unique to the URL.
+
+        :param url: The requested URL.
+        :type url: str
+        """
+        with self._lock:
+            self.requests["asset"] += 1
+            error = self._error(url)
+        if error is not None:
+            return error
+        return Response(200, PNG_SIGNATURE + url.encode(), {"Content-Type": "image/png"}, url)
+
+    def _start(self, language, form, url):
+        game = {
+            "session": str(uuid4()),
+            "signature": str(self._random.randint(10 ** 8, 10 ** 10)),
+            "identifiant": uuid4().hex[:10],
+            "language": language,
+            "child_mode": str(form.get("cm", "false")) == "true",
+            "step": 0,
+            "progression": 0.0,
+            "step_last_proposition": 0,
+            "character": self._random.randrange(len(CHARACTERS)),
+        }
+        self._sessions[game["session"]] = game
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        page = GAME_PAGE.format(question=QUESTIONS[0], session=game["session"], signature=game["signature"], identifiant=game["identifiant"])
+        return Response(200, page.encode(), {"Content-Type": "text/html; charset=utf-8"}, url)
+
+    def _answer(self, game, form, url):
+        answer = int(form.get("answer", 2))
+        step = game["step"] + 1
+        game["progression"] = min(100.0, game["progression"] + (2.0 if answer == 2 else 5.0 if answer > 2 else 8.0) * self._random.uniform(0.5, 1.5))
+        if game["progression"] >= 90 or step - game["step_last_proposition"] >= self.propose_after:
+            game["step_last_proposition"] = game["step"]
+            name, description = CHARACTERS[game["character"]]
+            return json_response({
+                "completion": "OK",
+                "id_proposition": str(1000 + game["character"]),
+                "id_base_proposition": str(2000 + game["character"]),
+                "valide_contrainte": "1",
+                "name_proposition": name,
+                "description_proposition": description,
+                "flag_photo": 0,
+                "photo": f"https://photos.clarinea.fr/BL_{game['character']}_{game['language']}/600/partenaire/x/{game['character']}.jpg",
+                "pseudo": "fake",
+                "nb_elements": 1,
+            }, url)
+        return self._question(game, step, url)
+
+    def _question(self, game, step, url):
+        game["step"] = step
+        if step < game["step_last_proposition"]:
+            game["step_last_proposition"] = 0
+        progression = game["progression"]
+        return json_response({
+            "completion": "OK",
+            "akitude": akitude(progression),
+            "step": str(step),
+            "progression": f"{progression:.5f}",
+            "question_id": str(step % len(QUESTIONS)),
+            "question": QUESTIONS[step % len(QUESTIONS)],
+        }, url)
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+class FakeTransport:
+    """
+    A `Transport` answering every request in-process from a `FakeAkinator`, sleeping for its latency.
+
+    :param akinator: The fake service to use. If not provided, a new `FakeAkinator` is created.
+    :type akinator: Optional[FakeAkinator]
+    """
+
+    def __init__(self, akinator: Optional[FakeAkinator] = None):
+        self.akinator = akinator if akinator is not None else FakeAkinator()
+
+    def post(self, url, data=None, **_kwargs):
+        """
+        Performs a POST request against the fake service.
+        """
+        delay = self.akinator.delay()
+        if delay:
+            time.sleep(delay)
+        return self.akinator.handle(*route(url), parse_form(data))
+
+    def get(self, url, **_kwargs):
+        """
+        Performs a GET request for an image against the fake service.
+        """
+        delay = self.akinator.delay()
+        if delay:
+            time.sleep(delay)
+        return self.akinator.asset(url)
+
+    def close(self):
+        """
+        Does nothing, as no resources are held.
+        """
+
+
+class AsyncFakeTransport:
+    """
+    An `AsyncTransport` answering every request in-process from a `FakeAkinator`, sleeping for its latency on the event loop.
+
+    :param akinator: The fake service to use. If not provided, a new `FakeAkinator` is created.
+    :type akinator: Optional[FakeAkinator]
+    """
+
+    def __init__(self, akinator: Optional[FakeAkinator] = None):
+        self.akinator = akinator if akinator is not None else FakeAkinator()
+
+    async def post(self, url, data=None, **_kwargs):
+        """
+        Performs a POST request against the fake service.
+        """
+        delay = self.akinator.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self.akinator.handle(*route(url), parse_form(data))
+
+    async def get(self, url, **_kwargs):
+        """
+        Performs a GET request for an image against the fake service.
+        """
+        delay = self.akinator.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self.akinator.asset(url)
+
+    async def close(self):
+        """
+        Does nothing, as no resources are held.
+        """
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self): # pylint: disable=invalid-name
+        """
+        Answers a form POST through `FakeAkinator.handle`.
+        """
+        akinator = self.server.akinator
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_form(self.rfile.read(length))
+        delay = akinator.delay()
+        if delay:
+            time.sleep(delay)
+        language, endpoint = route(f"http://{self.headers.get('Host', 'en')}{self.path}")
+        response = akinator.handle(language, endpoint, form)
+        self._respond(response)
+
+    def do_GET(self): # pylint: disable=invalid-name
+        """
+        Answers an image GET through `FakeAkinator.asset`.
+        """
+        akinator = self.server.akinator
+        delay = akinator.delay()
+        if delay:
+            time.sleep(delay)
+        self._respond(akinator.asset(f"http://{self.headers.get('Host', 'en')}{self.path}"))
+
+    def _respond(self, response):
+        self.send_response(response.status_code)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.content)))
+        self.end_headers()
+        self.wfile.write(response.content)
+
+    def log_message(self, format, *args): # pylint: disable=redefined-builtin
+        pass
+
+
+class FakeServer:
+    """
+    A local HTTP server exposing a `FakeAkinator` on a background thread, with one thread per connection.
+
+    Requests are routed by path, e.g. `http://127.0.0.1:<port>/fr/answer`. Clients reach it through `LocalTransport` /
+    `AsyncLocalTransport`, which rewrite the akinator.com URLs they build.
+
+    :param akinator: The fake service to expose. If not provided, a new `FakeAkinator` is created.
+    :type akinator: Optional[FakeAkinator]
+    :param host: The address to listen on. Defaults to "127.0.0.1".
+    :type host: str
+    :param port: The port to listen on. Defaults to 0, i.e. any free port.
+    :type port: int
+    """
+
+    def __init__(self, akinator: Optional[FakeAkinator] = None, host: str = "127.0.0.1", port: int = 0):
+        self.akinator = akinator if akinator is not None else FakeAkinator()
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the base URL of the server.
+        """
+        return f"http://{self.host}:{self.port}"
+
+    def local_url(self, url: str) -> str:
+        """
+        Rewrites an akinator.com URL, e.g. `https://fr.akinator.com/answer`, to the equivalent URL on this server.
+
+        :param url: The URL to rewrite.
+        :type url: str
+        """
+        language, endpoint = route(url)
+        return f"{self.url}/{language}/{endpoint}"
+
+    def start(self) -> "FakeServer":
+        """
+        Starts serving on a background thread.
+        """
+        if self._server is None:
+            self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+            self._server.daemon_threads = True
+            self._server.akinator = self.akinator
+            self.port = self._server.server_address[1]
+            self._thread = Thread(target=self._server.serve_forever, name="akinator-fake-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server and waits for its thread to exit.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class LocalTransport:
+    """
+    A `Transport` sending every request to a `FakeServer` instead of akinator.com.
+
+    :param server: The server to send requests to.
+    :type server: FakeServer
+    :param transport: An optional transport to send the rewritten requests with. Defaults to a `requests.Session`.
+    :type transport: Optional[Transport]
+    """
+
+    def __init__(self, server: FakeServer, transport: Optional[Transport] = None):
+        self.server = server
+        self.transport = transport if transport is not None else Session()
+
+    def post(self, url, data=None, json=None, **kwargs):
+        """
+        Performs a POST request against the fake server.
+        """
+        return self.transport.post(self.server.local_url(url), data=data, json=json, **kwargs)
+
+    def get(self, url, **kwargs):
+        """
+        Performs a GET request against the fake server.
+        """
+        return self.transport.get(self.server.local_url(url), **kwargs)
+
+    def close(self):
+        """
+        Closes the underlying transport.
+        """
+        self.transport.close()
+
+
+class AsyncLocalTransport:
+    """
+    An `AsyncTransport` sending every request to a `FakeServer` instead of akinator.com.
+
+    :param server: The server to send requests to.
+    :type server: FakeServer
+    :param transport: An optional transport to send the rewritten requests with. Defaults to an `AsyncHTTPSession` if `aiohttp` is installed, and to an `AsyncCloudScraper` otherwise.
+    :type transport: Optional[AsyncTransport]
+    """
+
+    def __init__(self, server: FakeServer, transport: Optional[AsyncTransport] = None):
+        self.server = server
+        if transport is None:
+            transport = AsyncHTTPSession() if aiohttp is not None else AsyncCloudScraper(Session())
+        self.transport = transport
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        """
+        Performs a POST request against the fake server.
+        """
+        return await self.transport.post(self.server.local_url(url), data=data, json=json, **kwargs)
+
+    async def get(self, url, **kwargs):
+        """
+        Performs a GET request against the fake server.
+        """
+        return await self.transport.get(self.server.local_url(url), **kwargs)
+
+    async def close(self):
+        """
+        Closes the underlying transport.
+        """
+        await self.transport.close()
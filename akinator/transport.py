@@ -0,0 +1,320 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Optional, Protocol, runtime_checkable
+from json import loads
+from cloudscraper import CloudScraper, create_scraper
+from requests import HTTPError
+from requests.structures import CaseInsensitiveDict
+
+from .clearance import is_challenge
+from .executor import BoundedExecutor, get_default_executor
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:
+    aiohttp = None
+
+
+@runtime_checkable
+class HTTPResponse(Protocol):
+    """
+    The minimal response contract expected by the clients. `requests.Response` and `Response` both satisfy it.
+    """
+
+    status_code: int
+
+    @property
+    def text(self) -> str:
+        """
+        Returns the body of the response, decoded as text.
+        """
+
+    def json(self) -> Any:
+        """
+        Decodes the body of the response as JSON.
+        """
+
+    def raise_for_status(self) -> None:
+        """
+        Raises an exception if the status code denotes a client or server error.
+        """
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """
+    The contract for synchronous transports used by `Client`. `CloudScraper` satisfies it.
+    """
+
+    def post(self, url: str, data: Optional[dict] = None, json: Optional[Any] = None, **kwargs) -> HTTPResponse:
+        """
+        Performs a POST request. Implementations should accept the `timeout`, `allow_redirects` and `stream` keyword arguments.
+        """
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the transport.
+        """
+
+
+@runtime_checkable
+class AsyncTransport(Protocol):
+    """
+    The contract for asynchronous transports used by `AsyncClient`.
+    """
+
+    async def post(self, url: str, data: Optional[dict] = None, json: Optional[Any] = None, **kwargs) -> HTTPResponse:
+        """
+        Performs a POST request. Implementations should accept the `timeout`, `allow_redirects` and `stream` keyword arguments.
+        """
+
+    async def close(self) -> None:
+        """
+        Releases any resources held by the transport.
+        """
+
+
+class Response:
+    """
+    A minimal, fully-read HTTP response, mirroring the parts of `requests.Response` used by the clients.
+
+    :param status_code: The HTTP status code of the response.
+    :type status_code: int
+    :param content: The raw body of the response.
+    :type content: bytes
+    :param headers: The response headers.
+    :type headers: Optional[dict]
+    :param url: The final URL of the response, after redirects.
+    :type url: str
+    :param encoding: The encoding used to decode the body. Defaults to "utf-8".
+    :type encoding: Optional[str]
+    """
+
+    def __init__(self, status_code: int, content: bytes = b"", headers: Optional[dict] = None, url: str = "", encoding: Optional[str] = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers if headers else {})
+        self.url = url
+        self.encoding = encoding if encoding else "utf-8"
+
+    @property
+    def text(self) -> str:
+        """
+        Returns the body of the response, decoded as text.
+        """
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns whether the status code is lower than 400.
+        """
+        return self.status_code < 400
+
+    def json(self):
+        """
+        Decodes the body of the response as JSON.
+        """
+        return loads(self.text)
+
+    def raise_for_status(self):
+        """
+        Raises a `requests.HTTPError` if the status code denotes a client or server error.
+        """
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise HTTPError(f"{self.status_code} {kind} Error for url: {self.url}", response=self)
+
+    def iter_content(self, chunk_size: int = 1, decode_unicode: bool = False):
+        """
+        Iterates over the body of the response in chunks, for compatibility with streamed `requests` responses.
+        """
+        for start in range(0, len(self.content), chunk_size):
+            chunk = self.content[start:start + chunk_size]
+            yield chunk.decode(self.encoding, errors="replace") if decode_unicode else chunk
+
+    def close(self):
+        """
+        Does nothing, as the body has already been read.
+        """
+
+    def __repr__(self):
+        return f"<Response [{self.status_code}]>"
+
+
+class StreamingResponse(Response):
+    """
+    A response returned by `AsyncHTTPSession.post` with `stream=True`, whose body has not been read yet.
+
+    The body is read with `aiter_content`, and the connection must be released with `close` once done.
+    """
+
+    def __init__(self, raw):
+        super().__init__(raw.status, b"", dict(raw.headers), str(raw.url), raw.charset)
+        self.raw = raw
+
+    async def aiter_content(self, chunk_size: int = 1024):
+        """
+        Iterates over the body of the response in chunks, as it is received.
+        """
+        async for chunk in self.raw.content.iter_chunked(chunk_size):
+            yield chunk
+
+    def close(self):
+        """
+        Releases the connection, discarding any unread part of the body.
+        """
+        self.raw.close()
+
+
+class AsyncCloudScraper:
+    """
+    An asynchronous wrapper around `CloudScraper` to handle HTTP requests.
+
+    Requests run on a `BoundedExecutor` instead of the event loop's default executor, so that they neither starve nor
+    wait behind the other users of `asyncio.to_thread`.
+
+    :param scraper: An optional `CloudScraper` object to wrap. If not provided, one is created from the keyword arguments.
+    :type scraper: Optional[CloudScraper]
+    :param executor: An optional `BoundedExecutor` to run requests on. Defaults to the process-wide executor returned by `get_default_executor`, shared by every transport.
+    :type executor: Optional[BoundedExecutor]
+    """
+    def __init__(self, scraper: Optional[CloudScraper] = None, *, executor: Optional[BoundedExecutor] = None, **kwargs):
+        self.scraper = scraper if scraper else create_scraper(**kwargs)
+        self.executor = executor if executor is not None else get_default_executor()
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        """
+        An asynchronous method to perform a POST request using the `cloudscraper` library.
+        """
+        return await self.executor.run(self.scraper.post, url, data=data, json=json, **kwargs)
+
+    async def get(self, url, **kwargs):
+        """
+        An asynchronous method to perform a GET request using the `cloudscraper` library.
+        """
+        return await self.executor.run(self.scraper.get, url, **kwargs)
+
+    async def close(self):
+        """
+        Closes the underlying `CloudScraper` session. The executor is left running, as it may be shared.
+        """
+        self.scraper.close()
+
+
+class AsyncHTTPSession:
+    """
+    A non-blocking HTTP session running on the event loop, backed by `aiohttp`.
+
+    Connections are pooled and kept alive per host, so concurrency is bounded by sockets instead of worker threads.
+    Cloudflare challenges are not solved natively: the `aiohttp` cookie jar starts from the scraper's cookies, and
+    when a challenge is encountered, the request is replayed once through `cloudscraper` on `executor` and the
+    resulting clearance cookies are copied into the jar.
+
+    :param limit: The maximum number of simultaneous connections. Defaults to 100.
+    :type limit: int
+    :param limit_per_host: The maximum number of simultaneous connections to a single host. Defaults to 10.
+    :type limit_per_host: int
+    :param keepalive_timeout: How long, in seconds, an idle connection is kept open. Defaults to 30.
+    :type keepalive_timeout: float
+    :param timeout: The total timeout of a request, in seconds. Defaults to no timeout.
+    :type timeout: Optional[float]
+    :param scraper: An optional `CloudScraper` object used for its headers and as a fallback for Cloudflare challenges.
+    :type scraper: Optional[CloudScraper]
+
+    :ivar executor: The `BoundedExecutor` running the fallback requests, instead of the event loop's default executor. Defaults to the process-wide executor returned by `get_default_executor`.
+    """
+
+    def __init__(self, *, limit: int = 100, limit_per_host: int = 10, keepalive_timeout: float = 30.0, timeout: Optional[float] = None, scraper: Optional[CloudScraper] = None, **kwargs):
+        if aiohttp is None:
+            raise RuntimeError("AsyncHTTPSession requires the 'aiohttp' package. Install it with `pip install akinator[aiohttp]`.")
+
+        self.scraper = scraper if scraper else create_scraper(**kwargs)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.executor = get_default_executor()
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host, keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=dict(self.scraper.headers),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            for cookie in self.scraper.cookies:
+                self._session.cookie_jar.update_cookies({cookie.name: cookie.value}, URL(f"https://{cookie.domain.lstrip('.')}/"))
+        return self._session
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        """
+        An asynchronous method to perform a POST request on the event loop. With `stream=True`, a `StreamingResponse` is returned without reading the body.
+        """
+        return await self._request("post", url, data=data, json=json, **kwargs)
+
+    async def get(self, url, **kwargs):
+        """
+        An asynchronous method to perform a GET request on the event loop, e.g. for images.
+        """
+        return await self._request("get", url, **kwargs)
+
+    async def _request(self, method, url, data=None, json=None, **kwargs):
+        session = self._get_session()
+        allow_redirects = kwargs.pop("allow_redirects", True)
+        stream = kwargs.pop("stream", False)
+        if isinstance(kwargs.get("timeout"), (int, float)):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=kwargs["timeout"])
+
+        raw = await session.request(method.upper(), url, data=data, json=json, allow_redirects=allow_redirects, **kwargs)
+        if stream and raw.status not in (403, 429, 503):
+            return StreamingResponse(raw)
+        try:
+            content = await raw.read()
+        finally:
+            raw.release()
+        response = Response(raw.status, content, dict(raw.headers), str(raw.url), raw.charset)
+        response_url = raw.url
+
+        if not is_challenge(response):
+            return response
+
+        timeout = kwargs.get("timeout")
+        timeout = timeout.total if isinstance(timeout, aiohttp.ClientTimeout) else timeout
+        fallback = await self.executor.run(getattr(self.scraper, method), url, data=data, json=json, allow_redirects=allow_redirects, timeout=timeout, stream=stream)
+        session.cookie_jar.update_cookies({cookie.name: cookie.value for cookie in self.scraper.cookies}, response_url)
+        return fallback
+
+    async def close(self):
+        """
+        Closes the underlying `aiohttp` session and its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.scraper.close()
@@ -0,0 +1,140 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Callable, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from .events import Correction
+from .state import GameState
+
+
+class UndoHistory:
+    """
+    Opt-in local undo for a single client, keeping the last steps it has seen so that `back` answers instantly.
+
+    Whenever a client given an `UndoHistory` answers a question, it keeps a snapshot of the question it left. Going back
+    then restores that snapshot right away, and sends the request to the server in the background: on a worker thread
+    for synchronous clients, and in a task for asynchronous ones. Requests stay in order: every other call waits for
+    pending background requests first, and raises their errors. If the server reports another step or question than
+    the restored one, the client switches to it, the history is cleared, and `on_correction` is called with a
+    `Correction` event, from the worker thread or the task. If a background request fails, the server is still at the
+    step the client went back from, so the client returns to it before raising.
+
+    Only the question, step, progression, akitude and answer path are restored, as the server would. A pending
+    connection warm-up is discarded, and started again for the restored question.
+
+    :param size: The maximum number of steps kept. Defaults to 20.
+    :type size: int
+    :param on_correction: An optional callable receiving a `Correction` whenever the server disagrees with a restored step.
+    :type on_correction: Optional[Callable[[Correction], None]]
+
+    :ivar instant: The number of `back` calls answered from the history.
+    :ivar corrections: The number of restored steps corrected by the server.
+    """
+
+    def __init__(self, size: int = 20, on_correction: Optional[Callable[[Correction], None]] = None):
+        if size < 1:
+            raise ValueError("The size of the history must be at least 1.")
+        self.size = size
+        self.on_correction = on_correction
+        self.instant = 0
+        self.corrections = 0
+        self._steps = deque(maxlen=size)
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def push(self, state: GameState):
+        """
+        Keeps a snapshot of a step, dropping the oldest one once the history is full. Called by the clients.
+
+        :param state: The state of the game at that step.
+        :type state: GameState
+        """
+        with self._lock:
+            self._steps.append(state.copy())
+
+    def pop(self, step: int) -> Optional[GameState]:
+        """
+        Returns the snapshot of the given step, discarding the more recent ones, or None if it is not kept. Called by the clients.
+
+        :param step: The step to go back to.
+        :type step: int
+        """
+        with self._lock:
+            while self._steps and self._steps[-1].step > step:
+                self._steps.pop()
+            if self._steps and self._steps[-1].step == step:
+                self.instant += 1
+                return self._steps.pop()
+            return None
+
+    def clear(self):
+        """
+        Discards every snapshot.
+        """
+        with self._lock:
+            self._steps.clear()
+
+    def correct(self, event: Correction):
+        """
+        Clears the history, counts the correction and passes it to `on_correction`. Called by the clients.
+
+        :param event: The step reported by the server.
+        :type event: Correction
+        """
+        with self._lock:
+            self._steps.clear()
+            self.corrections += 1
+        if self.on_correction is not None:
+            self.on_correction(event)
+
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the single worker thread sending the requests of a synchronous client in order, creating it on first use.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="akinator-undo")
+            return self._executor
+
+    def stats(self) -> dict:
+        """
+        Returns the number of steps kept, of `back` calls answered instantly, and of corrections.
+        """
+        with self._lock:
+            return {"size": len(self._steps), "instant": self.instant, "corrections": self.corrections}
+
+    def close(self):
+        """
+        Shuts the worker thread down, after the pending requests.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __len__(self):
+        return len(self._steps)
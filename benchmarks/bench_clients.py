@@ -0,0 +1,291 @@
+# pylint: skip-file
+
+"""
+Measures games per second, per-call latency percentiles and RSS per concurrent game for every client and transport,
+playing whole games against the offline `FakeAkinator`.
+
+Each scenario runs in a fresh interpreter, so that memory measurements do not leak from one to the next, and the
+HTTP scenarios talk to a `FakeServer` running in another process, so that it does not compete for the GIL. That server
+tops out at a few hundred requests per second, so the "inprocess" scenarios, which skip HTTP altogether, and the
+"replay" ones, which serve recorded games from memory without any latency, are the ones tracking the overhead of
+`start_game` parsing and `__handler`. The clients of the "sharded" scenario record their metrics in the shard
+processes, so it only reports games per second and memory.
+
+Results are compared with `benchmarks/baselines.json`, and the script exits with status 1 if any scenario regressed by
+more than the tolerance. Baselines depend on the machine: record them again with `--save` when moving to a new one.
+
+    python benchmarks/bench_clients.py
+    python benchmarks/bench_clients.py --scenario async-aiohttp --games 500 --concurrency 50
+    python benchmarks/bench_clients.py --save
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from requests import Session
+
+from akinator import AsyncClient, AsyncCloudScraper, AsyncHTTPSession, AsyncReplayTransport, Client, ClientSettings, HistogramMetrics, PooledSession, RecordingTransport, ReplayTransport, SessionPool, ShardedRunner
+from akinator.testing import AsyncFakeTransport, AsyncLocalTransport, Conditions, FakeAkinator, FakeServer, FakeTransport, LocalTransport
+
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+def recorded(cls, games=20):
+    recorder = RecordingTransport(FakeTransport(FakeAkinator(seed=0)))
+    for _ in range(games):
+        play_sync(Client(recorder))
+    return cls(recorder.cassette, repeat=True)
+
+
+# Each scenario creates its transport from the server and the number of games played at once, e.g. to size a pool so
+# that it measures reuse rather than starvation.
+SCENARIOS = {
+    "client-replay": ("sync", lambda server, concurrency: recorded(ReplayTransport)),
+    "client-inprocess": ("sync", lambda server, concurrency: FakeTransport(server.akinator)),
+    "client-threads": ("sync", lambda server, concurrency: LocalTransport(server)),
+    "client-threads-pooled": ("sync", lambda server, concurrency: LocalTransport(server, PooledSession(SessionPool(max_per_host=concurrency)))),
+    "async-replay": ("async", lambda server, concurrency: recorded(AsyncReplayTransport)),
+    "async-inprocess": ("async", lambda server, concurrency: AsyncFakeTransport(server.akinator)),
+    "async-cloudscraper": ("async", lambda server, concurrency: AsyncLocalTransport(server, AsyncCloudScraper(Session()))),
+    "async-aiohttp": ("async", lambda server, concurrency: AsyncLocalTransport(server, AsyncHTTPSession())),
+    "async-sharded": ("sharded", lambda server, concurrency: ShardedRunner(factory=functools.partial(sharded_client, server.akinator.conditions.latency))),
+}
+
+HTTP_SCENARIOS = {"client-threads", "client-threads-pooled", "async-cloudscraper", "async-aiohttp"}
+
+# Higher is better for games_per_second, lower is better for everything else.
+COMPARED = ("games_per_second", "p50_ms", "p99_ms", "rss_per_game_kb")
+
+# Measured from the client metrics, which the sharded scenario cannot collect.
+LATENCIES = ("p50_ms", "p90_ms", "p99_ms", "start_page_p50_us", "json_p50_us")
+
+
+def rss(pid="self") -> int:
+    try:
+        with open(f"/proc/{pid}/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RSSSampler(threading.Thread):
+    def __init__(self, interval=0.005, pids=()):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.pids = ("self", *pids)
+        self.baseline = self.rss()
+        self.peak = self.baseline
+        self.stopped = threading.Event()
+
+    def rss(self):
+        return sum(rss(pid) for pid in self.pids)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, self.rss())
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.peak = max(self.peak, self.rss())
+        return self.peak - self.baseline
+
+
+def play_sync(client):
+    client.start_game()
+    while not client.finished:
+        client.answer("yes")
+
+
+async def play_async(client):
+    await client.start_game()
+    while not client.finished:
+        await client.answer("yes")
+
+
+def run_sync(make_transport, server, games, concurrency, metrics):
+    transport = make_transport(server, concurrency)
+    remaining = iter(range(games))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            play_sync(Client(transport, settings=ClientSettings(metrics=metrics)))
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    transport.close()
+
+
+def run_async(make_transport, server, games, concurrency, metrics):
+    async def main():
+        transport = make_transport(server, concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def game():
+            async with semaphore:
+                await play_async(AsyncClient(transport, settings=ClientSettings(metrics=metrics)))
+
+        await asyncio.gather(*(game() for _ in range(games)))
+        await transport.close()
+
+    asyncio.run(main())
+
+
+_SHARD_FAKES = {}
+
+
+def sharded_client(latency):
+    # Each shard plays against its own in-process fake, shared by the clients of its games, as the games stay in the
+    # shard which started them.
+    akinator = _SHARD_FAKES.get(latency)
+    if akinator is None:
+        akinator = _SHARD_FAKES[latency] = FakeAkinator(Conditions(latency=latency), seed=0)
+    return AsyncClient(AsyncFakeTransport(akinator))
+
+
+def run_sharded(runner, games, concurrency):
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def game():
+            async with semaphore:
+                await play_async(runner.client())
+
+        await asyncio.gather(*(game() for _ in range(games)))
+
+    asyncio.run(main())
+    runner.close()
+
+
+def serve(latency, ports, stopped):
+    with FakeServer(FakeAkinator(Conditions(latency=latency), seed=0)) as server:
+        ports.put(server.port)
+        stopped.wait()
+
+
+def run_scenario(name, games, concurrency, latency):
+    kind, make_transport = SCENARIOS[name]
+    metrics = HistogramMetrics()
+    # HTTP scenarios only use `server.port`, the others only use `server.akinator`, if anything.
+    server = FakeServer(FakeAkinator(Conditions(latency=latency), seed=0))
+    ports, stopped = multiprocessing.Queue(), multiprocessing.Event()
+    process = multiprocessing.Process(target=serve, args=(latency, ports, stopped), daemon=True)
+    if name in HTTP_SCENARIOS:
+        process.start()
+        server.port = ports.get(timeout=10)
+    try:
+        runner = make_transport(server, concurrency) if kind == "sharded" else None
+        sampler = RSSSampler(pids=[shard.process.pid for shard in runner.shards] if runner else ())
+        sampler.start()
+        started = time.perf_counter()
+        if runner:
+            run_sharded(runner, games, concurrency)
+        else:
+            (run_sync if kind == "sync" else run_async)(make_transport, server, games, concurrency, metrics)
+        elapsed = time.perf_counter() - started
+        memory = sampler.stop()
+    finally:
+        stopped.set()
+        if process.is_alive():
+            process.join()
+    requests = metrics.aggregate("request")
+    result = {key: round(value, 2) for key, value in {
+        "games_per_second": games / elapsed,
+        "calls": requests.count,
+        "p50_ms": requests.percentile(50) * 1000,
+        "p90_ms": requests.percentile(90) * 1000,
+        "p99_ms": requests.percentile(99) * 1000,
+        "start_page_p50_us": metrics.aggregate("parse", stage="start_page").percentile(50) * 1e6,
+        "json_p50_us": metrics.aggregate("parse", stage="json").percentile(50) * 1e6,
+        "rss_per_game_kb": memory / concurrency / 1024,
+    }.items()}
+    if runner:
+        result.update(dict.fromkeys(("calls", *LATENCIES)))
+    return result
+
+
+def column(value, width, precision):
+    return f"{'-':>{width}}" if value is None else f"{value:{width}.{precision}f}"
+
+
+def compare(name, result, baseline, tolerance):
+    regressions = []
+    for key in COMPARED:
+        if not baseline.get(key) or result[key] is None:
+            continue
+        ratio = result[key] / baseline[key]
+        worse = ratio < 1 - tolerance if key == "games_per_second" else ratio > 1 + tolerance
+        if worse:
+            regressions.append(f"{name}: {key} {result[key]:.2f} vs baseline {baseline[key]:.2f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="A scenario to run. Defaults to all of them.")
+    parser.add_argument("--games", type=int, default=200, help="The number of games played per scenario.")
+    parser.add_argument("--concurrency", type=int, default=20, help="The number of games played at once.")
+    parser.add_argument("--latency", type=float, default=0.002, help="The latency of the fake server, in seconds.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="The relative change reported as a regression.")
+    parser.add_argument("--save", action="store_true", help="Store the results as the new baselines.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    scenarios = args.scenario or list(SCENARIOS)
+
+    if args.child:
+        print(json.dumps(run_scenario(scenarios[0], args.games, args.concurrency, args.latency)))
+        return
+
+    settings = {"games": args.games, "concurrency": args.concurrency, "latency": args.latency}
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES, encoding="utf-8") as file:
+            baselines = json.load(file)
+    if baselines.get("settings", settings) != settings and not args.save:
+        print(f"Baselines were recorded with {baselines['settings']}, not comparing.")
+        baselines = {}
+
+    results = {}
+    regressions = []
+    print(f"{'scenario':24} {'games/s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'parse us':>9} {'json us':>8} {'KB/game':>8}")
+    for name in scenarios:
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", "--scenario", name, "--games", str(args.games), "--concurrency", str(args.concurrency), "--latency", str(args.latency)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = results[name] = json.loads(output)
+        print(f"{name:24} {result['games_per_second']:9.1f} {column(result['p50_ms'], 8, 2)} {column(result['p90_ms'], 8, 2)} {column(result['p99_ms'], 8, 2)} {column(result['start_page_p50_us'], 9, 1)} {column(result['json_p50_us'], 8, 1)} {result['rss_per_game_kb']:8.1f}")
+        regressions += compare(name, result, baselines.get("scenarios", {}).get(name, {}), args.tolerance)
+
+    if args.save:
+        baselines = {"settings": settings, "scenarios": {**baselines.get("scenarios", {}), **results}}
+        with open(BASELINES, "w", encoding="utf-8") as file:
+            json.dump(baselines, file, indent=4, sort_keys=True)
+            file.write("\n")
+        print(f"Saved baselines to {BASELINES}.")
+    elif regressions:
+        print("\nRegressions:")
+        print("\n".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# pylint: skip-file
+
+"""
+Measures how long importing akinator takes, with `python -X importtime`, for the light entry point and for each client,
+and lists the slowest modules loaded along the way. Times exclude the modules every interpreter imports at startup. The budget of `import akinator` is enforced by
+`tests/test_imports.py`.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 --top 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+STATEMENTS = {
+    "import": "import akinator",
+    "state": "import akinator; akinator.GameState",
+    "client": "import akinator; akinator.Client",
+    "async-client": "import akinator; akinator.AsyncClient",
+    "engine": "import akinator; akinator.LocalEngine",
+}
+
+
+def importtime(statement):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, env=env, check=True).stderr
+    modules = {}
+    for line in output.splitlines()[1:]:
+        own, cumulative, name = line.replace("import time:", "").split("|")
+        modules[name.strip()] = (int(own), int(cumulative))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="The number of fresh interpreters per statement.")
+    parser.add_argument("--top", type=int, default=10, help="The number of slowest modules listed per statement.")
+    args = parser.parse_args()
+
+    startup = set(importtime("pass"))
+    print(f"{'statement':<16} {'median ms':>10} {'min ms':>8} {'modules':>8}")
+    slowest = {}
+    for name, statement in STATEMENTS.items():
+        runs = [{module: times for module, times in importtime(statement).items() if module not in startup} for _ in range(args.repeat)]
+        totals = [sum(own for own, _ in modules.values()) / 1000 for modules in runs]
+        print(f"{name:<16} {statistics.median(totals):>10.1f} {min(totals):>8.1f} {len(runs[-1]):>8}")
+        slowest[name] = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+
+    for name, modules in slowest.items():
+        print(f"\n{name}: {STATEMENTS[name]}")
+        for module, (own, cumulative) in modules:
+            print(f"    {own / 1000:>8.1f} ms  {cumulative / 1000:>8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
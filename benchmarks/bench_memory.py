@@ -0,0 +1,53 @@
+# pylint: skip-file
+
+"""
+Measures the memory held per parked game: a bare `GameState`, compared with a whole `Client` and its session.
+
+    python benchmarks/bench_memory.py
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from akinator import Client, GameState
+
+
+def make_state(index):
+    return GameState(
+        language="en",
+        theme="c",
+        session_id=f"47b1c6bd-5c8f-4e1a-9a0e-{index:012d}",
+        signature=str(1478963258 + index),
+        identifiant=f"a1b2c3d4{index:06d}",
+        question=f"Is your character a girl? ({index})",
+        progression=12.5 + index % 80,
+        step=index % 30,
+        akitude="serein.png",
+        proposition="I think of",
+        completion="OK",
+    )
+
+
+def bytes_per_game(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = [factory(index) for index in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del games
+    return size / count
+
+
+def main():
+    state = bytes_per_game(make_state, 10000)
+    client = bytes_per_game(lambda index: Client(state=make_state(index)), 200)
+    print(f"GameState:           {state:10.0f} bytes per parked game")
+    print(f"Client with session: {client:10.0f} bytes per parked game")
+
+
+if __name__ == "__main__":
+    main()
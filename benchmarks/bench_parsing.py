@@ -0,0 +1,69 @@
+# pylint: skip-file
+
+"""
+Compares the anchored, precompiled extractors in `akinator.parsing` with the per-field `re.search` calls they replace.
+
+The pages in `benchmarks/pages/` are synthetic stand-ins modelled on the layout of the `/game` and `/choice` pages.
+
+    python benchmarks/bench_parsing.py
+"""
+
+import os
+import sys
+import timeit
+from re import search
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from akinator.parsing import START_PAGE, WIN_PAGE
+
+PAGES = os.path.join(os.path.dirname(__file__), "pages")
+
+
+def load(name):
+    with open(os.path.join(PAGES, name), encoding="utf-8") as file:
+        return file.read()
+
+
+def start_page_search(text):
+    return (
+        search(r"#session'\).val\('(.+?)'\)", text).group(1),
+        search(r"#signature'\).val\('(.+?)'\)", text).group(1),
+        search(r"#identifiant'\).val\('(.+?)'\)", text).group(1),
+        search(r'<div class="bubble-body"><p class="question-text" id="question-label">(.+)</p></div>', text).group(1),
+        search(r'<div class="sub-bubble-propose"><p id="p-sub-bubble">([\w\s]+)</p></div>', text).group(1),
+    )
+
+
+def win_page_search(text):
+    return (
+        search(r'<span class="win-sentence">(.+?)<\/span>', text).group(1),
+        search(r'let tokenDejaJoue = "([\w\s]+)";', text).group(1),
+        search(r'let timesSelected = "(\d+)";', text).group(1),
+        search(r'<span id="timesselected"><\/span>\s+([\w\s]+)<\/span>', text).group(1),
+    )
+
+
+def measure(function, text, number):
+    return min(timeit.repeat(lambda: function(text), number=number, repeat=5)) / number
+
+
+def main(number=500):
+    for name, baseline, extractor in (("game.html", start_page_search, START_PAGE), ("win.html", win_page_search, WIN_PAGE)):
+        text = load(name)
+        assert set(baseline(text)) == set(extractor.extract(text).values())
+        before = measure(baseline, text, number)
+        after = measure(extractor.extract, text, number)
+        print(f"{name:10} {len(text):>7} bytes  re.search: {before * 1e6:8.1f} us  extractor: {after * 1e6:8.1f} us  speedup: {before / after:5.1f}x")
+    text = load("game.html")
+    extraction = START_PAGE.stream()
+    for start in range(0, len(text), 4096):
+        if extraction.feed(text[start:start + 4096]):
+            break
+    extraction.close()
+    print(f"streamed start page: stopped after {extraction.consumed} of {len(text)} characters ({extraction.consumed / len(text):.0%})")
+    print(f"start page parse time: {START_PAGE.stats()['mean_time'] * 1e6:.1f} us mean over {START_PAGE.count} parses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# pylint: skip-file
+
+"""
+Measures the cost of parking and resuming a game with `GameState.to_bytes` and `GameState.from_bytes`.
+
+    python benchmarks/bench_state.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from akinator import GameState
+
+
+def main(number=20000):
+    state = GameState(
+        language="en",
+        theme="c",
+        session_id="47b1c6bd-5c8f-4e1a-9a0e-8b9f2f5e3c11",
+        signature="1478963258",
+        identifiant="a1b2c3d4e5",
+        question="Is your character a girl?",
+        progression=42.0331,
+        step=12,
+        akitude="serein.png",
+        step_last_proposition=8,
+        proposition="I think of",
+        completion="OK",
+    )
+    data = state.to_bytes()
+    assert GameState.from_bytes(data) == state
+
+    encode = min(timeit.repeat(state.to_bytes, number=number, repeat=5)) / number
+    decode = min(timeit.repeat(lambda: GameState.from_bytes(data), number=number, repeat=5)) / number
+    print(f"size:   {len(data)} bytes")
+    print(f"encode: {encode * 1e6:.2f} us")
+    print(f"decode: {decode * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,5 +26,6 @@ setup(
     python_requires='>= 3.9.0',
     packages = ["akinator"],
     include_package_data = True,
-    install_requires = ["cloudscraper"]
+    install_requires = ["cloudscraper"],
+    extras_require = {"aiohttp": ["aiohttp"], "engine": ["numpy"]}
 )
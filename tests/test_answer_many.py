@@ -0,0 +1,104 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import unittest
+
+from akinator import AsyncClient, Client, InvalidChoiceError, Step
+from akinator.testing import AsyncFakeTransport, Conditions, FakeAkinator, FakeTransport
+
+
+class TestAnswerMany(unittest.TestCase):
+    def test_trajectory(self):
+        akinator = FakeAkinator(seed=1, propose_after=50)
+        client = Client(FakeTransport(akinator))
+        client.start_game()
+        trajectory = client.answer_many(["idk", "p", "pn"])
+        self.assertEqual([step.step for step in trajectory], [1, 2, 3])
+        self.assertEqual([step.answer for step in trajectory], ["idk", "p", "pn"])
+        self.assertEqual(trajectory[-1], Step("pn", client.step, client.question, client.progression))
+        self.assertTrue(all(earlier.progression <= later.progression for earlier, later in zip(trajectory, trajectory[1:])))
+        self.assertEqual(akinator.requests["answer"], 3)
+
+    def test_stops_on_proposition(self):
+        akinator = FakeAkinator(propose_after=3)
+        client = Client(FakeTransport(akinator))
+        client.start_game()
+        trajectory = client.answer_many(["idk"] * 10)
+        self.assertEqual(len(trajectory), 3)
+        self.assertTrue(client.win)
+        self.assertEqual(trajectory[-1].proposition, client.name_proposition)
+        self.assertIsNone(trajectory[0].proposition)
+        self.assertEqual(akinator.requests["answer"], 3)
+        self.assertEqual(client.answer_many(["yes"]), [])
+
+    def test_stops_on_soundlike(self):
+        client = Client(FakeTransport(FakeAkinator(Conditions(soundlike_rate=1.0))))
+        client.start_game()
+        trajectory = client.answer_many(["yes", "yes"])
+        self.assertEqual(len(trajectory), 1)
+        self.assertTrue(client.finished)
+
+    def test_answers_are_validated_first(self):
+        akinator = FakeAkinator()
+        client = Client(FakeTransport(akinator))
+        client.start_game()
+        with self.assertRaises(InvalidChoiceError):
+            client.answer_many(["yes", "maybe"])
+        self.assertEqual(akinator.requests["answer"], 0)
+
+    def test_same_path_as_answer(self):
+        first, second = Client(FakeTransport(FakeAkinator(seed=4))), Client(FakeTransport(FakeAkinator(seed=4)))
+        first.start_game()
+        second.start_game()
+        first.answer_many(["yes", "no", "p"])
+        for answer in ["yes", "no", "p"]:
+            second.answer(answer)
+        self.assertEqual((first.step, first.progression, first.question), (second.step, second.progression, second.question))
+
+    def test_async(self):
+        async def answers():
+            for answer in ["yes", "no", "idk"]:
+                await asyncio.sleep(0)
+                yield answer
+
+        async def main():
+            client = AsyncClient(AsyncFakeTransport(FakeAkinator(propose_after=50)))
+            await client.start_game()
+            streamed = [step.step async for step in client.answer_stream(answers())]
+            batch = await client.answer_many(["p", "pn"])
+            with self.assertRaises(InvalidChoiceError):
+                await client.answer_many(["nope"])
+            return streamed, batch
+
+        streamed, batch = asyncio.run(main())
+        self.assertEqual(streamed, [1, 2, 3])
+        self.assertEqual([step.step for step in batch], [4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
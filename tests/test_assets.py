@@ -0,0 +1,148 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from akinator import AKITUDES, AssetCache, AsyncAssetCache, Client
+from akinator.testing import PNG_SIGNATURE, AsyncFakeTransport, Conditions, FakeAkinator, FakeServer, FakeTransport, LocalTransport
+
+URL = "https://photos.clarinea.fr/BL_1_en/600/partenaire/x/1.jpg"
+
+
+class TestAssetCache(unittest.TestCase):
+    def test_concurrent_requests_are_merged(self):
+        akinator = FakeAkinator(Conditions(latency=0.05))
+        cache = AssetCache(FakeTransport(akinator))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            images = list(executor.map(cache.get, [URL] * 8))
+        self.assertEqual(set(images), {PNG_SIGNATURE + URL.encode()})
+        self.assertEqual(akinator.requests["asset"], 1)
+        self.assertEqual(cache.get(URL), images[0])
+        stats = cache.stats()
+        self.assertEqual((stats["misses"], stats["deduplicated"], stats["hits"]), (1, 7, 1))
+
+    def test_bounded_by_bytes(self):
+        akinator = FakeAkinator()
+        size = len(PNG_SIGNATURE + URL.encode())
+        cache = AssetCache(FakeTransport(akinator), max_bytes=2 * size + 10)
+        urls = [URL.replace("1.jpg", f"{index}.jpg") for index in range(1, 4)]
+        for url in urls:
+            cache.get(url)
+        self.assertNotIn(urls[0], cache)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.size, cache.max_bytes)
+        self.assertEqual(cache.evictions, 1)
+        cache.get(urls[1])
+        cache.get(urls[0])
+        self.assertIn(urls[1], cache)
+        self.assertNotIn(urls[2], cache)
+
+    def test_directory_survives_restarts(self):
+        akinator = FakeAkinator()
+        with tempfile.TemporaryDirectory() as directory:
+            AssetCache(FakeTransport(akinator), path=directory).get(URL)
+            cache = AssetCache(FakeTransport(akinator), path=directory)
+            self.assertEqual(cache.get(URL), PNG_SIGNATURE + URL.encode())
+            self.assertEqual(cache.disk_hits, 1)
+        self.assertEqual(akinator.requests["asset"], 1)
+
+    def test_prefetch_and_client_urls(self):
+        akinator = FakeAkinator(seed=0)
+        transport = FakeTransport(akinator)
+        cache = AssetCache(transport)
+        self.assertEqual(cache.prefetch(["english", "fr"]), 2 * len(AKITUDES))
+        with Client(transport) as client:
+            client.start_game(language="fr")
+            self.assertTrue(cache.get(client.akitude_url).startswith(PNG_SIGNATURE))
+        self.assertEqual(cache.akitude("triomphe.png", "french"), cache.get("https://fr.akinator.com/assets/img/akitudes_670x1096/triomphe.png"))
+        self.assertEqual(akinator.requests["asset"], 2 * len(AKITUDES))
+
+    def test_failures_are_not_cached(self):
+        akinator = FakeAkinator(Conditions(error_rate=1))
+        cache = AssetCache(FakeTransport(akinator))
+        with self.assertRaises(RuntimeError):
+            cache.get(URL)
+        self.assertEqual(cache.prefetch(akitudes=["defi.png"]), 0)
+        akinator.conditions = Conditions()
+        self.assertTrue(cache.get(URL))
+        self.assertEqual(len(cache), 1)
+
+    def test_over_http(self):
+        with FakeServer() as server:
+            transport = LocalTransport(server)
+            cache = AssetCache(transport)
+            self.assertTrue(cache.akitude("defi.png").startswith(PNG_SIGNATURE))
+            transport.close()
+
+    def test_transport_without_get(self):
+        class PostOnly:
+            def post(self, url, data=None, **kwargs):
+                raise NotImplementedError
+
+        with self.assertRaises(TypeError):
+            AssetCache(PostOnly())
+
+
+class TestAsyncAssetCache(unittest.TestCase):
+    def test_concurrent_requests_and_prefetch(self):
+        akinator = FakeAkinator(Conditions(latency=0.02))
+
+        async def main():
+            cache = AsyncAssetCache(AsyncFakeTransport(akinator))
+            images = await asyncio.gather(*(cache.get(URL) for _ in range(10)))
+            prefetched = await cache.prefetch(["en"])
+            image = await cache.akitude("defi.png")
+            await cache.close()
+            return cache, images, prefetched, image
+
+        cache, images, prefetched, image = asyncio.run(main())
+        self.assertEqual(set(images), {PNG_SIGNATURE + URL.encode()})
+        self.assertEqual(prefetched, len(AKITUDES))
+        self.assertTrue(image.startswith(PNG_SIGNATURE))
+        self.assertEqual(akinator.requests["asset"], 1 + len(AKITUDES))
+        self.assertEqual(cache.deduplicated, 9)
+
+    def test_cancelled_request_does_not_cancel_the_download(self):
+        akinator = FakeAkinator(Conditions(latency=0.05))
+
+        async def main():
+            cache = AsyncAssetCache(AsyncFakeTransport(akinator))
+            first = asyncio.ensure_future(cache.get(URL))
+            second = asyncio.ensure_future(cache.get(URL))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(main()), PNG_SIGNATURE + URL.encode())
+        self.assertEqual(akinator.requests["asset"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
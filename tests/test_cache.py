@@ -0,0 +1,151 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from akinator import AsyncClient, CachedStep, Client, ClientSettings, GameState, QuestionCache
+from akinator.testing import AsyncFakeTransport, FakeAkinator, FakeTransport
+
+
+class TestQuestionCache(unittest.TestCase):
+    def test_answer_path_is_tracked(self):
+        client = Client(FakeTransport(FakeAkinator(propose_after=3)))
+        client.start_game()
+        self.assertEqual(client.answers, "")
+        client.answer("yes")
+        client.answer("idk")
+        self.assertEqual(client.answers, "02")
+        client.back()
+        self.assertEqual(client.answers, "0")
+        client.answer_many(["p", "pn"])
+        self.assertTrue(client.win)
+        client.answer("no")
+        self.assertEqual(client.answers, "034x")
+
+    def test_identical_paths_hit(self):
+        cache = QuestionCache()
+        akinator = FakeAkinator(seed=1, propose_after=50)
+        first = Client(FakeTransport(akinator), settings=ClientSettings(question_cache=cache))
+        first.start_game()
+        self.assertIsNone(first.predict("yes"))
+        first.answer_many(["yes", "no"])
+        self.assertEqual(cache.stats()["hits"], 0)
+
+        second = Client(FakeTransport(akinator), settings=ClientSettings(question_cache=cache))
+        second.start_game()
+        predicted = second.predict("yes")
+        self.assertIsInstance(predicted, CachedStep)
+        self.assertEqual(predicted.step, 1)
+        second.answer("yes")
+        self.assertEqual(predicted.question, second.question)
+        self.assertGreater(cache.stats()["hit_rate"], 0)
+
+    def test_lru_and_ttl(self):
+        cache = QuestionCache(max_entries=2, ttl=0.05)
+        for answers in ("", "0", "01"):
+            cache.record(GameState(language="en", theme="c", step=len(answers), question="Q", progression=1.0, akitude="a.png", answers=answers))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("en", "c", False, ""))
+        self.assertIsNotNone(cache.get("en", "c", False, "01"))
+        self.assertIsNone(cache.get("en", "c", True, "01"))
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("en", "c", False, "01"))
+        self.assertEqual(cache.evict_expired(), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_disk_tier(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "questions.db")
+            cache = QuestionCache(path=path)
+            client = Client(FakeTransport(FakeAkinator(seed=2, propose_after=50)), settings=ClientSettings(question_cache=cache))
+            client.start_game()
+            client.answer("no")
+            cache.close()
+
+            reopened = QuestionCache(path=path)
+            step = reopened.get(client.language, client.theme, client.child_mode, "1")
+            self.assertEqual(step.question, client.question)
+            self.assertEqual(reopened.disk_hits, 1)
+            reopened.get(client.language, client.theme, client.child_mode, "1")
+            self.assertEqual(reopened.disk_hits, 1)
+            reopened.close()
+
+    def test_recording_is_not_a_lookup(self):
+        cache = QuestionCache()
+        state = GameState(language="en", theme="c", step=1, question="Q", progression=1.0, akitude="a.png", answers="0")
+        self.assertFalse(cache.record(state))
+        self.assertTrue(cache.record(state))
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+        cache.get("en", "c", False, "0")
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_background_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "questions.db")
+            cache = QuestionCache(path=path)
+            cache.record(GameState(language="en", theme="c", step=1, question="Q", progression=1.0, akitude="a.png", answers="0"))
+            cache.flush()
+
+            reopened = QuestionCache(path=path)
+            self.assertIsNone(reopened.get("en", "c", False, "0", disk=False))
+            reopened.flush()
+            self.assertEqual(reopened.get("en", "c", False, "0", disk=False).question, "Q")
+            self.assertEqual(reopened.disk_hits, 1)
+            reopened.close()
+            cache.close()
+
+    def test_async(self):
+        cache = QuestionCache()
+
+        async def main():
+            client = AsyncClient(AsyncFakeTransport(FakeAkinator(propose_after=50)), settings=ClientSettings(question_cache=cache))
+            await client.start_game()
+            await client.answer("yes")
+            await client.answer_many(["no"])
+            return client
+
+        client = asyncio.run(main())
+        self.assertEqual(client.answers, "01")
+        self.assertEqual(cache.get("en", "c", False, "01").step, 2)
+
+
+class TestStateCompatibility(unittest.TestCase):
+    def test_version_1_states_load(self):
+        state = GameState(language="en", theme="c", step=3, answers="012")
+        values = state.to_bytes().decode()
+        legacy = "[1," + values[values.index(",") + 1:values.rindex(",")] + "]"
+        loaded = GameState.from_bytes(legacy)
+        self.assertEqual(loaded.step, 3)
+        self.assertEqual(loaded.answers, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
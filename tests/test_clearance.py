@@ -0,0 +1,80 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+import os
+from tempfile import TemporaryDirectory
+
+from akinator import Client, ClearanceCache, Response, is_challenge
+
+
+class TestClearanceCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ClearanceCache(ttl=60)
+
+    def test_get_set_and_expiry(self):
+        self.assertIsNone(self.cache.get("en.akinator.com", "UA"))
+        self.cache.set("en.akinator.com", "UA", {"cf_clearance": "token"})
+        self.assertEqual(self.cache.get("en.akinator.com", "UA"), {"cf_clearance": "token"})
+        self.assertIsNone(self.cache.get("en.akinator.com", "Other UA"))
+        self.cache.ttl = -1
+        self.cache.set("fr.akinator.com", "UA", {"cf_clearance": "token"})
+        self.assertIsNone(self.cache.get("fr.akinator.com", "UA"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+    def test_disk_persistence(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "clearance.json")
+            ClearanceCache(path=path).set("en.akinator.com", "UA", {"cf_clearance": "token"})
+            self.assertEqual(ClearanceCache(path=path).get("en.akinator.com", "UA"), {"cf_clearance": "token"})
+
+    def test_seeded_sessions_and_clients(self):
+        self.cache.set("en.akinator.com", "Cached UA", {"cf_clearance": "token"})
+        session = self.cache.create_scraper()
+        self.assertEqual(session.headers["User-Agent"], "Cached UA")
+        self.assertEqual(session.cookies.get("cf_clearance", domain="en.akinator.com"), "token")
+        client = Client(clearance_cache=self.cache)
+        self.assertEqual(client.session.headers["User-Agent"], "Cached UA")
+
+    def test_observe_refreshes_only_on_challenge(self):
+        session = self.cache.create_scraper()
+        user_agent = session.headers["User-Agent"]
+        session.cookies.set("cf_clearance", "fresh", domain=".akinator.com", path="/")
+        session.cookies.set("unrelated", "value", domain=".akinator.com", path="/")
+        ok = Response(200, b"{}", url="https://en.akinator.com/answer")
+        self.cache.observe(session, ok)
+        self.assertEqual(self.cache.get("en.akinator.com", user_agent), {"cf_clearance": "fresh"})
+
+        challenge = Response(403, b"", {"cf-mitigated": "challenge"}, url="https://en.akinator.com/answer")
+        self.assertTrue(is_challenge(challenge))
+        self.assertFalse(is_challenge(ok))
+        self.cache.observe(session, challenge)
+        self.assertIsNone(self.cache.get("en.akinator.com", user_agent))
+
+
+if __name__ == "__main__":
+    unittest.main()
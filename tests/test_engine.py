@@ -0,0 +1,190 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from akinator import AsyncClient, AsyncEngineTransport, Client, EngineSettings, EngineTransport, KnowledgeBase, LocalEngine
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def knowledge(characters=200, questions=40, dtype="float32"):
+    random = numpy.random.default_rng(0)
+    matrix = numpy.where(random.random((questions, characters)) < 0.5, 0.95, 0.05)
+    if dtype == "uint8":
+        matrix = (matrix * 255).astype(numpy.uint8)
+    return KnowledgeBase([f"Question {index}?" for index in range(questions)], [(f"Character {index}", "") for index in range(characters)], matrix)
+
+
+def truth(kb, target):
+    def answer(client):
+        question = kb.questions.index(client.question)
+        return "yes" if kb.probabilities(question)[target] > 0.5 else "no"
+    return answer
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestLocalEngine(unittest.TestCase):
+    def test_guesses_the_character(self):
+        kb = knowledge()
+        answer = truth(kb, 42)
+        with Client(EngineTransport(LocalEngine(kb, seed=0))) as client:
+            client.start_game(language="fr")
+            while not client.win:
+                client.answer(answer(client))
+            self.assertEqual(client.name_proposition, "Character 42")
+            self.assertLess(client.step, 20)
+            client.answer("yes")
+            self.assertTrue(client.finished)
+
+    def test_questions_are_not_repeated(self):
+        engine = LocalEngine(knowledge(), EngineSettings(threshold=1.1, propose_after=100))
+        with Client(EngineTransport(engine)) as client:
+            client.start_game()
+            questions = [client.question]
+            for _ in range(30):
+                client.answer("i don't know")
+                questions.append(client.question)
+            self.assertEqual(len(set(questions)), len(questions))
+
+    def test_back_restores_the_question_and_scores(self):
+        kb = knowledge()
+        engine = LocalEngine(kb)
+        answer = truth(kb, 7)
+        with Client(EngineTransport(engine)) as client:
+            client.start_game()
+            client.answer(answer(client))
+            question, progression = client.question, client.progression
+            client.answer(answer(client))
+            client.answer(answer(client))
+            client.back()
+            client.back()
+            self.assertEqual((client.step, client.question), (1, question))
+            self.assertAlmostEqual(client.progression, progression, places=3)
+
+    def test_back_forgets_the_unanswered_question(self):
+        engine = LocalEngine(knowledge(), EngineSettings(threshold=1.1, propose_after=100))
+        with Client(EngineTransport(engine)) as client:
+            client.start_game()
+            first = engine.knowledge.questions.index(client.question)
+            client.answer("yes")
+            second = engine.knowledge.questions.index(client.question)
+            client.back()
+            game = engine._sessions[client.session_id]
+            self.assertEqual(game.asked, {first})
+            client.answer("no")
+            self.assertEqual(game.asked, {first, engine.knowledge.questions.index(client.question)})
+        self.assertNotEqual(first, second)
+
+    def test_exclude_proposes_another_character(self):
+        kb = knowledge(characters=20, questions=10)
+        engine = LocalEngine(kb, EngineSettings(propose_after=3))
+        with Client(EngineTransport(engine)) as client:
+            client.start_game()
+            while not client.win:
+                client.answer("yes")
+            first = client.name_proposition
+            client.exclude()
+            while not client.win:
+                client.answer("yes")
+            self.assertNotEqual(client.name_proposition, first)
+
+    def test_gives_up_without_candidates(self):
+        engine = LocalEngine(knowledge(characters=1, questions=3), EngineSettings(threshold=1.1, propose_after=1))
+        with Client(EngineTransport(engine)) as client:
+            client.start_game()
+            client.answer("yes")
+            self.assertTrue(client.win)
+            client.exclude()
+            self.assertTrue(client.finished)
+            self.assertEqual(len(engine), 0)
+
+    def test_answer_without_question_is_rejected(self):
+        engine = LocalEngine(knowledge(questions=0))
+        transport = EngineTransport(engine)
+        transport.post("https://en.akinator.com/game")
+        game = next(iter(engine._sessions.values()))
+        response = transport.post("https://en.akinator.com/answer", {"session": game.session, "signature": game.signature, "step": 0, "answer": 0})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(game.history, [])
+        self.assertEqual(game.asked, set())
+
+    def test_unknown_session_times_out(self):
+        with Client(EngineTransport(LocalEngine(knowledge(), max_sessions=1))) as client, Client(EngineTransport(client.session.engine)) as other:
+            client.start_game()
+            other.start_game()
+            with self.assertRaises(RuntimeError):
+                client.answer("yes")
+
+    def test_save_and_load_memory_maps(self):
+        kb = knowledge(dtype="uint8")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "knowledge.bin")
+            kb.save(path)
+            loaded = KnowledgeBase.load(path)
+            self.assertIsInstance(loaded.matrix, numpy.memmap)
+            self.assertEqual(loaded.matrix.dtype, numpy.uint8)
+            self.assertEqual((loaded.questions, loaded.characters), (kb.questions, kb.characters))
+            numpy.testing.assert_array_equal(loaded.matrix, kb.matrix)
+            engine = LocalEngine(path)
+            numpy.testing.assert_allclose(engine.posterior([(0, 0), (1, 1)]), LocalEngine(kb).posterior([(0, 0), (1, 1)]))
+            del loaded, engine
+
+    def test_invalid_knowledge(self):
+        with self.assertRaises(ValueError):
+            KnowledgeBase(["Question?"], [("Character", "")], numpy.zeros((2, 1)))
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as file:
+            file.write(b"not a knowledge base")
+        try:
+            with self.assertRaises(ValueError):
+                KnowledgeBase.load(file.name)
+        finally:
+            os.remove(file.name)
+
+    def test_async_client(self):
+        kb = knowledge()
+        answer = truth(kb, 3)
+
+        async def main():
+            client = AsyncClient(AsyncEngineTransport(LocalEngine(kb)))
+            await client.start_game()
+            while not client.win:
+                await client.answer(answer(client))
+            await client.close()
+            return client.name_proposition
+
+        self.assertEqual(asyncio.run(main()), "Character 3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import unittest
+
+from akinator import AsyncClient, Client, Defeat, Proposition, Question, SessionTimeoutError, Timeout, Win
+from akinator.testing import AsyncFakeTransport, Conditions, FakeAkinator, FakeTransport
+
+
+class TestEvents(unittest.TestCase):
+    def test_game_from_question_to_win(self):
+        client = Client(FakeTransport(FakeAkinator(propose_after=3)))
+        client.start_game()
+        events = list(client.play(lambda event: "yes" if isinstance(event, Proposition) else "idk"))
+        self.assertEqual([type(event) for event in events], [Question, Question, Question, Proposition, Win])
+        self.assertEqual(events[0], Question(0, "Is your character real?", 0, "defi.png"))
+        self.assertEqual(events[3].name, events[4].name)
+        self.assertIn("Great", events[4].message)
+        with self.assertRaises(AttributeError):
+            events[0].step = 5
+
+    def test_answers_run_out(self):
+        client = Client(FakeTransport(FakeAkinator(propose_after=50)))
+        client.start_game()
+        events = list(client.play(["yes", "no"]))
+        self.assertEqual([event.step for event in events], [0, 1, 2])
+
+    def test_exclude(self):
+        client = Client(FakeTransport(FakeAkinator(propose_after=2)))
+        client.start_game()
+        events = list(client.play(["idk", "idk", "no", "idk"]))
+        self.assertEqual([type(event) for event in events], [Question, Question, Proposition, Question, Proposition])
+        self.assertNotEqual(events[2].name, events[4].name)
+
+    def test_soundlike_is_a_defeat(self):
+        client = Client(FakeTransport(FakeAkinator(Conditions(soundlike_rate=1.0))))
+        client.start_game()
+        events = list(client.play(["yes", "yes"]))
+        self.assertIsInstance(events[-1], Defeat)
+        self.assertEqual(len(events), 2)
+
+    def test_timeout(self):
+        client = Client(FakeTransport(FakeAkinator(Conditions(timeout_rate=1.0))))
+        client.start_game()
+        events = list(client.play(["yes", "yes"]))
+        self.assertEqual(events[-1], Timeout(0))
+        with self.assertRaises(RuntimeError) as context:
+            client.answer("yes")
+        self.assertIsInstance(context.exception.__cause__, SessionTimeoutError)
+
+    def test_async(self):
+        async def choose(event):
+            await asyncio.sleep(0)
+            return "yes" if isinstance(event, Proposition) else "p"
+
+        async def answers():
+            yield "yes"
+            yield "no"
+
+        async def main():
+            client = AsyncClient(AsyncFakeTransport(FakeAkinator(propose_after=2)))
+            await client.start_game()
+            played = [event async for event in client.play(choose)]
+            other = AsyncClient(AsyncFakeTransport(FakeAkinator(propose_after=50)))
+            await other.start_game()
+            streamed = [event async for event in other.play(answers())]
+            return played, streamed
+
+        played, streamed = asyncio.run(main())
+        self.assertEqual([type(event) for event in played], [Question, Question, Proposition, Win])
+        self.assertEqual([event.step for event in streamed], [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
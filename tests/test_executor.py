@@ -0,0 +1,162 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import threading
+import time
+import unittest
+
+from akinator import AsyncClient, AsyncCloudScraper, BoundedExecutor, ExecutorSaturatedError, HistogramMetrics, get_default_executor
+from akinator.testing import Conditions, FakeAkinator, FakeTransport
+
+
+def blocking(seconds, state=None):
+    if state is not None:
+        with state["lock"]:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+    time.sleep(seconds)
+    if state is not None:
+        with state["lock"]:
+            state["running"] -= 1
+    return threading.current_thread().name
+
+
+class TestBoundedExecutor(unittest.TestCase):
+    def test_runs_on_named_threads(self):
+        executor = BoundedExecutor(2, name="akinator-test")
+
+        async def main():
+            return await asyncio.gather(*(executor.run(blocking, 0.01) for _ in range(4)))
+
+        names = asyncio.run(main())
+        self.assertTrue(all(name.startswith("akinator-test") for name in names))
+        self.assertEqual(executor.stats()["completed"], 4)
+        executor.shutdown(wait=True)
+
+    def test_raise_policy(self):
+        executor = BoundedExecutor(1, max_queue=1)
+
+        async def main():
+            tasks = [asyncio.ensure_future(executor.run(blocking, 0.05)) for _ in range(3)]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = asyncio.run(main())
+        self.assertEqual(sum(isinstance(result, ExecutorSaturatedError) for result in results), 1)
+        stats = executor.stats()
+        self.assertEqual((stats["submitted"], stats["rejected"], stats["running"], stats["queued"]), (2, 1, 0, 0))
+        executor.shutdown(wait=True)
+
+    def test_wait_policy(self):
+        executor = BoundedExecutor(2, max_queue=0, policy="wait")
+        state = {"lock": threading.Lock(), "running": 0, "peak": 0}
+
+        async def main():
+            tasks = [asyncio.ensure_future(executor.run(blocking, 0.02, state)) for _ in range(6)]
+            await asyncio.sleep(0.005)
+            waiting = executor.stats()["waiting"]
+            tasks[-1].cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            return waiting, results
+
+        waiting, results = asyncio.run(main())
+        self.assertEqual(waiting, 4)
+        self.assertIsInstance(results[-1], asyncio.CancelledError)
+        self.assertEqual(state["peak"], 2)
+        self.assertEqual(executor.stats()["completed"], 5)
+        executor.shutdown(wait=True)
+
+    def test_metrics(self):
+        metrics = HistogramMetrics()
+        executor = BoundedExecutor(1, name="akinator-metrics", metrics=metrics)
+
+        async def main():
+            await asyncio.gather(executor.run(blocking, 0.05), executor.run(blocking, 0.05))
+
+        asyncio.run(main())
+        wait = metrics.aggregate("queue_wait", executor="akinator-metrics")
+        execution = metrics.aggregate("execution", executor="akinator-metrics")
+        self.assertEqual((wait.count, execution.count), (2, 2))
+        self.assertGreater(wait.max, 0.03)
+        self.assertGreater(execution.min, 0.04)
+        executor.shutdown(wait=True)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            BoundedExecutor(0)
+        with self.assertRaises(ValueError):
+            BoundedExecutor(max_queue=-1)
+        with self.assertRaises(ValueError):
+            BoundedExecutor(policy="drop")
+
+
+class TestAsyncCloudScraperExecutor(unittest.TestCase):
+    def test_client_requests_use_the_executor(self):
+        executor = BoundedExecutor(4, name="akinator-client")
+
+        async def main():
+            client = AsyncClient(AsyncCloudScraper(FakeTransport(FakeAkinator(seed=0)), executor=executor))
+            await client.start_game()
+            await client.answer("yes")
+            await client.close()
+            return client
+
+        client = asyncio.run(main())
+        self.assertEqual(client.step, 1)
+        self.assertEqual(executor.stats()["completed"], 2)
+        executor.shutdown(wait=True)
+
+    def test_default_executor_is_shared(self):
+        async def main():
+            first = AsyncCloudScraper(FakeTransport(FakeAkinator(seed=0)))
+            second = AsyncCloudScraper(FakeTransport(FakeAkinator(seed=0)))
+            await first.close()
+            await second.get("https://en.akinator.com/")
+            return first, second
+
+        first, second = asyncio.run(main())
+        self.assertIs(first.executor, get_default_executor())
+        self.assertIs(second.executor, first.executor)
+        self.assertIsNotNone(first.executor.max_queue)
+
+    def test_rejection_reaches_the_client(self):
+        executor = BoundedExecutor(1, max_queue=0)
+
+        async def main():
+            transport = AsyncCloudScraper(FakeTransport(FakeAkinator(Conditions(latency=0.05), seed=0)), executor=executor)
+            clients = [AsyncClient(transport) for _ in range(2)]
+            return await asyncio.gather(*(client.start_game() for client in clients), return_exceptions=True)
+
+        results = asyncio.run(main())
+        errors = [result for result in results if isinstance(result, Exception)]
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0].__cause__, ExecutorSaturatedError)
+        executor.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+import asyncio
+import threading
+import time
+
+from akinator import AsyncClient, AsyncGamePool, Client, GamePool, Response
+
+PAGE = (
+    "<script>$('#session').val('1234');$('#signature').val('5678');$('#identifiant').val('abcd');</script>\n"
+    '<div class="bubble-body"><p class="question-text" id="question-label">Is your character real?</p></div>\n'
+    '<div class="sub-bubble-propose"><p id="p-sub-bubble">I think of</p></div>'
+).encode()
+
+
+class StubTransport:
+    starts = 0
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.closed = False
+
+    def post(self, url, data=None, json=None, **kwargs):
+        StubTransport.starts += 1
+        time.sleep(self.delay)
+        return Response(200, PAGE, url=url)
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncStubTransport(StubTransport):
+    async def post(self, url, data=None, json=None, **kwargs):
+        await asyncio.sleep(self.delay)
+        return Response(200, PAGE, url=url)
+
+    async def close(self):
+        self.closed = True
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestGamePool(unittest.TestCase):
+    def test_warm_games_are_handed_out_and_refilled(self):
+        with GamePool(lambda: Client(session=StubTransport()), size=2) as pool:
+            pool.warm(language="english", theme="c")
+            self.assertTrue(wait_for(lambda: pool.available(language="en") == 2))
+            client = pool.get(language="en")
+            self.assertEqual(client.session_id, "1234")
+            self.assertEqual(client.question, "Is your character real?")
+            self.assertEqual(pool.hits, 1)
+            self.assertTrue(wait_for(lambda: pool.available(language="en") == 2))
+
+    def test_cold_get_and_eviction(self):
+        with GamePool(lambda: Client(session=StubTransport()), size=1, max_idle=60) as pool:
+            client = pool.get(language="fr", theme="a")
+            self.assertEqual(client.language, "fr")
+            self.assertEqual(pool.misses, 1)
+            self.assertTrue(wait_for(lambda: pool.available(language="fr", theme="a") == 1))
+            warm = pool._games[("fr", False, "a")][0][0]
+            pool.max_idle = 0
+            self.assertEqual(pool._evict(), 1)
+            self.assertEqual(pool.evicted, 1)
+            self.assertTrue(warm.session.closed)
+
+    def test_close_discards_games_and_queued_refills(self):
+        transports = []
+
+        def factory():
+            transports.append(StubTransport(delay=0.05))
+            return Client(session=transports[-1])
+
+        pool = GamePool(factory, size=4, workers=1)
+        pool.warm(language="en")
+        self.assertTrue(wait_for(lambda: pool.available(language="en") == 1))
+        pool.close()
+        time.sleep(0.1)
+        self.assertLess(len(transports), 4)
+        self.assertTrue(all(transport.closed for transport in transports))
+        self.assertEqual(pool.available(language="en"), 0)
+
+    def test_get_racing_close(self):
+        errors = []
+
+        def get(pool):
+            try:
+                pool.get(language="en")
+            except Exception as error:
+                errors.append(error)
+
+        for _ in range(50):
+            pool = GamePool(lambda: Client(session=StubTransport()), size=4, workers=1)
+            thread = threading.Thread(target=get, args=(pool,))
+            thread.start()
+            pool.close()
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+class TestAsyncGamePool(unittest.IsolatedAsyncioTestCase):
+    async def test_warm_games_are_handed_out_and_refilled(self):
+        async with AsyncGamePool(lambda: AsyncClient(session=AsyncStubTransport()), size=3) as pool:
+            pool.warm(language="en")
+            await asyncio.sleep(0.05)
+            self.assertEqual(pool.available(language="en"), 3)
+            client = await pool.get(language="en")
+            self.assertEqual(client.signature, "5678")
+            self.assertEqual(pool.hits, 1)
+            await asyncio.sleep(0.05)
+            self.assertEqual(pool.available(language="en"), 3)
+
+    async def test_stale_games_are_not_handed_out(self):
+        async with AsyncGamePool(lambda: AsyncClient(session=AsyncStubTransport()), size=1, max_idle=60) as pool:
+            pool.warm(language="en")
+            await asyncio.sleep(0.05)
+            stale = pool._games[("en", False, "c")][0][0]
+            pool.max_idle = 0
+            client = await pool.get(language="en")
+            self.assertEqual(client.step, 0)
+            self.assertEqual((pool.hits, pool.misses, pool.evicted), (0, 1, 1))
+            await asyncio.sleep(0)
+            self.assertTrue(stale.session.closed)
+
+    async def test_close_closes_warm_and_starting_games(self):
+        transports = []
+
+        def factory():
+            transports.append(AsyncStubTransport(delay=0.05 * len(transports)))
+            return AsyncClient(session=transports[-1])
+
+        pool = AsyncGamePool(factory, size=2)
+        pool.warm(language="en")
+        await asyncio.sleep(0.02)
+        self.assertEqual(pool.available(language="en"), 1)
+        await pool.close()
+        self.assertEqual(len(transports), 2)
+        self.assertTrue(all(transport.closed for transport in transports))
+
+
+if __name__ == "__main__":
+    unittest.main()
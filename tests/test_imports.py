@@ -0,0 +1,95 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import akinator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ("cloudscraper", "requests", "aiohttp", "numpy", "sqlite3")
+
+# The only submodules `import akinator` loads, none of which imports a heavy dependency.
+EAGER = ["akinator", "akinator.constants", "akinator.events", "akinator.exceptions", "akinator.metrics", "akinator.state"]
+
+
+def run(code, *options):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, env=env, check=True)
+
+
+def loaded(statement):
+    return json.loads(run(f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))").stdout)
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_skips_heavy_dependencies(self):
+        modules = loaded("import akinator\nakinator.GameState.from_bytes(akinator.GameState(language='fr').to_bytes())\nakinator.LANG_MAP, akinator.AkinatorException")
+        self.assertEqual([name for name in HEAVY if name in modules], [])
+        self.assertNotIn("akinator.client", modules)
+
+    def test_client_loads_on_first_access(self):
+        modules = loaded("import akinator\nakinator.Client")
+        self.assertIn("akinator.client", modules)
+        self.assertIn("cloudscraper", modules)
+
+    def test_import_loads_only_the_eager_modules(self):
+        modules = loaded("import akinator")
+        self.assertEqual([name for name in modules if name.split(".")[0] == "akinator"], EAGER)
+
+    def test_lazy_attributes(self):
+        from akinator.client import Client
+        from akinator.constants import LANG_MAP
+        self.assertIs(akinator.Client, Client)
+        self.assertIs(akinator.LANG_MAP, LANG_MAP)
+        self.assertIs(akinator.client.LANG_MAP, LANG_MAP)
+        self.assertIn("AsyncClient", dir(akinator))
+        self.assertIn("ShardedRunner", akinator.__all__)
+        with self.assertRaises(AttributeError):
+            akinator.Missing
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from akinator import *", namespace)
+        self.assertIs(namespace["AsyncClient"], akinator.AsyncClient)
+        self.assertIs(namespace["SessionTimeoutError"], akinator.SessionTimeoutError)
+        self.assertEqual([name for name in ("Optional", "Dict", "Lock", "dumps", "loads") if name in namespace], [])
+        self.assertEqual([name for name in akinator.__all__ if not hasattr(akinator, name)], [])
+
+    def test_legacy_client_imports(self):
+        from akinator.client import ANSWER_IDS, ANSWER_MAP, LANG_MAP, THEME_IDS, THEME_MAP
+        from akinator.async_client import ANSWER_IDS as ASYNC_ANSWER_IDS, AsyncCloudScraper
+        self.assertIs(ANSWER_IDS, akinator.ANSWER_IDS)
+        self.assertIs(ASYNC_ANSWER_IDS, akinator.ANSWER_IDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import random
+import unittest
+from json import dumps
+
+from akinator import AsyncClient, Client, ClientSettings, GameState, Histogram, HistogramMetrics, MetricsSink, Response
+
+PAGE = (
+    "<script>$('#session').val('1234');$('#signature').val('5678');$('#identifiant').val('abcd');</script>\n"
+    '<div class="bubble-body"><p class="question-text" id="question-label">Is your character real?</p></div>\n'
+    '<div class="sub-bubble-propose"><p id="p-sub-bubble">I think of</p></div>'
+).encode()
+
+ANSWER = dumps({"completion": "OK", "akitude": "serein.png", "step": "1", "progression": "10", "question": "Q?"}).encode()
+
+
+class StubTransport:
+    def post(self, url, data=None, json=None, **kwargs):
+        return Response(200, PAGE if url.endswith("/game") else ANSWER, url=url)
+
+    def close(self):
+        pass
+
+
+class AsyncStubTransport(StubTransport):
+    async def post(self, url, data=None, json=None, **kwargs):
+        return super().post(url, data, json, **kwargs)
+
+
+class TestHistogram(unittest.TestCase):
+    def test_percentiles_are_within_the_relative_error(self):
+        histogram = Histogram()
+        values = sorted(random.uniform(0.0001, 2.0) for _ in range(10000))
+        for value in values:
+            histogram.record(value)
+        self.assertEqual(histogram.count, 10000)
+        for percentile in (50, 90, 99):
+            expected = values[round(percentile / 100 * len(values)) - 1]
+            self.assertAlmostEqual(histogram.percentile(percentile), expected, delta=expected * 0.02)
+        self.assertAlmostEqual(histogram.mean, sum(values) / len(values), delta=0.001)
+
+    def test_small_values_are_exact(self):
+        histogram = Histogram()
+        for value in (0.000001, 0.000002, 0.000003):
+            histogram.record(value)
+        self.assertEqual(histogram.percentile(50), 0.000002)
+        self.assertEqual(histogram.percentile(100), 0.000003)
+
+    def test_merge(self):
+        first, second = Histogram(), Histogram()
+        first.record(0.01)
+        second.record(0.02)
+        first.merge(second)
+        self.assertEqual(first.count, 2)
+        self.assertEqual(first.summary()["max"], 0.02)
+        with self.assertRaises(ValueError):
+            first.merge(Histogram(precision=5))
+
+    def test_empty(self):
+        self.assertEqual(Histogram().percentile(99), 0.0)
+        self.assertEqual(Histogram().summary()["count"], 0)
+
+
+class TestMetrics(unittest.TestCase):
+    def test_default_sink_is_disabled(self):
+        client = Client(session=StubTransport())
+        self.assertIsInstance(client.metrics, MetricsSink)
+        self.assertFalse(client.metrics.enabled)
+        client.start_game()
+        client.answer("yes")
+
+    def test_requests_and_parse_steps_are_timed(self):
+        metrics = HistogramMetrics()
+        client = Client(session=StubTransport(), settings=ClientSettings(metrics=metrics))
+        client.start_game(language="fr")
+        client.answer("yes")
+        client.answer("no")
+        self.assertEqual(metrics.histogram("request", endpoint="game", language="fr").count, 1)
+        self.assertEqual(metrics.histogram("request", endpoint="answer", language="fr").count, 2)
+        self.assertEqual(metrics.histogram("parse", stage="start_page", language="fr").count, 1)
+        self.assertEqual(metrics.histogram("parse", stage="json", language="fr").count, 2)
+        self.assertEqual(metrics.aggregate("request").count, 3)
+        self.assertIn("request endpoint=answer language=fr", metrics.summary())
+
+    def test_failed_requests_are_timed(self):
+        class FailingTransport(StubTransport):
+            def post(self, url, data=None, json=None, **kwargs):
+                raise ConnectionError("reset")
+
+        metrics = HistogramMetrics()
+        client = Client(session=FailingTransport(), state=GameState(language="en", theme="c", step=0, progression=0.0), settings=ClientSettings(metrics=metrics))
+        with self.assertRaises(RuntimeError):
+            client.answer("yes")
+        self.assertEqual(metrics.histogram("request", endpoint="answer", language="en").count, 1)
+
+    def test_async_client(self):
+        metrics = HistogramMetrics()
+
+        async def play():
+            client = AsyncClient(session=AsyncStubTransport(), settings=ClientSettings(metrics=metrics))
+            await client.start_game()
+            await client.answer("yes")
+
+        asyncio.run(play())
+        self.assertEqual(metrics.histogram("request", endpoint="game", language="en").count, 1)
+        self.assertEqual(metrics.histogram("parse", stage="json", language="en").count, 1)
+        metrics.reset()
+        self.assertEqual(metrics.summary(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+import os
+from re import compile
+from threading import Thread
+
+from akinator import Client, Response
+from akinator.parsing import START_PAGE, WIN_PAGE, Field, PageExtractor
+
+PAGES = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "pages")
+
+
+def load(name):
+    with open(os.path.join(PAGES, name), encoding="utf-8") as file:
+        return file.read()
+
+
+class TestPageExtractor(unittest.TestCase):
+    def test_start_page(self):
+        fields = START_PAGE.extract(load("game.html"))
+        self.assertEqual(fields, {
+            "session_id": "47b1c6bd-5c8f-4e1a-9a0e-8b9f2f5e3c11",
+            "signature": "1478963258",
+            "identifiant": "a1b2c3d4e5",
+            "question": "Is your character a girl?",
+            "proposition": "I think of",
+        })
+
+    def test_win_page(self):
+        fields = WIN_PAGE.extract(load("win.html"))
+        self.assertEqual(fields["win_message"], "Great, I guessed right one more time!")
+        self.assertEqual(fields["already_played"], "I have already played")
+        self.assertEqual(fields["times_selected"], "48213")
+        self.assertEqual(fields["times"], "times")
+
+    def test_first_match_and_missing_fields(self):
+        extractor = PageExtractor([
+            Field("a", "a=", compile(r"a=(\d+);")),
+            Field("b", "b=", compile(r"b=(\d+);")),
+            Field("c", "c=", compile(r"c=(\d+);")),
+        ])
+        self.assertEqual(extractor.extract("b=2; a=x; a=1; c=3;"), {"a": "1", "b": "2", "c": "3"})
+        self.assertEqual(extractor.extract("b=1; a=2; b=3; c=4;"), {"a": "2", "b": "1", "c": "4"})
+        self.assertEqual(extractor.extract("b=2; c=3;"), {"b": "2", "a": None, "c": "3"})
+        self.assertEqual(extractor.stats()["count"], 3)
+        self.assertGreater(extractor.stats()["total_time"], 0)
+
+    def test_shared_between_threads(self):
+        text = load("game.html")
+        extractor = PageExtractor(START_PAGE.fields)
+        expected = extractor.extract(text)
+        results = []
+        threads = [Thread(target=lambda: results.extend(extractor.extract(text) for _ in range(200))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(result == expected for result in results))
+        self.assertEqual(extractor.stats()["count"], 1601)
+
+
+class CountingResponse(Response):
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for chunk in super().iter_content(chunk_size, decode_unicode):
+            self.read = getattr(self, "read", 0) + len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class StreamingTransport:
+    def __init__(self, page):
+        self.response = CountingResponse(200, page.encode())
+
+    def post(self, url, data=None, json=None, **kwargs):
+        self.kwargs = kwargs
+        return self.response
+
+    def close(self):
+        pass
+
+
+class TestStreamExtraction(unittest.TestCase):
+    def test_matches_full_extraction_for_any_chunking(self):
+        text = load("game.html")
+        expected = START_PAGE.extract(text)
+        for size in (1, 7, 100, 4096, len(text)):
+            extraction = START_PAGE.stream()
+            for start in range(0, len(text), size):
+                if extraction.feed(text[start:start + size].encode()):
+                    break
+            self.assertEqual(extraction.close(), expected)
+
+    def test_stops_reading_once_fields_are_found(self):
+        page = load("game.html")
+        transport = StreamingTransport(page)
+        client = Client(session=transport)
+        client.start_game(stream=True)
+        self.assertTrue(transport.kwargs["stream"])
+        self.assertTrue(transport.response.closed)
+        self.assertLess(transport.response.read, len(page))
+        self.assertEqual(client.session_id, "47b1c6bd-5c8f-4e1a-9a0e-8b9f2f5e3c11")
+        self.assertEqual(client.question, "Is your character a girl?")
+        self.assertEqual(client.proposition, "I think of")
+
+    def test_truncated_lines_are_not_matched(self):
+        extraction = PageExtractor([Field("q", "<p>", compile(r"<p>(.+)</p>"))]).stream()
+        self.assertFalse(extraction.feed("<p>a</p> <p>b</p"))
+        self.assertTrue(extraction.feed("></p>\n"))
+        self.assertEqual(extraction.close(), {"q": "a</p> <p>b</p>"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+import asyncio
+import time
+from threading import Thread
+
+from requests import ConnectionError as RequestsConnectionError
+
+from akinator import AsyncPooledSession, BoundedExecutor, Client, PooledSession, PoolTimeoutError, Response, SessionPool
+
+
+class StreamedResponse(Response):
+    def __init__(self, url):
+        super().__init__(200, b"body", url=url)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeScraper:
+    def __init__(self):
+        self.closed = False
+        self.posts = 0
+
+    def post(self, url, data=None, json=None, **kwargs):
+        self.posts += 1
+        if data == "fail":
+            raise RequestsConnectionError("connection reset")
+        return Response(200, b'{"completion": "OK", "akitude": "defi.png", "step": "1", "progression": "5", "question": "Q?"}', url=url)
+
+    def get(self, url, **kwargs):
+        return StreamedResponse(url) if kwargs.get("stream") else Response(200, b"", url=url)
+
+    def close(self):
+        self.closed = True
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = SessionPool(max_per_host=2, idle_timeout=60, acquire_timeout=0.05, factory=FakeScraper)
+
+    def test_sessions_are_reused_per_host(self):
+        transport = PooledSession(self.pool)
+        transport.post("https://en.akinator.com/answer")
+        transport.post("https://en.akinator.com/answer")
+        transport.post("https://fr.akinator.com/answer")
+        stats = self.pool.stats()
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["reused"], 1)
+        self.assertEqual(stats["idle"], {"en.akinator.com": 1, "fr.akinator.com": 1})
+
+    def test_max_per_host(self):
+        first = self.pool.acquire("en.akinator.com")
+        second = self.pool.acquire("en.akinator.com")
+        with self.assertRaises(PoolTimeoutError):
+            self.pool.acquire("en.akinator.com")
+        self.pool.acquire("fr.akinator.com")
+
+        waiter = []
+        thread = Thread(target=lambda: waiter.append(self.pool.acquire("en.akinator.com")))
+        self.pool.acquire_timeout = 1
+        thread.start()
+        self.pool.release("en.akinator.com", first)
+        thread.join()
+        self.assertIs(waiter[0], first)
+        self.pool.release("en.akinator.com", second)
+
+    def test_release_wakes_a_waiter_for_the_same_host(self):
+        self.pool.max_per_host = 1
+        self.pool.acquire_timeout = 5
+        held = {host: self.pool.acquire(host) for host in ("en.akinator.com", "fr.akinator.com")}
+        acquired = {}
+        threads = [Thread(target=lambda host=host: acquired.setdefault(host, self.pool.acquire(host))) for host in ("fr.akinator.com", "en.akinator.com")]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        self.pool.release("en.akinator.com", held["en.akinator.com"])
+        threads[1].join(1)
+        self.assertIs(acquired.get("en.akinator.com"), held["en.akinator.com"])
+        self.pool.release("fr.akinator.com", held["fr.akinator.com"])
+        threads[0].join(1)
+        self.assertIs(acquired.get("fr.akinator.com"), held["fr.akinator.com"])
+
+    def test_streamed_response_holds_the_session(self):
+        transport = PooledSession(self.pool)
+        response = transport.get("https://en.akinator.com/", stream=True)
+        self.assertEqual(self.pool.stats()["idle"], {})
+        response.close()
+        response.close()
+        self.assertTrue(response.closed)
+        self.assertEqual(self.pool.stats()["idle"], {"en.akinator.com": 1})
+
+    def test_idle_eviction(self):
+        session = self.pool.acquire("en.akinator.com")
+        self.pool.release("en.akinator.com", session)
+        self.pool.idle_timeout = 0
+        self.assertEqual(self.pool.evict_idle(), 1)
+        self.assertTrue(session.closed)
+        self.assertEqual(self.pool.stats()["open"], {"en.akinator.com": 0})
+
+    def test_health_check_and_discard_on_error(self):
+        transport = PooledSession(self.pool)
+        with self.assertRaises(RequestsConnectionError):
+            transport.post("https://en.akinator.com/answer", data="fail")
+        self.assertEqual(self.pool.stats()["discarded"], 1)
+
+        session = self.pool.acquire("en.akinator.com")
+        self.pool.release("en.akinator.com", session)
+        self.pool.health_check = lambda scraper: False
+        self.assertIsNot(self.pool.acquire("en.akinator.com"), session)
+        self.assertTrue(session.closed)
+
+    def test_client_borrows_from_pool(self):
+        client = Client(session=PooledSession(self.pool))
+        client.language, client.theme, client.step, client.progression = "en", "c", 0, 0
+        client.answer("yes")
+        client.close()
+        self.assertEqual(client.question, "Q?")
+        self.assertEqual(self.pool.stats()["idle"], {"en.akinator.com": 1})
+
+
+class TestAsyncPooledSession(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.pool = SessionPool(max_per_host=1, idle_timeout=60, acquire_timeout=1, factory=FakeScraper)
+
+    async def test_waits_on_the_event_loop(self):
+        held = self.pool.acquire("en.akinator.com")
+        waiter = asyncio.ensure_future(self.pool.acquire_async("en.akinator.com"))
+        await asyncio.sleep(0.05)
+        self.assertFalse(waiter.done())
+        self.assertEqual(len(self.pool._waiters["en.akinator.com"]), 1)
+        self.pool.release("en.akinator.com", held)
+        self.assertIs(await waiter, held)
+
+        self.pool.acquire_timeout = 0.05
+        with self.assertRaises(PoolTimeoutError):
+            await self.pool.acquire_async("en.akinator.com")
+        self.assertEqual(len(self.pool._waiters["en.akinator.com"]), 0)
+
+    async def test_concurrent_requests_share_the_limit(self):
+        transport = AsyncPooledSession(self.pool)
+        responses = await asyncio.gather(*(transport.post("https://en.akinator.com/answer") for _ in range(20)))
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+        stats = self.pool.stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["idle"], {"en.akinator.com": 1})
+
+    async def test_runs_on_executor(self):
+        executor = BoundedExecutor(2, name="test-pool")
+        transport = AsyncPooledSession(self.pool, executor=executor)
+        await asyncio.gather(*(transport.get("https://en.akinator.com/") for _ in range(5)))
+        self.assertEqual(executor.stats()["completed"], 5)
+        executor.shutdown()
+
+    async def test_streamed_response_holds_the_session(self):
+        transport = AsyncPooledSession(self.pool)
+        response = await transport.get("https://en.akinator.com/", stream=True)
+        await asyncio.sleep(0)
+        self.assertEqual(self.pool.stats()["idle"], {})
+        response.close()
+        self.assertEqual(self.pool.stats()["idle"], {"en.akinator.com": 1})
+
+    async def test_discard_on_error(self):
+        transport = AsyncPooledSession(self.pool)
+        with self.assertRaises(RequestsConnectionError):
+            await transport.post("https://en.akinator.com/answer", data="fail")
+        await asyncio.sleep(0)
+        self.assertEqual(self.pool.stats()["discarded"], 1)
+        self.assertEqual(self.pool.stats()["open"], {"en.akinator.com": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from akinator import AssetCache, AsyncClient, AsyncRecordingTransport, AsyncReplayTransport, Cassette, Client, RecordingTransport, ReplayError, ReplayTransport
+from akinator.testing import PNG_SIGNATURE, AsyncFakeTransport, FakeAkinator, FakeServer, FakeTransport, LocalTransport
+
+
+def play(client):
+    client.start_game()
+    client.answer("yes")
+    client.answer("no")
+    client.back()
+    while not client.finished:
+        client.answer("yes")
+    return client.state.copy()
+
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.jsonl.gz")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_record_and_replay_over_http(self):
+        with FakeServer(FakeAkinator(seed=3)) as server:
+            recorder = RecordingTransport(LocalTransport(server))
+            recorded = play(Client(recorder))
+            recorder.save(self.path)
+            requests = sum(server.akinator.requests.values())
+
+        cassette = Cassette.load(self.path)
+        self.assertEqual(len(cassette), requests)
+        self.assertEqual([interaction.url.rsplit("/", 1)[1] for interaction in cassette][:4], ["game", "answer", "answer", "cancel_answer"])
+        self.assertEqual(cassette.interactions[1].data["answer"], "0")
+
+        replayed = play(Client(ReplayTransport(self.path)))
+        self.assertEqual(replayed, recorded)
+
+    def test_streamed_start_is_recorded_whole(self):
+        recorder = RecordingTransport(FakeTransport(FakeAkinator(seed=1)))
+        client = Client(recorder)
+        client.start_game(stream=True)
+        self.assertIn("</html>", recorder.cassette.interactions[0].body)
+
+    def test_mismatch_and_exhaustion(self):
+        recorder = RecordingTransport(FakeTransport(FakeAkinator(seed=1)))
+        Client(recorder).start_game()
+        replay = ReplayTransport(recorder.cassette)
+        client = Client(replay)
+        client.start_game()
+        with self.assertRaises(ReplayError):
+            replay.post("https://en.akinator.com/answer", {"answer": 0})
+        with self.assertRaises(RuntimeError) as context:
+            client.start_game()
+        self.assertIsInstance(context.exception.__cause__, ReplayError)
+        replay.rewind()
+        client.start_game()
+
+    def test_images_are_recorded_and_replayed(self):
+        recorder = RecordingTransport(FakeTransport(FakeAkinator(seed=1)))
+        client = Client(recorder)
+        client.start_game()
+        image = AssetCache(recorder).get(client.akitude_url)
+        self.assertTrue(image.startswith(PNG_SIGNATURE))
+        recorder.save(self.path)
+
+        replay = ReplayTransport(self.path)
+        self.assertEqual([interaction.method for interaction in replay.cassette], ["POST", "GET"])
+        self.assertEqual(AssetCache(replay).get(client.akitude_url), image)
+        with self.assertRaises(ReplayError):
+            replay.post(client.akitude_url)
+
+    def test_repeat(self):
+        recorder = RecordingTransport(FakeTransport(FakeAkinator(seed=1)))
+        play(Client(recorder))
+        replay = ReplayTransport(recorder.cassette, repeat=True)
+        first, second = play(Client(replay)), play(Client(replay))
+        self.assertEqual(first, second)
+
+    def test_async(self):
+        async def main():
+            recorder = AsyncRecordingTransport(AsyncFakeTransport(FakeAkinator(seed=2)))
+            client = AsyncClient(recorder)
+            await client.start_game()
+            await client.answer("yes")
+            image = (await recorder.get(client.akitude_url)).content
+            recorder.save(self.path)
+            replay = AsyncReplayTransport(self.path)
+            replayed = AsyncClient(replay)
+            await replayed.start_game()
+            await replayed.answer("yes")
+            self.assertEqual((await replay.get(client.akitude_url)).content, image)
+            return client.state, replayed.state
+
+        recorded, replayed = asyncio.run(main())
+        self.assertEqual(recorded, replayed)
+
+    def test_bad_version(self):
+        import gzip
+        with gzip.open(self.path, "wt") as file:
+            file.write('{"version": 99}\n')
+        with self.assertRaises(ValueError):
+            Cassette.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
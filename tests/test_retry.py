@@ -0,0 +1,187 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+import asyncio
+from json import dumps
+
+from requests import ConnectionError as RequestsConnectionError, ConnectTimeout, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from akinator import AsyncClient, CircuitBreaker, CircuitOpenError, Client, ClientSettings, GameState, HostRateLimiter, Response, RetryPolicy, TransientError
+
+BODY = dumps({"completion": "OK", "akitude": "serein.png", "step": "1", "progression": "10", "question": "Q?"}).encode()
+
+
+class FlakyTransport:
+    def __init__(self, *failures):
+        self.failures = list(failures)
+        self.calls = 0
+
+    def respond(self, url):
+        self.calls += 1
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return Response(failure, b"", {"Retry-After": "0"} if failure == 429 else None, url=url)
+        return Response(200, BODY, url=url)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.respond(url)
+
+    def close(self):
+        pass
+
+
+class AsyncFlakyTransport(FlakyTransport):
+    async def post(self, url, data=None, json=None, **kwargs):
+        return self.respond(url)
+
+
+def refused():
+    return RequestsConnectionError(MaxRetryError(None, "/answer", NewConnectionError(None, "Connection refused")))
+
+
+def started(cls, transport, **kwargs):
+    return cls(transport, state=GameState(language="en", theme="c", step=0, progression=0.0), **kwargs)
+
+
+class TestRetry(unittest.TestCase):
+    def test_transient_failures_are_retried(self):
+        transport = FlakyTransport(503, refused(), ConnectTimeout())
+        policy = RetryPolicy(max_attempts=4, base_delay=0.001)
+        client = started(Client, transport, settings=ClientSettings(retry=policy))
+        client.answer("yes")
+        self.assertEqual(client.question, "Q?")
+        self.assertEqual(transport.calls, 4)
+        self.assertEqual(policy.stats()["attempts"], 4)
+        self.assertEqual(policy.stats()["retries"], 3)
+        self.assertGreater(policy.stats()["retry_time"], 0)
+
+    def test_errors_after_sending_are_not_retried(self):
+        for error in (ReadTimeout(), RequestsConnectionError("reset"), ConnectionResetError()):
+            transport = FlakyTransport(error)
+            client = started(Client, transport, settings=ClientSettings(retry=RetryPolicy(base_delay=0.001)))
+            with self.assertRaises(RuntimeError) as context:
+                client.answer("yes")
+            self.assertNotIsInstance(context.exception, TransientError)
+            self.assertIs(context.exception.__cause__, error)
+            self.assertEqual(transport.calls, 1)
+
+    def test_exhausted_retries_raise_transient_error(self):
+        limiter = HostRateLimiter(100, adaptive=True)
+        policy = RetryPolicy(max_attempts=2, base_delay=0.001)
+        client = started(Client, FlakyTransport(429, 429), settings=ClientSettings(retry=policy, rate_limiter=limiter))
+        with self.assertRaises(TransientError) as context:
+            client.answer("yes")
+        self.assertIsInstance(context.exception, RuntimeError)
+        self.assertEqual(context.exception.status_code, 429)
+        self.assertEqual(limiter.bucket("en.akinator.com").rate, 25)
+        self.assertEqual(policy.failures, 1)
+
+    def test_logic_errors_are_not_retried(self):
+        transport = FlakyTransport(404)
+        client = started(Client, transport, settings=ClientSettings(retry=RetryPolicy(base_delay=0.001)))
+        with self.assertRaises(RuntimeError) as context:
+            client.answer("yes")
+        self.assertNotIsInstance(context.exception, TransientError)
+        self.assertEqual(transport.calls, 1)
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        client = started(Client, FlakyTransport(503, 503), settings=ClientSettings(circuit_breaker=breaker))
+        for _ in range(2):
+            with self.assertRaises(TransientError):
+                client.answer("yes")
+        self.assertEqual(breaker.state("en.akinator.com"), "open")
+        with self.assertRaises(CircuitOpenError):
+            client.answer("yes")
+        self.assertEqual((breaker.opened, breaker.rejected), (1, 1))
+
+        breaker.reset_timeout = 0
+        self.assertEqual(breaker.state("en.akinator.com"), "half-open")
+        client.answer("yes")
+        self.assertEqual(breaker.state("en.akinator.com"), "closed")
+
+    def test_errors_and_timeouts_open_the_circuit(self):
+        for failures in ((500, 502), (ReadTimeout(), ReadTimeout())):
+            breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+            client = started(Client, FlakyTransport(*failures), settings=ClientSettings(circuit_breaker=breaker))
+            for _ in range(2):
+                with self.assertRaises(Exception) as context:
+                    client.answer("yes")
+                self.assertNotIsInstance(context.exception, CircuitOpenError)
+            self.assertEqual(breaker.state("en.akinator.com"), "open")
+            with self.assertRaises(CircuitOpenError):
+                client.answer("yes")
+
+    def test_trial_is_released_without_outcome(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        client = started(Client, FlakyTransport(503, ValueError("challenge")), settings=ClientSettings(circuit_breaker=breaker))
+        with self.assertRaises(TransientError):
+            client.answer("yes")
+        with self.assertRaises(RuntimeError) as context:
+            client.answer("yes")
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+        self.assertEqual(breaker.state("en.akinator.com"), "half-open")
+        client.answer("yes")
+        self.assertEqual(breaker.state("en.akinator.com"), "closed")
+
+
+class TestAsyncRetry(unittest.IsolatedAsyncioTestCase):
+    async def test_transient_failures_are_retried(self):
+        transport = AsyncFlakyTransport(ConnectionRefusedError(), 503)
+        client = started(AsyncClient, transport, settings=ClientSettings(retry=RetryPolicy(base_delay=0.001)))
+        await client.answer("yes")
+        self.assertEqual(client.step, 1)
+        self.assertEqual(transport.calls, 3)
+
+    async def test_cancelled_trial_is_released(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        transport = AsyncFlakyTransport(503)
+        client = started(AsyncClient, transport, settings=ClientSettings(circuit_breaker=breaker))
+        with self.assertRaises(TransientError):
+            await client.answer("yes")
+
+        async def hang(url, data=None, json=None, **kwargs):
+            await asyncio.sleep(10)
+
+        transport.post = hang
+        task = asyncio.ensure_future(client.answer("yes"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(breaker.state("en.akinator.com"), "half-open")
+        del transport.post
+        await client.answer("yes")
+        self.assertEqual(breaker.state("en.akinator.com"), "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
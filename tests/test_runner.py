@@ -0,0 +1,135 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+import asyncio
+import time
+from json import dumps
+
+from akinator import AsyncClient, GameRunner, HostRateLimiter, Response, TokenBucket
+
+PAGE = (
+    "<script>$('#session').val('1234');$('#signature').val('5678');$('#identifiant').val('abcd');</script>\n"
+    '<div class="bubble-body"><p class="question-text" id="question-label">Question 0?</p></div>\n'
+    '<div class="sub-bubble-propose"><p id="p-sub-bubble">I think of</p></div>\n'
+).encode()
+
+
+class AsyncStubAkinator:
+    def __init__(self, proposal_step=3, delay=0.0):
+        self.proposal_step = proposal_step
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.closed = 0
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        endpoint = url.rsplit("/", 1)[1]
+        if endpoint == "game":
+            return Response(200, PAGE, url=url)
+        if endpoint == "choice":
+            return Response(200, b"", url=url)
+        step = int(data["step"]) + 1
+        if step == self.proposal_step:
+            body = {"completion": "OK", "id_proposition": "1", "name_proposition": "Name", "description_proposition": "Desc", "pseudo": "x", "flag_photo": 0, "photo": "p.jpg"}
+        else:
+            body = {"completion": "OK", "akitude": "serein.png", "step": str(step), "progression": str(step * 10.0), "question": f"Question {step}?"}
+        return Response(200, dumps(body).encode(), url=url)
+
+    async def close(self):
+        self.closed += 1
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=100, capacity=2)
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+        started = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.005)
+
+    def test_host_limiter_overrides(self):
+        limiter = HostRateLimiter(10, overrides={"fr.akinator.com": 1})
+        self.assertEqual(limiter.bucket("en.akinator.com").rate, 10)
+        self.assertEqual(limiter.bucket("fr.akinator.com").rate, 1)
+        self.assertIs(limiter.bucket("en.akinator.com"), limiter.bucket("en.akinator.com"))
+
+
+class TestGameRunner(unittest.IsolatedAsyncioTestCase):
+    async def test_results_are_streamed_with_bounded_concurrency(self):
+        transport = AsyncStubAkinator(delay=0.001)
+        runner = GameRunner(lambda: AsyncClient(transport), concurrency=4)
+        results = [result async for result in runner.run([lambda client: "yes"] * 20)]
+        self.assertEqual(len(results), 20)
+        self.assertEqual(sorted(result.index for result in results), list(range(20)))
+        self.assertTrue(all(result.win for result in results))
+        self.assertEqual(results[0].steps, 4)
+        self.assertLessEqual(transport.peak, 4)
+        self.assertEqual((runner.started, runner.completed, runner.failed), (20, 20, 0))
+        self.assertEqual(transport.closed, 20)
+
+    async def test_default_factory_matches_concurrency(self):
+        async with GameRunner(concurrency=50) as runner:
+            client = runner.factory()
+            self.assertIs(client.session.pool, runner._pool)
+            self.assertIs(client.session.executor, runner._executor)
+            self.assertEqual(runner._pool.max_per_host, 50)
+            self.assertEqual(runner._executor.max_workers, 50)
+
+    async def test_async_policies_and_errors(self):
+        async def policies():
+            async def idk(client):
+                return "idk"
+            yield idk
+            yield lambda client: "not an answer"
+
+        transport = AsyncStubAkinator(proposal_step=100)
+        runner = GameRunner(lambda: AsyncClient(transport), max_steps=5)
+        results = sorted([result async for result in runner.run(policies())])
+        self.assertEqual(transport.closed, 2)
+        self.assertEqual(results[0].steps, 5)
+        self.assertIsNone(results[0].error)
+        self.assertFalse(results[0].win)
+        self.assertIsNotNone(results[1].error)
+        self.assertEqual(runner.failed, 1)
+
+    async def test_rate_limit(self):
+        runner = GameRunner(lambda: AsyncClient(AsyncStubAkinator(proposal_step=2)), rate_limiter=HostRateLimiter(200, 1))
+        started = time.monotonic()
+        results = [result async for result in runner.run([lambda client: "no", lambda client: "yes"] * 2)]
+        self.assertEqual(len(results), 4)
+        self.assertGreaterEqual(time.monotonic() - started, 10 / 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import pickle
+import unittest
+
+from akinator import AsyncClient, ClientSettings, GameRunner, InvalidChoiceError, ShardedClient, ShardedRunner, Timeout, TransientError, UndoHistory, Win
+from akinator.testing import AsyncFakeTransport, Conditions, FakeAkinator
+
+
+# Every game of a shard gets its own client, which must reach the fake holding the shard's sessions.
+AKINATOR = FakeAkinator(propose_after=5)
+
+
+def fake_client():
+    return AsyncClient(AsyncFakeTransport(AKINATOR))
+
+
+def undo_client():
+    return AsyncClient(AsyncFakeTransport(AKINATOR), settings=ClientSettings(undo=UndoHistory()))
+
+
+def timing_out_client():
+    return AsyncClient(AsyncFakeTransport(FakeAkinator(Conditions(timeout_rate=1.0))))
+
+
+class TestSharding(unittest.TestCase):
+    def test_games_are_spread_over_shards(self):
+        async def main(runner):
+            game_runner = GameRunner(runner.client, concurrency=10)
+            return [result async for result in game_runner.run(lambda client: "yes" for _ in range(20))]
+
+        with ShardedRunner(2, fake_client) as runner:
+            results = asyncio.run(main(runner))
+            stats = runner.stats()
+        self.assertEqual(len(results), 20)
+        self.assertTrue(all(result.error is None and result.win for result in results))
+        self.assertTrue(all(calls > 0 and pending == 0 for calls, pending in stats))
+
+    def test_facade(self):
+        async def main(runner):
+            client = runner.client()
+            self.assertIsInstance(client, ShardedClient)
+            await client.start_game(language="fr")
+            self.assertEqual(client.question, "Is your character real?")
+            self.assertEqual(client.akitude_url, "https://fr.akinator.com/assets/img/akitudes_670x1096/defi.png")
+            shard = client.shard
+            trajectory = await client.answer_many(["idk", "idk"])
+            self.assertEqual([step.step for step in trajectory], [1, 2])
+            with self.assertRaises(InvalidChoiceError):
+                await client.answer("maybe")
+            resumed = runner.client(await client.dump_state())
+            await resumed.answer("no")
+            self.assertEqual(resumed.step, 3)
+            self.assertIs(resumed.shard, runner.shard_for(client.session_id))
+            self.assertIs(client.shard, shard)
+            events = [event async for event in client.play(lambda event: "yes")]
+            self.assertIsInstance(events[-1], Win)
+
+        # A single shard, as every shard has its own fake service.
+        with ShardedRunner(1, fake_client) as runner:
+            asyncio.run(main(runner))
+
+    def test_games_do_not_share_clients(self):
+        async def play(runner, answer):
+            client = runner.client()
+            await client.start_game()
+            await client.answer(answer)
+            expected = (client.step, client.progression, client.answers)
+            await client.answer("no")
+            await client.back()
+            return expected, (client.step, client.progression, client.answers)
+
+        async def main(runner):
+            return await asyncio.gather(*(play(runner, answer) for answer in ["yes", "no", "idk", "p", "pn"] * 2))
+
+        with ShardedRunner(1, undo_client) as runner:
+            for expected, restored in asyncio.run(main(runner)):
+                self.assertEqual(restored, expected)
+
+    def test_resumed_games_return_to_their_shard(self):
+        async def play(runner):
+            client = runner.client()
+            await client.start_game()
+            await client.answer("yes")
+            resumed = runner.client(await client.dump_state())
+            await resumed.answer("no")
+            await resumed.back()
+            return client.shard, resumed.shard, resumed.step
+
+        async def main(runner):
+            return await asyncio.gather(*(play(runner) for _ in range(6)))
+
+        # Every shard has its own fake service, so a game resumed on another shard would fail.
+        with ShardedRunner(3, undo_client) as runner:
+            for shard, resumed, step in asyncio.run(main(runner)):
+                self.assertIs(resumed, shard)
+                self.assertEqual(step, 1)
+
+    def test_transient_error_keeps_its_status(self):
+        error = pickle.loads(pickle.dumps(TransientError("Too many requests.", 429)))
+        self.assertEqual((str(error), error.status_code), ("Too many requests.", 429))
+
+    def test_exception_causes_cross_processes(self):
+        async def main(runner):
+            client = runner.client()
+            await client.start_game()
+            return [event async for event in client.play(["yes"])]
+
+        with ShardedRunner(1, timing_out_client) as runner:
+            events = asyncio.run(main(runner))
+        self.assertIsInstance(events[-1], Timeout)
+
+    def test_invalid_shards(self):
+        with self.assertRaises(ValueError):
+            ShardedRunner(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
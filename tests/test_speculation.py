@@ -0,0 +1,140 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import threading
+import time
+import unittest
+
+from akinator import AsyncClient, Client, ClientSettings, Speculation
+from akinator.testing import AsyncFakeTransport, FakeAkinator, FakeTransport
+
+
+def server_step(akinator, client):
+    return akinator._sessions[client.session_id]["step"]
+
+
+class BrokenAssets(FakeTransport):
+    def get(self, url, **kwargs):
+        raise ConnectionError("reset")
+
+
+class TestSpeculation(unittest.TestCase):
+    def test_connection_is_warmed_without_answering(self):
+        akinator = FakeAkinator(propose_after=50)
+        speculation = Speculation(warm_after=0.01)
+        client = Client(FakeTransport(akinator), settings=ClientSettings(speculation=speculation))
+        client.start_game()
+        time.sleep(0.1)
+        self.assertEqual(akinator.requests["asset"], 1)
+        self.assertEqual(akinator.requests["answer"], 0)
+        self.assertEqual(server_step(akinator, client), 0)
+
+        client.answer("no")
+        self.assertEqual(akinator.requests["answer"], 1)
+        self.assertEqual((client.step, server_step(akinator, client)), (1, 1))
+        time.sleep(0.1)
+        client.answer("yes")
+        client.back()
+        self.assertEqual((client.step, server_step(akinator, client)), (1, 1))
+        client.close()
+        self.assertEqual(akinator.requests["answer"], 2)
+        stats = speculation.stats()
+        self.assertEqual(stats["issued"], 2)
+        self.assertEqual(stats["saved"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["wasted"], 0)
+
+    def test_quick_answers_are_not_warmed(self):
+        akinator = FakeAkinator(propose_after=50)
+        speculation = Speculation(warm_after=10)
+        client = Client(FakeTransport(akinator), settings=ClientSettings(speculation=speculation))
+        client.start_game()
+        client.answer("yes")
+        client.close()
+        self.assertEqual(akinator.requests["asset"], 0)
+        self.assertEqual(speculation.stats()["issued"], 0)
+        self.assertEqual(speculation.stats()["misses"], 1)
+        with self.assertRaises(ValueError):
+            Speculation(warm_after=-1)
+
+    def test_failed_and_unused_warmups_are_wasted(self):
+        speculation = Speculation(warm_after=0)
+        client = Client(BrokenAssets(FakeAkinator(propose_after=50)), settings=ClientSettings(speculation=speculation))
+        client.start_game()
+        time.sleep(0.05)
+        self.assertEqual(speculation.stats()["wasted"], 1)
+        client.answer("yes")
+        self.assertEqual(client.step, 1)
+        self.assertEqual(speculation.stats()["misses"], 1)
+        client.close()
+
+        wasted = speculation.stats()["wasted"]
+        client = Client(FakeTransport(FakeAkinator(propose_after=50)), settings=ClientSettings(speculation=speculation))
+        client.start_game()
+        time.sleep(0.05)
+        client.close()
+        self.assertEqual(speculation.stats()["wasted"], wasted + 1)
+        self.assertEqual(speculation.stats()["saved"], 0)
+
+    def test_warm_ups_share_threads(self):
+        speculation = Speculation(warm_after=0.05)
+        akinator = FakeAkinator(propose_after=50)
+        clients = [Client(FakeTransport(akinator), settings=ClientSettings(speculation=speculation)) for _ in range(30)]
+        before = threading.active_count()
+        for client in clients:
+            client.start_game()
+        self.assertLessEqual(threading.active_count() - before, 5)
+        time.sleep(0.2)
+        self.assertEqual(akinator.requests["asset"], 30)
+        for client in clients:
+            client.close()
+
+    def test_async(self):
+        speculation = Speculation(warm_after=0.01)
+        akinator = FakeAkinator(propose_after=50)
+
+        async def main():
+            client = AsyncClient(AsyncFakeTransport(akinator), settings=ClientSettings(speculation=speculation))
+            await client.start_game()
+            await asyncio.sleep(0.05)
+            await client.answer("p")
+            await client.answer("pn")
+            await client.close()
+            return client
+
+        client = asyncio.run(main())
+        self.assertEqual(client.answers, "34")
+        self.assertEqual(akinator.requests["answer"], 2)
+        self.assertEqual(server_step(akinator, client), 2)
+        self.assertEqual(akinator.requests["asset"], 1)
+        self.assertEqual(speculation.stats()["saved"], 1)
+        self.assertEqual(speculation.stats()["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
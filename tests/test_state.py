@@ -0,0 +1,89 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import unittest
+
+from akinator import AsyncClient, Client, GameState
+
+
+class TestGameState(unittest.TestCase):
+    def test_defaults_and_slots(self):
+        state = GameState()
+        self.assertFalse(hasattr(state, "__dict__"))
+        self.assertIsNone(state.language)
+        self.assertFalse(state.child_mode)
+        self.assertEqual(state.step_last_proposition, "")
+        self.assertEqual(state.proposition, "")
+        with self.assertRaises(AttributeError):
+            state.unknown = 1
+
+    def test_copy_and_equality(self):
+        state = GameState(language="en", step=3, progression=42.0)
+        copy = state.copy()
+        self.assertEqual(copy, state)
+        copy.step = 4
+        self.assertNotEqual(copy, state)
+        self.assertEqual(state.to_dict()["step"], 3)
+
+    def test_clients_delegate_to_state(self):
+        for cls in (Client, AsyncClient):
+            state = GameState(language="fr", theme="a", step=7, progression=70.0)
+            client = cls(state=state)
+            self.assertIs(client.state, state)
+            self.assertEqual(client.theme_name, "Animals")
+            client.step = 8
+            self.assertEqual(state.step, 8)
+            self.assertIn("Step: 8", repr(client))
+
+
+class TestStateSerialization(unittest.TestCase):
+    def test_round_trip(self):
+        state = GameState(language="jp", theme="a", child_mode=True, session_id="1", signature="2", identifiant="3", question="日本語?", progression=55.5, step=9, step_last_proposition=4)
+        data = state.to_bytes()
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(GameState.from_bytes(data), state)
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            GameState.from_bytes(b"[99]")
+        with self.assertRaises(ValueError):
+            GameState.from_bytes(b"[1, 2]")
+
+    def test_client_dump_and_resume(self):
+        for cls in (Client, AsyncClient):
+            client = cls(state=GameState(language="en", theme="c", session_id="1", signature="2", step=3, progression=30.0))
+            data = client.dump_state() if cls is Client else asyncio.run(client.dump_state())
+            resumed = cls.from_state(data, timeout=5)
+            self.assertIsInstance(resumed, cls)
+            self.assertEqual(resumed.state, client.state)
+            self.assertIsNot(resumed.state, client.state)
+            self.assertEqual(resumed.timeout, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
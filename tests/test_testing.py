@@ -0,0 +1,139 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import time
+import unittest
+
+from akinator import AsyncClient, Client, ClientSettings, RetryPolicy, TransientError
+from akinator.testing import AsyncFakeTransport, AsyncLocalTransport, Conditions, FakeAkinator, FakeServer, FakeTransport, LocalTransport
+
+
+def play(client, answer="yes", max_steps=100):
+    for _ in range(max_steps):
+        if client.finished:
+            break
+        client.answer(answer if not client.win else "yes")
+
+
+class TestFakeAkinator(unittest.TestCase):
+    def test_game_over_http(self):
+        with FakeServer(FakeAkinator(seed=1)) as server:
+            with Client(LocalTransport(server)) as client:
+                client.start_game(language="fr", stream=True)
+                self.assertEqual(client.question, "Is your character real?")
+                self.assertTrue(client.session_id and client.signature and client.identifiant)
+                play(client)
+                self.assertTrue(client.finished and client.win)
+                self.assertIn("Great, I guessed right one more time!", client.question)
+            self.assertEqual(server.akinator.requests["game"], 1)
+            self.assertEqual(server.akinator.requests["choice"], 1)
+
+    def test_async_game_over_http(self):
+        async def main(server):
+            client = AsyncClient(AsyncLocalTransport(server))
+            await client.start_game(stream=True)
+            while not client.finished:
+                await client.answer("yes")
+            await client.close()
+            return client
+
+        with FakeServer() as server:
+            client = asyncio.run(main(server))
+        self.assertTrue(client.win)
+
+    def test_back_and_exclude(self):
+        client = Client(FakeTransport(FakeAkinator(propose_after=3)))
+        client.start_game()
+        client.answer("idk")
+        client.answer("idk")
+        self.assertEqual(client.step, 2)
+        client.back()
+        self.assertEqual(client.step, 1)
+        client.answer("idk")
+        client.answer("idk")
+        self.assertTrue(client.win)
+        self.assertEqual(client.step_last_proposition, 2)
+        name = client.name_proposition
+        client.answer("no")
+        self.assertFalse(client.win)
+        self.assertEqual(client.step, 3)
+        client.answer("idk")
+        client.answer("idk")
+        self.assertTrue(client.win)
+        self.assertNotEqual(client.name_proposition, name)
+
+    def test_error_injection(self):
+        akinator = FakeAkinator(Conditions(error_rate=1.0))
+        client = Client(FakeTransport(akinator), settings=ClientSettings(retry=RetryPolicy(max_attempts=2, base_delay=0.001)))
+        with self.assertRaises(TransientError):
+            client.start_game()
+        self.assertEqual(akinator.injected["error"], 2)
+
+    def test_timeout_injection(self):
+        akinator = FakeAkinator(Conditions(timeout_rate=1.0))
+        client = Client(FakeTransport(akinator))
+        client.start_game()
+        with self.assertRaises(RuntimeError) as context:
+            client.answer("yes")
+        self.assertIn("timed out", str(context.exception.__cause__))
+        self.assertEqual(len(akinator), 0)
+
+    def test_soundlike_injection(self):
+        client = Client(FakeTransport(FakeAkinator(Conditions(soundlike_rate=1.0))))
+        client.start_game()
+        client.answer("yes")
+        self.assertTrue(client.finished)
+        self.assertFalse(client.win)
+        self.assertEqual(client.completion, "SOUNDLIKE")
+
+    def test_unknown_session_times_out(self):
+        first = Client(FakeTransport())
+        first.start_game()
+        second = Client(FakeTransport())
+        second.state = first.state.copy()
+        with self.assertRaises(RuntimeError):
+            second.answer("yes")
+
+    def test_latency(self):
+        async def main():
+            client = AsyncClient(AsyncFakeTransport(FakeAkinator(Conditions(latency=0.05))))
+            started = time.perf_counter()
+            await asyncio.gather(*(AsyncClient(client.session).start_game() for _ in range(10)))
+            return time.perf_counter() - started
+
+        self.assertLess(asyncio.run(main()), 0.4)
+
+    def test_sessions_are_bounded(self):
+        akinator = FakeAkinator(max_sessions=3)
+        for _ in range(5):
+            Client(FakeTransport(akinator)).start_game()
+        self.assertEqual(len(akinator), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
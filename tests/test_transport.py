@@ -0,0 +1,180 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import unittest
+
+from requests import HTTPError
+
+from akinator import AsyncClient, AsyncCloudScraper, AsyncHTTPSession, AsyncTransport, BoundedExecutor, Client, HTTPResponse, Response, Transport
+from akinator.parsing import START_PAGE
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+class TestResponse(unittest.TestCase):
+    def test_text_and_json(self):
+        response = Response(200, b'{"step": "1"}', {"Content-Type": "application/json"}, "https://en.akinator.com/answer")
+        self.assertTrue(response.ok)
+        self.assertEqual(response.text, '{"step": "1"}')
+        self.assertEqual(response.json(), {"step": "1"})
+        self.assertEqual(response.headers["content-type"], "application/json")
+        response.raise_for_status()
+
+    def test_raise_for_status(self):
+        with self.assertRaises(HTTPError):
+            Response(503, url="https://en.akinator.com/answer").raise_for_status()
+        with self.assertRaises(HTTPError):
+            Response(404).raise_for_status()
+
+
+class StubTransport:
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def post(self, url, data=None, json=None, **kwargs):
+        self.calls.append((url, data, kwargs))
+        return Response(200, b'{"completion": "OK", "akitude": "serein.png", "step": "1", "progression": "12.5", "question": "Q?"}')
+
+    def close(self):
+        self.closed = True
+
+
+class FallbackScraper:
+    headers = {}
+    cookies = []
+
+    def post(self, url, **kwargs):
+        return Response(200, b"{}", url=url)
+
+    def close(self):
+        pass
+
+
+class TestTransportProtocol(unittest.TestCase):
+    def test_builtin_transports_satisfy_protocols(self):
+        self.assertIsInstance(StubTransport(), Transport)
+        self.assertIsInstance(AsyncCloudScraper(), AsyncTransport)
+        self.assertIsInstance(Response(200), HTTPResponse)
+
+    def test_client_uses_transport_and_timeout(self):
+        transport = StubTransport()
+        with Client(session=transport, timeout=5) as client:
+            client.language, client.theme, client.step, client.progression = "en", "c", 0, 0
+            client.answer("yes")
+            self.assertEqual(client.question, "Q?")
+            self.assertEqual(client.step, 1)
+        url, data, kwargs = transport.calls[0]
+        self.assertEqual(url, "https://en.akinator.com/answer")
+        self.assertEqual(data["answer"], 0)
+        self.assertEqual(kwargs, {"timeout": 5})
+        self.assertTrue(transport.closed)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncHTTPSession(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.calls = []
+
+        async def answer(request):
+            self.calls.append(dict(await request.post()))
+            return web.json_response({"completion": "OK", "akitude": "defi.png", "step": "1", "progression": "10.5", "question": "Is your character real?"})
+
+        async def game(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            await response.write(b"<p>" + b"x" * 1000 + b"</p>\n$('#session').val('1');$('#signature').val('2');$('#identifiant').val('3');\n")
+            await response.write(b'<div class="bubble-body"><p class="question-text" id="question-label">Q?</p></div>\n<div class="sub-bubble-propose"><p id="p-sub-bubble">I think of</p></div>\n')
+            await response.write(b"y" * 100000)
+            return response
+
+        async def akitude(request):
+            return web.Response(body=b"\x89PNG", content_type="image/png")
+
+        async def challenge(request):
+            return web.Response(status=503, headers={"cf-mitigated": "challenge"}, text="Just a moment...")
+
+        app = web.Application()
+        app.router.add_post("/answer", answer)
+        app.router.add_post("/challenge", challenge)
+        app.router.add_post("/game", game)
+        app.router.add_get("/defi.png", akitude)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/answer"
+        self.session = AsyncHTTPSession(limit_per_host=2)
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.runner.cleanup()
+
+    async def test_post_reuses_connection(self):
+        first = await self.session.post(self.url, data={"step": 0})
+        second = await self.session.post(self.url, data={"step": 1})
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.json()["question"], "Is your character real?")
+        self.assertEqual(self.calls, [{"step": "0"}, {"step": "1"}])
+        self.assertEqual(len(self.session._get_session().connector._conns), 1)
+
+    async def test_get(self):
+        base = self.url.rsplit("/", 1)[0]
+        response = await self.session.get(f"{base}/defi.png")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"\x89PNG")
+
+    async def test_streamed_start_game(self):
+        base = self.url.rsplit("/", 1)[0]
+        response = await self.session.post(f"{base}/game", stream=True)
+        fields = await START_PAGE.extract_async_response(response)
+        self.assertEqual(fields["session_id"], "1")
+        self.assertEqual(fields["question"], "Q?")
+        self.assertEqual(fields["proposition"], "I think of")
+
+    async def test_challenge_falls_back_on_the_executor(self):
+        session = AsyncHTTPSession(scraper=FallbackScraper())
+        session.executor = BoundedExecutor(1, name="akinator-fallback")
+        base = self.url.rsplit("/", 1)[0]
+        try:
+            response = await session.post(f"{base}/challenge", data={"step": 0})
+        finally:
+            await session.close()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(session.executor.stats()["completed"], 1)
+        session.executor.shutdown(wait=True)
+
+    async def test_client_slot(self):
+        client = AsyncClient(session=self.session)
+        self.assertIs(client.session, self.session)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# pylint: skip-file
+
+import asyncio
+import json
+import time
+import unittest
+
+from akinator import AsyncClient, Client, ClientSettings, Correction, GameState, Response, SessionTimeoutError, Speculation, UndoHistory
+from akinator.testing import AsyncFakeTransport, Conditions, FakeAkinator, FakeTransport
+
+
+class Disagreeing(FakeTransport):
+    def __init__(self, akinator=None, completion="OK"):
+        super().__init__(akinator)
+        self.completion = completion
+
+    def post(self, url, data=None, json=None, **kwargs):
+        if url.endswith("/cancel_answer"):
+            time.sleep(self.akinator.conditions.latency)
+            return self.disagree(url, data)
+        return super().post(url, data, **kwargs)
+
+    def disagree(self, url, data):
+        self.akinator.requests["cancel_answer"] += 1
+        payload = {"completion": self.completion, "akitude": "serein.png", "step": "0", "question": "Is your character a robot?", "progression": "12.5"}
+        return Response(200, json.dumps(payload).encode(), {"Content-Type": "application/json"}, url)
+
+
+class AsyncDisagreeing(AsyncFakeTransport, Disagreeing):
+    def __init__(self, akinator=None, completion="OK"):
+        AsyncFakeTransport.__init__(self, akinator)
+        self.completion = completion
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        if url.endswith("/cancel_answer"):
+            await asyncio.sleep(self.akinator.conditions.latency)
+            return self.disagree(url, data)
+        return await super().post(url, data, **kwargs)
+
+
+class Unreachable(FakeTransport):
+    def post(self, url, data=None, json=None, **kwargs):
+        if url.endswith("/cancel_answer"):
+            raise ConnectionError("reset")
+        return super().post(url, data, **kwargs)
+
+
+class AsyncUnreachable(AsyncFakeTransport):
+    async def post(self, url, data=None, json=None, **kwargs):
+        if url.endswith("/cancel_answer"):
+            raise ConnectionError("reset")
+        return await super().post(url, data, **kwargs)
+
+
+def server_step(client):
+    return client.session.akinator._sessions[client.session_id]["step"]
+
+
+class TestUndoHistory(unittest.TestCase):
+    def test_back_is_instant_and_reconciled(self):
+        undo = UndoHistory()
+        akinator = FakeAkinator(Conditions(latency=0.05), seed=0)
+        with Client(FakeTransport(akinator), settings=ClientSettings(undo=undo)) as client:
+            client.start_game()
+            seen = [(client.step, client.question, client.progression, client.akitude)]
+            for _ in range(3):
+                client.answer("no")
+                seen.append((client.step, client.question, client.progression, client.akitude))
+            started = time.perf_counter()
+            client.back()
+            client.back()
+            self.assertLess(time.perf_counter() - started, 0.04)
+            self.assertEqual((client.step, client.question, client.progression, client.akitude), seen[1])
+            self.assertEqual(client.answers, "1")
+            client.answer("yes")
+            self.assertEqual(akinator.requests["cancel_answer"], 2)
+            self.assertEqual(client.step, 2)
+            self.assertEqual(client.answers, "10")
+        self.assertEqual(undo.stats(), {"size": 2, "instant": 2, "corrections": 0})
+        undo.close()
+
+    def test_restored_question_is_warmed_and_the_worker_closed(self):
+        undo = UndoHistory()
+        speculation = Speculation(warm_after=0.02)
+        akinator = FakeAkinator(seed=0)
+        client = Client(FakeTransport(akinator), settings=ClientSettings(undo=undo, speculation=speculation))
+        client.start_game()
+        client.answer("no")
+        time.sleep(0.1)
+        issued = speculation.issued
+        client.back()
+        time.sleep(0.1)
+        self.assertEqual(speculation.issued, issued + 1)
+        client.close()
+        self.assertIsNone(undo._executor)
+
+    def test_falls_back_to_the_server(self):
+        undo = UndoHistory(size=1)
+        akinator = FakeAkinator(seed=0)
+        with Client(FakeTransport(akinator), settings=ClientSettings(undo=undo)) as client:
+            client.start_game()
+            client.answer("no")
+            client.answer("no")
+            client.back()
+            client.back()
+            self.assertEqual(client.step, 0)
+            self.assertEqual(akinator.requests["cancel_answer"], 2)
+        self.assertEqual(undo.instant, 1)
+        undo.close()
+
+    def test_back_after_a_proposition(self):
+        undo = UndoHistory()
+        akinator = FakeAkinator(propose_after=3, seed=0)
+        with Client(FakeTransport(akinator), settings=ClientSettings(undo=undo)) as client:
+            client.start_game()
+            while not client.win:
+                client.answer("i don't know")
+            step = client.step
+            client.back()
+            self.assertFalse(client.win)
+            self.assertEqual(client.step, step - 1)
+            client.dump_state()
+        self.assertEqual(undo.corrections, 0)
+        undo.close()
+
+    def test_correction(self):
+        events = []
+        undo = UndoHistory(on_correction=events.append)
+        with Client(Disagreeing(FakeAkinator(Conditions(latency=0.05), seed=0)), settings=ClientSettings(undo=undo)) as client:
+            client.start_game()
+            client.answer("yes")
+            client.answer("yes")
+            client.back()
+            self.assertEqual((client.step, client.question), (1, "Is your character a girl?"))
+            client.dump_state()
+            self.assertEqual(events, [Correction(0, "Is your character a robot?", 12.5, "serein.png", 1, "Is your character a girl?")])
+            self.assertEqual((client.step, client.question, client.progression), (0, "Is your character a robot?", 12.5))
+            self.assertEqual(len(undo), 0)
+        undo.close()
+
+    def test_background_errors_surface_on_the_next_call(self):
+        undo = UndoHistory()
+        with Client(Disagreeing(FakeAkinator(seed=0), completion="KO - TIMEOUT"), settings=ClientSettings(undo=undo)) as client:
+            client.start_game()
+            client.answer("yes")
+            client.back()
+            with self.assertRaises(RuntimeError) as context:
+                client.answer("yes")
+            self.assertIsInstance(context.exception.__cause__, SessionTimeoutError)
+        undo.close()
+
+    def test_failed_back_returns_to_the_server_step(self):
+        undo = UndoHistory()
+        with Client(Unreachable(FakeAkinator(propose_after=50, seed=0)), settings=ClientSettings(undo=undo)) as client:
+            client.start_game()
+            client.answer("yes")
+            client.answer("no")
+            question = client.question
+            client.back()
+            self.assertEqual(client.step, 1)
+            with self.assertRaises(RuntimeError) as context:
+                client.answer("yes")
+            self.assertIsInstance(context.exception.__cause__, ConnectionError)
+            self.assertEqual((client.step, client.question, client.answers), (2, question, "01"))
+            client.answer("yes")
+            self.assertEqual((client.step, server_step(client)), (3, 3))
+        undo.close()
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            UndoHistory(size=0)
+
+
+class TestAsyncUndoHistory(unittest.TestCase):
+    def test_back_is_instant_and_corrected(self):
+        events = []
+        undo = UndoHistory(on_correction=events.append)
+
+        async def main():
+            client = AsyncClient(AsyncDisagreeing(FakeAkinator(Conditions(latency=0.05), seed=0)), settings=ClientSettings(undo=undo))
+            await client.start_game()
+            await client.answer("no")
+            await client.answer("no")
+            started = time.perf_counter()
+            await client.back()
+            elapsed = time.perf_counter() - started
+            restored = client.step
+            await client.answer("yes")
+            await client.close()
+            return elapsed, restored, client
+
+        elapsed, restored, client = asyncio.run(main())
+        self.assertLess(elapsed, 0.04)
+        self.assertEqual(restored, 1)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].step, 0)
+        self.assertEqual(client.session.akinator.requests["cancel_answer"], 1)
+
+    def test_dump_state_waits_for_a_failed_back(self):
+        undo = UndoHistory()
+
+        async def main():
+            client = AsyncClient(AsyncUnreachable(FakeAkinator(propose_after=50, seed=0)), settings=ClientSettings(undo=undo))
+            await client.start_game()
+            await client.answer("yes")
+            await client.answer("no")
+            await client.back()
+            restored = client.step
+            state = GameState.from_bytes(await client.dump_state())
+            await client.answer("no")
+            await client.close()
+            return restored, state, client
+
+        restored, state, client = asyncio.run(main())
+        self.assertEqual((restored, state.step, state.answers), (1, 2, "01"))
+        self.assertEqual((client.step, server_step(client)), (3, 3))
+        undo.close()
+
+
+if __name__ == "__main__":
+    unittest.main()